@@ -0,0 +1,401 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Throughput, latency and memory benchmarks for the batch methods of
+MyAssetManager, driven through a host-side OpenAssetIO Manager.
+
+Each scenario calls one method with a batch of a given size, made up
+of references to existing, missing and malformed entities in the
+requested ratios, with the requested proportion of duplicates.
+
+Usage, from the project root with the manager installed:
+
+    python benchmarks/bench_manager.py --output results.json
+
+To look the catalog up over HTTP, from the bundled stand-in catalog
+server, with 2ms of latency per request:
+
+    python benchmarks/bench_manager.py --remote --latency-ms 2
+
+To fail if any scenario has regressed against a previous run:
+
+    python benchmarks/bench_manager.py --baseline results.json
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from openassetio.access import EntityTraitsAccess, PolicyAccess, ResolveAccess
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.usage import EntityTrait
+
+from my_asset_manager import catalog, catalog_server
+from my_asset_manager.references import REFERENCE_PREFIX
+
+import benchmark_utils
+
+DEFAULT_BATCH_SIZES = (1, 100, 10_000, 1_000_000)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A single benchmarked call, and the make up of its batch.
+    """
+
+    method: str
+    batch_size: int
+    miss_ratio: float = 0.0
+    malformed_ratio: float = 0.0
+    duplicate_ratio: float = 0.0
+
+    @property
+    def name(self):
+        """
+        A unique, human readable name for the scenario.
+        """
+        return (
+            f"{self.method}[n={self.batch_size},miss={self.miss_ratio:g},"
+            f"malformed={self.malformed_ratio:g},duplicate={self.duplicate_ratio:g}]"
+        )
+
+
+def default_scenarios(batch_sizes):
+    """
+    The scenarios run when none are filtered out on the command line.
+    """
+    scenarios = []
+    for batch_size in batch_sizes:
+        scenarios += [
+            Scenario("resolve", batch_size),
+            Scenario("resolve", batch_size, miss_ratio=0.5),
+            Scenario("resolve", batch_size, malformed_ratio=0.1),
+            Scenario("resolve", batch_size, duplicate_ratio=0.9),
+            Scenario("entityTraits", batch_size),
+            Scenario("entityTraits", batch_size, miss_ratio=0.5, duplicate_ratio=0.9),
+            Scenario("managementPolicy", batch_size),
+        ]
+    return scenarios
+
+
+def write_catalog(path, size):
+    """
+    Write a SQLite catalog of `size` entities, named "entity<N>".
+    """
+    trait_set = frozenset({EntityTrait.kId, LocatableContentTrait.kId})
+    catalog.write_sqlite_catalog(
+        path,
+        (
+            (
+                f"{REFERENCE_PREFIX}entity{i}",
+                catalog.CatalogEntry(f"file:///assets/entity{i}.exr", trait_set),
+            )
+            for i in range(size)
+        ),
+    )
+
+
+def make_reference_strings(scenario, catalog_size, rng):
+    """
+    Build the batch of reference strings for a scenario.
+
+    The ratios of missing and malformed references apply to the
+    distinct references in the batch, duplicates are then drawn from
+    those at random.
+    """
+    unique_count = max(1, round(scenario.batch_size * (1 - scenario.duplicate_ratio)))
+    malformed_count = round(unique_count * scenario.malformed_ratio)
+    miss_count = round(unique_count * scenario.miss_ratio)
+    first_entity = rng.randrange(catalog_size)
+
+    unique_refs = []
+    for i in range(unique_count):
+        if i < malformed_count:
+            unique_refs.append(f"{REFERENCE_PREFIX}entity{i}?unsupportedQueryParam")
+        elif i < malformed_count + miss_count:
+            unique_refs.append(f"{REFERENCE_PREFIX}missing{i}")
+        else:
+            unique_refs.append(f"{REFERENCE_PREFIX}entity{(first_entity + i) % catalog_size}")
+
+    refs = unique_refs + rng.choices(unique_refs, k=scenario.batch_size - unique_count)
+    rng.shuffle(refs)
+    return refs
+
+
+def make_call(manager, scenario, references, success_cb, error_cb):
+    """
+    Return a no-argument function that makes the scenario's call.
+    """
+    context = manager.createContext()
+    if scenario.method == "resolve":
+        trait_set = {LocatableContentTrait.kId}
+        return lambda: manager.resolve(
+            references, trait_set, ResolveAccess.kRead, context, success_cb, error_cb
+        )
+    if scenario.method == "entityTraits":
+        return lambda: manager.entityTraits(
+            references, EntityTraitsAccess.kRead, context, success_cb, error_cb
+        )
+    if scenario.method == "managementPolicy":
+        trait_sets = [{LocatableContentTrait.kId}, {EntityTrait.kId}]
+        trait_sets = [trait_sets[i % 2] for i in range(scenario.batch_size)]
+        return lambda: manager.managementPolicy(trait_sets, PolicyAccess.kRead, context)
+    raise ValueError(f"Unknown method '{scenario.method}'")
+
+
+def run_scenario(
+    manager, scenario, catalog_size, min_time, min_repeats=3, max_repeats=1000, direct_manager=None
+):
+    """
+    Benchmark a scenario, repeating the call until both `min_repeats`
+    calls and `min_time` seconds have elapsed.
+
+    Returns a dict of the scenario, with its throughput (elements per
+    second at the median latency), p50/p99 latency of the whole call,
+    the median latency of its first result, the peak memory traced
+    during a call, and the success/error counts of a call. If a
+    `benchmark_utils.DirectManager` is supplied, the memory blocks per
+    element retained by a call straight to the manager's interface are
+    also counted.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    rng = random.Random(scenario.name)
+    references = [
+        manager.createEntityReference(ref_str)
+        for ref_str in make_reference_strings(scenario, catalog_size, rng)
+    ]
+
+    counts = {"successes": 0, "errors": 0}
+
+    def counting_success_cb(_idx, _value):
+        counts["successes"] += 1
+
+    def counting_error_cb(_idx, _error):
+        counts["errors"] += 1
+
+    # The first call warms up any caches, and validates the make up of
+    # the batch.
+    policies = make_call(manager, scenario, references, counting_success_cb, counting_error_cb)()
+    if policies is not None:
+        counts["successes"] = len(policies)
+
+    call = make_call(manager, scenario, references, lambda *_: None, lambda *_: None)
+    timings = []
+    start = time.perf_counter()
+    while len(timings) < min_repeats or (
+        time.perf_counter() - start < min_time and len(timings) < max_repeats
+    ):
+        call_start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - call_start)
+    timings.sort()
+    first_result = time_to_first_result(manager, scenario, references, min_repeats)
+
+    tracemalloc.start()
+    try:
+        call()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        if direct_manager is not None:
+            retained_blocks = count_retained_blocks(direct_manager, scenario, references)
+    finally:
+        tracemalloc.stop()
+
+    p50 = benchmark_utils.percentile(timings, 0.5)
+    result = {
+        "name": scenario.name,
+        **asdict(scenario),
+        **counts,
+        "repeats": len(timings),
+        "throughput": scenario.batch_size / p50 if p50 else float("inf"),
+        "p50_ms": p50 * 1000,
+        "p99_ms": benchmark_utils.percentile(timings, 0.99) * 1000,
+        "first_result_ms": first_result * 1000,
+        "peak_memory_bytes": peak_memory,
+    }
+    if direct_manager is not None:
+        result["retained_blocks_per_element"] = retained_blocks / scenario.batch_size
+    return result
+
+
+def time_to_first_result(manager, scenario, references, repeats):
+    """
+    The median time, over `repeats` calls, from making a call to its
+    first result being delivered to the host. Calls that return their
+    results, rather than delivering them through callbacks, take the
+    whole call.
+    """
+    first_results = []
+
+    def first_result_cb(_idx, _value):
+        if not first_results:
+            first_results.append(time.perf_counter())
+
+    call = make_call(manager, scenario, references, first_result_cb, first_result_cb)
+    timings = []
+    for _ in range(repeats):
+        first_results.clear()
+        call_start = time.perf_counter()
+        call()
+        timings.append((first_results[0] if first_results else time.perf_counter()) - call_start)
+    return benchmark_utils.percentile(sorted(timings), 0.5)
+
+
+def count_retained_blocks(direct_manager, scenario, references):
+    """
+    Count the memory blocks allocated by a call to the manager's
+    interface that are still held once it returns, with every result
+    kept, as a host would keep them. Results and errors shared between
+    elements cost no blocks. Must be called while tracemalloc is
+    tracing.
+    """
+    results = [None] * scenario.batch_size
+    call = make_call(
+        direct_manager, scenario, references, results.__setitem__, results.__setitem__
+    )
+    before = traced_blocks()
+    policies = call()
+    retained_blocks = traced_blocks() - before
+    del policies, results
+    return retained_blocks
+
+
+def traced_blocks():
+    """
+    The number of memory blocks currently traced by tracemalloc.
+    """
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results against a baseline, returning a description of
+    each metric that has regressed by more than `tolerance` (a
+    fraction). Scenarios and metrics missing from either are ignored.
+    """
+    baseline_by_name = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        base = baseline_by_name.get(result["name"])
+        if base is None:
+            continue
+        if result["throughput"] < base["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{result['name']}: throughput {result['throughput']:.0f}/s"
+                f" < baseline {base['throughput']:.0f}/s"
+            )
+        for metric in (
+            "p99_ms",
+            "first_result_ms",
+            "peak_memory_bytes",
+            "retained_blocks_per_element",
+        ):
+            if metric not in result or metric not in base:
+                continue
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['name']}: {metric} {result[metric]:.3f}"
+                    f" > baseline {base[metric]:.3f}"
+                )
+    return regressions
+
+
+def check_baseline(results, baseline_path, tolerance):
+    """
+    Report any regressions of `results` against the results stored at
+    `baseline_path`, if given, returning the process exit code.
+    """
+    if not baseline_path:
+        return 0
+    regressions = compare(results, benchmark_utils.read_results(baseline_path), tolerance)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def finish(results, args):
+    """
+    Write `results` to `args.output`, if given, and report any
+    regressions against `args.baseline`, returning the process exit
+    code.
+    """
+    if args.output:
+        benchmark_utils.write_results(args.output, results)
+    return check_baseline(results, args.baseline, args.tolerance)
+
+
+def main(argv=None):
+    """
+    Run the benchmarks, returning the process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--catalog-size", type=int, default=100_000)
+    parser.add_argument(
+        "--filter", default="", help="Only run scenarios whose name contains this string."
+    )
+    parser.add_argument("--min-time", type=float, default=1.0)
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Look the catalog up over HTTP, from the stand-in catalog server.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency the catalog server adds to each request, with --remote.",
+    )
+    benchmark_utils.add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in default_scenarios(args.batch_sizes) if args.filter in s.name]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path = str(Path(tmp_dir) / "catalog.db")
+        write_catalog(catalog_path, args.catalog_size)
+        server = None
+        if args.remote:
+            server = catalog_server.CatalogServer(
+                catalog.SqliteCatalog(catalog_path), latency=args.latency_ms / 1000
+            ).start()
+            settings = {"catalog_url": server.url, **dict(args.setting)}
+        else:
+            settings = {"catalog_path": catalog_path, **dict(args.setting)}
+        manager = benchmark_utils.create_manager(settings)
+        direct_manager = benchmark_utils.DirectManager(settings)
+
+        results = {
+            "environment": benchmark_utils.environment(),
+            "settings": {
+                **dict(args.setting),
+                "catalog_size": args.catalog_size,
+                "remote_latency_ms": args.latency_ms if args.remote else None,
+            },
+            "results": [],
+        }
+        for scenario in scenarios:
+            result = run_scenario(
+                manager, scenario, args.catalog_size, args.min_time, direct_manager=direct_manager
+            )
+            results["results"].append(result)
+            print(
+                f"{result['name']:<80} {result['throughput']:>14,.0f}/s"
+                f" p50 {result['p50_ms']:>10.3f}ms p99 {result['p99_ms']:>10.3f}ms"
+                f" first {result['first_result_ms']:>10.3f}ms"
+                f" peak {result['peak_memory_bytes'] / 1024:>10,.0f}KiB"
+                f" blocks/element {result.get('retained_blocks_per_element', 0):>6.2f}"
+            )
+        del manager, direct_manager
+        if server is not None:
+            server.stop()
+
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
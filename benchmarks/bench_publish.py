@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Publishing benchmark for MyAssetManager, measuring the throughput of
+registering new entities, and the number of syncs of the publishing
+journal to disk that it costs.
+
+The entities are split into batches of each of --batch-sizes, which
+are registered by --threads threads at once, each to a fresh journal.
+
+Usage, from the project root with the manager installed:
+
+    python benchmarks/bench_publish.py --entities 50000 --threads 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from openassetio.access import PublishingAccess
+from openassetio.trait import TraitsData
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager.references import REFERENCE_PREFIX
+
+import bench_manager
+import benchmark_utils
+
+
+def run_publish(manager, references, traits_datas, batch_size, thread_count):
+    """
+    Register every reference, in batches of `batch_size` shared between
+    `thread_count` threads. Returns the wall clock time taken, and the
+    number of syncs made.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    batches = [
+        (references[start : start + batch_size], traits_datas[start : start + batch_size])
+        for start in range(0, len(references), batch_size)
+    ]
+    context = manager.createContext()
+    barrier = threading.Barrier(thread_count + 1)
+    failures = []
+
+    def worker(thread_batches):
+        barrier.wait()
+        for refs, datas in thread_batches:
+            manager.register(
+                refs,
+                datas,
+                PublishingAccess.kWrite,
+                context,
+                lambda *_: None,
+                lambda _idx, error: failures.append(error),
+            )
+
+    threads = [
+        threading.Thread(target=worker, args=(batches[thread::thread_count],))
+        for thread in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+    syncs = 0
+    real_fsync = os.fsync
+
+    def counting_fsync(file_descriptor):
+        nonlocal syncs
+        syncs += 1
+        real_fsync(file_descriptor)
+
+    # Commits are made one at a time, so the count needn't be locked.
+    os.fsync = counting_fsync
+    try:
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        os.fsync = real_fsync
+    if failures:
+        raise RuntimeError(f"{len(failures)} entities failed to register: {failures[0]}")
+    return elapsed, syncs
+
+
+def main(argv=None):
+    """
+    Run the benchmark, returning the process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[10, 1000, 50_000])
+    parser.add_argument("--threads", type=int, default=8)
+    benchmark_utils.add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = {
+        "environment": benchmark_utils.environment(),
+        "settings": dict(args.setting),
+        "entities": args.entities,
+        "threads": args.threads,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for batch_size in args.batch_sizes:
+            manager = benchmark_utils.create_manager(
+                {
+                    **dict(args.setting),
+                    "publish_journal_path": str(Path(tmp_dir) / f"journal{batch_size}.jsonl"),
+                }
+            )
+            references = [
+                manager.createEntityReference(f"{REFERENCE_PREFIX}frame{i}")
+                for i in range(args.entities)
+            ]
+            traits_datas = []
+            for i in range(args.entities):
+                traits_data = TraitsData()
+                traits_data.setTraitProperty(
+                    LocatableContentTrait.kId, "location", f"file:///frames/{i}.exr"
+                )
+                traits_datas.append(traits_data)
+            elapsed, syncs = run_publish(
+                manager, references, traits_datas, batch_size, args.threads
+            )
+            result = {
+                "name": f"register[batch={batch_size},threads={args.threads}]",
+                "throughput": args.entities / elapsed,
+                "syncs": syncs,
+            }
+            results["results"].append(result)
+            print(f"{result['name']:<40} {result['throughput']:>14,.0f}/s {syncs:>8,} syncs")
+            del manager
+
+    return bench_manager.finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Cold-start benchmark for MyAssetManager.
+
+Each sample is taken in a fresh interpreter, and times the phases a
+host goes through before its first result separately:
+
+  - import_openassetio: Importing the OpenAssetIO host API.
+  - discovery: Scanning for plugins, which imports the plugin package.
+  - interface: Instantiating the plugin's ManagerInterface, which
+    imports its implementation.
+  - initialize: Initializing the manager with its settings.
+  - first_resolve: The first call to resolve.
+
+Usage, from the project root with the manager installed:
+
+    python benchmarks/bench_startup.py --output startup.json
+    python benchmarks/bench_startup.py --baseline startup.json
+    python benchmarks/bench_startup.py --budget-ms 250
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ("import_openassetio", "discovery", "interface", "initialize", "first_resolve")
+
+
+def measure_phases(settings):
+    """
+    Time each startup phase in the current interpreter, returning a
+    dict of phase name to milliseconds. Only meaningful in a fresh
+    interpreter.
+    """
+    # pylint: disable=import-outside-toplevel
+    timings = {}
+    start = time.perf_counter()
+
+    def lap(phase):
+        nonlocal start
+        now = time.perf_counter()
+        timings[phase] = (now - start) * 1000
+        start = now
+
+    from openassetio import hostApi, log
+    from openassetio.access import ResolveAccess
+    from openassetio.pluginSystem import PythonPluginSystemManagerImplementationFactory
+
+    lap("import_openassetio")
+
+    # Imports OpenAssetIO, so must come after it has been timed.
+    import benchmark_utils
+
+    logger = log.SeverityFilter(log.ConsoleLogger())
+    logger.setSeverity(log.LoggerInterface.Severity.kError)
+    factory_impl = PythonPluginSystemManagerImplementationFactory(logger)
+    if benchmark_utils.IDENTIFIER not in factory_impl.identifiers():
+        raise RuntimeError(f"Plugin '{benchmark_utils.IDENTIFIER}' not found")
+    lap("discovery")
+
+    manager = hostApi.ManagerFactory.createManagerForInterface(
+        benchmark_utils.IDENTIFIER,
+        benchmark_utils.BenchmarkHostInterface(),
+        factory_impl,
+        logger,
+    )
+    lap("interface")
+
+    manager.initialize(settings)
+    lap("initialize")
+
+    # The trait ID is spelled out, as importing the trait module here
+    # would hide the cost of the manager importing it.
+    manager.resolve(
+        manager.createEntityReference("my_asset_manager:///anAsset"),
+        {"openassetio-mediacreation:content.LocatableContent"},
+        ResolveAccess.kRead,
+        manager.createContext(),
+    )
+    lap("first_resolve")
+    return timings
+
+
+def sample(settings):
+    """
+    Measure the startup phases in a fresh interpreter.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", json.dumps(settings)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    # The last line is ours, anything before it was printed by the
+    # manager or OpenAssetIO.
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings["process"] = wall_ms
+    return timings
+
+
+def interpreter_startup_ms():
+    """
+    Time starting an interpreter that does nothing, for reference.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    """
+    Run the benchmark, returning the process exit code.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--child"]:
+        print(json.dumps(measure_phases(json.loads(argv[1]))))
+        return 0
+
+    # Not imported at module scope, as it imports OpenAssetIO, which
+    # the child process must time.
+    import benchmark_utils  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--samples", type=int, default=10)
+    benchmark_utils.add_common_arguments(parser)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Fail if the median time from discovery to first resolve exceeds this.",
+    )
+    args = parser.parse_args(argv)
+
+    settings = dict(args.setting)
+    samples = [sample(settings) for _ in range(args.samples)]
+    medians = {
+        phase: statistics.median(s[phase] for s in samples) for phase in (*PHASES, "process")
+    }
+    medians["plugin_total"] = sum(medians[phase] for phase in PHASES[1:])
+    medians["interpreter"] = statistics.median(interpreter_startup_ms() for _ in range(3))
+    for phase, value in medians.items():
+        print(f"{phase:<20} {value:>10.2f}ms")
+
+    results = {
+        "environment": benchmark_utils.environment(),
+        "settings": settings,
+        "samples": len(samples),
+        "median_ms": medians,
+    }
+    if args.output:
+        benchmark_utils.write_results(args.output, results)
+
+    failures = []
+    if args.baseline:
+        baseline = benchmark_utils.read_results(args.baseline)["median_ms"]
+        failures += [
+            f"{phase}: {medians[phase]:.2f}ms > baseline {baseline[phase]:.2f}ms"
+            for phase in (*PHASES, "plugin_total")
+            if phase in baseline and medians[phase] > baseline[phase] * (1 + args.tolerance)
+        ]
+    if args.budget_ms is not None and medians["plugin_total"] > args.budget_ms:
+        failures.append(
+            f"plugin_total: {medians['plugin_total']:.2f}ms > budget {args.budget_ms}ms"
+        )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
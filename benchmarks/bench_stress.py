@@ -0,0 +1,324 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Multi-threaded stress and soak harness for MyAssetManager, running
+mixed resolve, entityTraits and managementPolicy traffic from many
+threads at once, for a fixed duration, and checking every result.
+
+For each of --threads, that many threads each repeatedly call a method,
+chosen at random, with a batch of references to existing, missing and
+malformed entities. Every element must be delivered exactly once, with
+the correct result, or the run fails. After a warm up, the harness
+measures:
+
+ - throughput, in elements per second, and its scaling relative to the
+   first thread count,
+ - the share of each thread's wall clock time spent off the CPU, which
+   for a local catalog is dominated by waiting for the GIL,
+ - the growth in resident memory, and in live Python objects, from the
+   end of the warm up to the end of the run, which for a long soak
+   should level off once caches are full.
+
+Usage, from the project root with the manager installed, for a five
+minute soak of each thread count:
+
+    python benchmarks/bench_stress.py --threads 1 2 4 8 --duration 300
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from openassetio.access import EntityTraitsAccess, PolicyAccess, ResolveAccess
+from openassetio.errors import BatchElementError
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.usage import EntityTrait
+
+from my_asset_manager.references import REFERENCE_PREFIX
+
+import bench_manager
+import benchmark_utils
+
+# The relative frequency of calls to each method.
+METHOD_WEIGHTS = {"resolve": 5, "entityTraits": 3, "managementPolicy": 2}
+
+# The trait sets of the entities written by `bench_manager.write_catalog`.
+ENTITY_TRAIT_SET = {EntityTrait.kId, LocatableContentTrait.kId}
+
+# The trait sets that managementPolicy is called with, in turn.
+POLICY_TRAIT_SETS = ({LocatableContentTrait.kId}, {EntityTrait.kId})
+
+
+def expected_result(ref_string):
+    """
+    Return the result expected for a reference string of a batch made
+    by `bench_manager.make_reference_strings`: the entity's location,
+    or the code of the error expected for it.
+    """
+    if "?" in ref_string:
+        return BatchElementError.ErrorCode.kMalformedEntityReference
+    name = ref_string[len(REFERENCE_PREFIX) :]
+    if name.startswith("missing"):
+        return BatchElementError.ErrorCode.kEntityResolutionError
+    return f"file:///assets/{name}.exr"
+
+
+def make_batches(manager, batch_size, catalog_size, count, rng):
+    """
+    Build `count` batches of entity references, each a tuple of the
+    references and the result expected for each.
+    """
+    scenario = bench_manager.Scenario(
+        "stress", batch_size, miss_ratio=0.1, malformed_ratio=0.05, duplicate_ratio=0.2
+    )
+    batches = []
+    for _ in range(count):
+        ref_strings = bench_manager.make_reference_strings(scenario, catalog_size, rng)
+        batches.append(
+            (
+                [manager.createEntityReference(ref_string) for ref_string in ref_strings],
+                [expected_result(ref_string) for ref_string in ref_strings],
+            )
+        )
+    return batches
+
+
+def call_and_check(manager, method, batch, context, expected_policies):
+    """
+    Call `method` with a batch, returning the number of elements, and a
+    list of descriptions of any that weren't delivered exactly once,
+    with the expected result.
+    """
+    references, expected = batch
+    if method == "managementPolicy":
+        trait_sets = [POLICY_TRAIT_SETS[i % 2] for i in range(len(references))]
+        policies = manager.managementPolicy(trait_sets, PolicyAccess.kRead, context)
+        return len(policies), [
+            f"managementPolicy[{idx}]: unexpected policy {sorted(policy.traitSet())}"
+            for idx, policy in enumerate(policies)
+            if policy != expected_policies[idx % 2]
+        ]
+
+    deliveries = [0] * len(references)
+    mismatches = []
+
+    def success_cb(idx, value):
+        deliveries[idx] += 1
+        if method == "resolve":
+            value = value.getTraitProperty(LocatableContentTrait.kId, "location")
+            correct = value == expected[idx]
+        else:
+            correct = value == ENTITY_TRAIT_SET and isinstance(expected[idx], str)
+        if not correct:
+            mismatches.append(f"{method}[{idx}]: got {value!r}, expected {expected[idx]!r}")
+
+    def error_cb(idx, error):
+        deliveries[idx] += 1
+        if error.code != expected[idx]:
+            mismatches.append(
+                f"{method}[{idx}]: got error {error.code.name}, expected {expected[idx]!r}"
+            )
+
+    if method == "resolve":
+        manager.resolve(
+            references,
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            context,
+            success_cb,
+            error_cb,
+        )
+    else:
+        manager.entityTraits(references, EntityTraitsAccess.kRead, context, success_cb, error_cb)
+    mismatches.extend(
+        f"{method}[{idx}]: delivered {count} times"
+        for idx, count in enumerate(deliveries)
+        if count != 1
+    )
+    return len(references), mismatches
+
+
+class _ThreadStats:  # pylint: disable=too-few-public-methods
+    """
+    Counts kept by each thread, read by the main thread as it runs.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.elements = 0
+        self.mismatches = []
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+
+def run_stress(manager, batches, thread_count, duration, warmup, sample_interval):
+    """
+    Run `thread_count` threads of mixed traffic for `duration` seconds,
+    returning a dict of the measurements made after the first `warmup`
+    seconds, and the mismatched results found throughout.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    context = manager.createContext()
+    expected_policies = [
+        manager.managementPolicy([trait_set], PolicyAccess.kRead, context)[0]
+        for trait_set in POLICY_TRAIT_SETS
+    ]
+    methods = list(METHOD_WEIGHTS)
+    weights = list(METHOD_WEIGHTS.values())
+    stop = threading.Event()
+    barrier = threading.Barrier(thread_count + 1)
+    stats = [_ThreadStats() for _ in range(thread_count)]
+
+    def worker(thread_stats, rng):
+        barrier.wait()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        while not stop.is_set():
+            method = rng.choices(methods, weights)[0]
+            elements, mismatches = call_and_check(
+                manager, method, rng.choice(batches), context, expected_policies
+            )
+            thread_stats.calls += 1
+            thread_stats.elements += elements
+            thread_stats.mismatches.extend(mismatches)
+        thread_stats.cpu_time = time.thread_time() - cpu_start
+        thread_stats.wall_time = time.perf_counter() - wall_start
+
+    threads = [
+        threading.Thread(target=worker, args=(thread_stats, random.Random(thread)))
+        for thread, thread_stats in enumerate(stats)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(warmup)
+    warm_elements = sum(thread_stats.elements for thread_stats in stats)
+    warm_calls = sum(thread_stats.calls for thread_stats in stats)
+    warm_time = time.perf_counter()
+    samples = [memory_sample()]
+    while time.perf_counter() - start < duration:
+        time.sleep(max(0.0, min(sample_interval, duration - (time.perf_counter() - start))))
+        samples.append(memory_sample())
+    stop.set()
+    end_time = time.perf_counter()
+    end_elements = sum(thread_stats.elements for thread_stats in stats)
+    end_calls = sum(thread_stats.calls for thread_stats in stats)
+    for thread in threads:
+        thread.join()
+
+    measured = end_time - warm_time
+    rss_start, rss_end = samples[0][0], samples[-1][0]
+    return {
+        "throughput": (end_elements - warm_elements) / measured,
+        "calls_per_second": (end_calls - warm_calls) / measured,
+        "calls": sum(thread_stats.calls for thread_stats in stats),
+        "off_cpu_ratio": 1
+        - sum(thread_stats.cpu_time for thread_stats in stats)
+        / sum(thread_stats.wall_time for thread_stats in stats),
+        "rss_growth_bytes": None if rss_start is None else rss_end - rss_start,
+        "object_growth": samples[-1][1] - samples[0][1],
+        "mismatches": [mismatch for thread_stats in stats for mismatch in thread_stats.mismatches],
+    }
+
+
+def memory_sample():
+    """
+    Return the resident memory of the process in bytes, where the
+    platform reports it, else None, and the number of objects tracked
+    by the garbage collector.
+    """
+    rss = None
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return rss, len(gc.get_objects())
+
+
+def main(argv=None):
+    """
+    Run the harness, returning the process exit code.
+    """
+    # pylint: disable=too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per thread count.")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds before measuring.")
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--batches", type=int, default=64, help="Distinct batches to call with.")
+    parser.add_argument("--catalog-size", type=int, default=100_000)
+    parser.add_argument(
+        "--max-rss-growth-mb",
+        type=float,
+        help="Fail if resident memory grows by more than this after the warm up.",
+    )
+    benchmark_utils.add_common_arguments(parser)
+    args = parser.parse_args(argv)
+    if not 0 <= args.warmup < args.duration:
+        parser.error("--warmup must be at least 0, and less than --duration")
+
+    results = {
+        "environment": benchmark_utils.environment(),
+        "settings": {**dict(args.setting), "catalog_size": args.catalog_size},
+        "duration": args.duration,
+        "batch_size": args.batch_size,
+        "results": [],
+    }
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path = str(Path(tmp_dir) / "catalog.db")
+        bench_manager.write_catalog(catalog_path, args.catalog_size)
+        for thread_count in args.threads:
+            manager = benchmark_utils.create_manager(
+                {"catalog_path": catalog_path, **dict(args.setting)}
+            )
+            batches = make_batches(
+                manager, args.batch_size, args.catalog_size, args.batches, random.Random(0)
+            )
+            measurements = run_stress(
+                manager, batches, thread_count, args.duration, args.warmup, args.sample_interval
+            )
+            del manager
+            mismatches = measurements.pop("mismatches")
+            result = {
+                "name": f"mixed[threads={thread_count}]",
+                "threads": thread_count,
+                **measurements,
+                "mismatches": len(mismatches),
+            }
+            result["scaling"] = result["throughput"] / (
+                results["results"][0]["throughput"] if results["results"] else result["throughput"]
+            )
+            results["results"].append(result)
+            rss_growth = result["rss_growth_bytes"]
+            print(
+                f"{result['name']:<20} {result['throughput']:>14,.0f}/s"
+                f" x{result['scaling']:>5.2f} off-CPU {result['off_cpu_ratio']:>6.1%}"
+                f" RSS {'n/a' if rss_growth is None else f'{rss_growth / 1e6:+.1f}MB'}"
+                f" objects {result['object_growth']:+,}"
+            )
+            failures.extend(mismatches[:10])
+            if (
+                args.max_rss_growth_mb is not None
+                and rss_growth is not None
+                and rss_growth > args.max_rss_growth_mb * 1e6
+            ):
+                failures.append(f"{result['name']}: RSS grew by {rss_growth / 1e6:.1f}MB")
+
+    for failure in failures:
+        print(f"FAILURE: {failure}", file=sys.stderr)
+    exit_code = bench_manager.finish(results, args)
+    return 1 if failures else exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Multi-threaded benchmark for MyAssetManager, measuring the throughput
+of concurrent resolves of overlapping batches, with and without
+lookup coalescing.
+
+Each round, every thread resolves its own batch at the same moment.
+A proportion of each batch, given by --overlap, is shared by all
+threads, the remainder is unique to the thread.
+
+Usage, from the project root with the manager installed:
+
+    python benchmarks/bench_threads.py --threads 8 --overlap 0.9
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from openassetio.access import ResolveAccess
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager.references import REFERENCE_PREFIX
+
+import bench_manager
+import benchmark_utils
+
+
+def make_batches(thread_count, batch_size, overlap, catalog_size, rng):
+    """
+    Build each thread's batch of reference strings, sharing
+    `overlap` of each batch between all threads.
+    """
+    shared_count = round(batch_size * overlap)
+    entity_ids = rng.sample(range(catalog_size), shared_count + thread_count * batch_size)
+    shared = entity_ids[:shared_count]
+    batches = []
+    for thread in range(thread_count):
+        start = shared_count + thread * batch_size
+        unique = entity_ids[start : start + batch_size - shared_count]
+        batch = [f"{REFERENCE_PREFIX}entity{i}" for i in shared + unique]
+        rng.shuffle(batch)
+        batches.append(batch)
+    return batches
+
+
+def run_rounds(manager, batches, rounds):
+    """
+    Resolve each batch on its own thread, all at once, `rounds` times.
+    Returns the wall clock time of each round.
+    """
+    context = manager.createContext()
+    trait_set = {LocatableContentTrait.kId}
+    references = [[manager.createEntityReference(ref) for ref in batch] for batch in batches]
+    barrier = threading.Barrier(len(batches) + 1)
+    failures = []
+
+    def worker(refs):
+        for _ in range(rounds):
+            barrier.wait()
+            manager.resolve(
+                refs,
+                trait_set,
+                ResolveAccess.kRead,
+                context,
+                lambda *_: None,
+                lambda _idx, error: failures.append(error),
+            )
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker, args=(refs,)) for refs in references]
+    for thread in threads:
+        thread.start()
+    timings = []
+    for _ in range(rounds):
+        barrier.wait()
+        start = time.perf_counter()
+        barrier.wait()
+        timings.append(time.perf_counter() - start)
+    for thread in threads:
+        thread.join()
+    if failures:
+        raise RuntimeError(f"{len(failures)} references failed to resolve: {failures[0]}")
+    return timings
+
+
+def summarise(name, elements, timings):
+    """
+    Summarise the timings of rounds that each resolve `elements`
+    references as a result entry.
+    """
+    p50 = statistics.median(timings)
+    return {
+        "name": name,
+        "throughput": elements / p50,
+        "p50_ms": p50 * 1000,
+        "p99_ms": benchmark_utils.percentile(sorted(timings), 0.99) * 1000,
+    }
+
+
+def main(argv=None):
+    """
+    Run the benchmark, returning the process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--overlap", type=float, default=0.9)
+    parser.add_argument("--catalog-size", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    benchmark_utils.add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    batches = make_batches(
+        args.threads, args.batch_size, args.overlap, args.catalog_size, random.Random(0)
+    )
+    results = {
+        "environment": benchmark_utils.environment(),
+        "settings": {**dict(args.setting), "catalog_size": args.catalog_size},
+        "threads": args.threads,
+        "batch_size": args.batch_size,
+        "overlap": args.overlap,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path = str(Path(tmp_dir) / "catalog.db")
+        bench_manager.write_catalog(catalog_path, args.catalog_size)
+        for coalesce in (False, True):
+            settings = {
+                "catalog_path": catalog_path,
+                **dict(args.setting),
+                "coalesce_lookups": coalesce,
+            }
+            manager = benchmark_utils.create_manager(settings)
+            # Loads the catalog, and warms the OS page cache.
+            run_rounds(manager, batches, 1)
+            timings = run_rounds(manager, batches, args.rounds)
+            result = summarise(
+                f"resolve[threads={args.threads},coalesce={coalesce}]",
+                args.threads * args.batch_size,
+                timings,
+            )
+            results["results"].append(result)
+            print(
+                f"{result['name']:<40} {result['throughput']:>14,.0f}/s"
+                f" p50 {result['p50_ms']:>10.3f}ms p99 {result['p99_ms']:>10.3f}ms"
+            )
+            del manager
+
+    return bench_manager.finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Utilities shared by the MyAssetManager benchmarks.
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring
+
+import json
+import platform
+import sys
+
+from openassetio import Context, hostApi, log, managerApi
+from openassetio.pluginSystem import PythonPluginSystemManagerImplementationFactory
+
+IDENTIFIER = "myorg.manager.my_asset_manager"
+
+
+class BenchmarkHostInterface(hostApi.HostInterface):
+    """
+    Minimal host used to drive the manager in benchmarks.
+    """
+
+    def identifier(self):
+        return "org.openassetio.benchmark.my_asset_manager"
+
+    def displayName(self):
+        return "MyAssetManager Benchmarks"
+
+
+def create_manager(settings=None):
+    """
+    Create a host-side Manager for MyAssetManager, discovered through
+    the plugin system exactly as a host would, and initialize it with
+    the supplied settings.
+    """
+    logger = log.SeverityFilter(log.ConsoleLogger())
+    logger.setSeverity(log.LoggerInterface.Severity.kError)
+    manager = hostApi.ManagerFactory.createManagerForInterface(
+        IDENTIFIER,
+        BenchmarkHostInterface(),
+        PythonPluginSystemManagerImplementationFactory(logger),
+        logger,
+    )
+    manager.initialize(settings or {})
+    return manager
+
+
+class DirectManager:
+    """
+    Calls MyAssetManager's interface directly, with the signatures of
+    the host-side Manager, bypassing the conversion of arguments and
+    results between Python and C++. Used to measure the work done by
+    the manager itself.
+    """
+
+    def __init__(self, settings=None):
+        # pylint: disable=import-outside-toplevel
+        from my_asset_manager.MyAssetManagerInterface import MyAssetManagerInterface
+
+        logger = log.SeverityFilter(log.ConsoleLogger())
+        logger.setSeverity(log.LoggerInterface.Severity.kError)
+        self.__host_session = managerApi.HostSession(
+            managerApi.Host(BenchmarkHostInterface()), logger
+        )
+        self.__interface = MyAssetManagerInterface()
+        self.__interface.initialize(settings or {}, self.__host_session)
+
+    def createContext(self):
+        context = Context()
+        context.managerState = self.__interface.createState(self.__host_session)
+        return context
+
+    def resolve(
+        self, references, trait_set, access, context, success_cb, error_cb
+    ):  # pylint: disable=too-many-arguments
+        self.__interface.resolve(
+            references, trait_set, access, context, self.__host_session, success_cb, error_cb
+        )
+
+    def entityTraits(
+        self, references, access, context, success_cb, error_cb
+    ):  # pylint: disable=too-many-arguments
+        self.__interface.entityTraits(
+            references, access, context, self.__host_session, success_cb, error_cb
+        )
+
+    def managementPolicy(self, trait_sets, access, context):
+        return self.__interface.managementPolicy(trait_sets, access, context, self.__host_session)
+
+
+def parse_setting(text):
+    """
+    Parse a "key=value" command line argument into a manager setting,
+    converting the value to a bool, int or float where possible.
+    """
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise ValueError(f"Setting '{text}' should be of the form key=value")
+    if value.lower() in ("true", "false"):
+        return key, value.lower() == "true"
+    for type_ in (int, float):
+        try:
+            return key, type_(value)
+        except ValueError:
+            pass
+    return key, value
+
+
+def add_common_arguments(parser):
+    """
+    Add the command line arguments shared by all benchmarks to an
+    `argparse.ArgumentParser`.
+    """
+    parser.add_argument(
+        "--setting",
+        type=parse_setting,
+        action="append",
+        default=[],
+        help="A key=value manager setting, may be repeated.",
+    )
+    parser.add_argument("--output", help="Path to write JSON results to.")
+    parser.add_argument("--baseline", help="Path to JSON results to compare against.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Fractional regression allowed against the baseline.",
+    )
+
+
+def percentile(sorted_values, fraction):
+    """
+    Return the value at the supplied fraction through an ascending
+    list, using the nearest-rank method.
+    """
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def environment():
+    """
+    Describe the environment the benchmarks were run in, so that
+    results from different machines aren't mistakenly compared.
+    """
+    # pylint: disable=import-outside-toplevel
+    from importlib import metadata
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "openassetio": metadata.version("openassetio"),
+    }
+
+
+def write_results(path, results):
+    """
+    Write benchmark results to the supplied path as JSON.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def read_results(path):
+    """
+    Read benchmark results previously written by `write_results`.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
@@ -11,15 +11,29 @@ This is the entry-point for the logic of your asset manager.
 # the this class. See the notes under the "Initialization" section of:
 # https://openassetio.github.io/OpenAssetIO/classopenassetio_1_1v1_1_1manager_api_1_1_manager_interface.html#details (pylint: disable=line-too-long)
 # As such, any expensive module imports should be deferred.
+#
+# In particular, the openassetio_mediacreation trait modules and the
+# catalog backends are only imported by the first call that needs them,
+# so hosts that never resolve don't pay for them.
+# pylint: disable=import-outside-toplevel
+import os
+import threading
+
 from openassetio import constants
 from openassetio.trait import TraitsData
-from openassetio.errors import BatchElementError
-from openassetio.access import PolicyAccess, ResolveAccess, EntityTraitsAccess
+from openassetio.errors import BatchElementError, ConfigurationException
+from openassetio.access import (
+    EntityTraitsAccess,
+    PolicyAccess,
+    PublishingAccess,
+    RelationsAccess,
+    ResolveAccess,
+)
 from openassetio.managerApi import ManagerInterface
-from openassetio_mediacreation.traits.content import LocatableContentTrait
-from openassetio_mediacreation.traits.managementPolicy import ManagedTrait
-from openassetio_mediacreation.traits.application import ConfigTrait
-from openassetio_mediacreation.traits.usage import EntityTrait
+
+from . import budget, cache, references, state
+from .instrumentation import Instrumentation, instrumented
+from .settings import default_settings, validated_settings
 
 # OpenAssetIO is building out the implementation vertically, there are
 # known fails for missing abstract methods.
@@ -29,7 +43,7 @@ from openassetio_mediacreation.traits.usage import EntityTrait
 # pylint: disable=too-many-arguments, unused-argument
 
 
-class MyAssetManagerInterface(ManagerInterface):
+class MyAssetManagerInterface(ManagerInterface):  # pylint: disable=too-many-instance-attributes
     """
     Implement the OpenAssetIO ManagerInterface.
     https://openassetio.github.io/OpenAssetIO/classopenassetio_1_1v1_1_1manager_api_1_1_manager_interface.html
@@ -38,7 +52,36 @@ class MyAssetManagerInterface(ManagerInterface):
     # Entity references provided to this asset manager should be
     # prefixed with this string to be considered valid.
     # eg. "my_asset_manager:///my_entity_id"
-    __reference_prefix = "my_asset_manager:///"
+    __reference_prefix = references.REFERENCE_PREFIX
+
+    # The maximum number of distinct (trait set, access) management
+    # policies to memoize.
+    __kMaxMemoizedPolicies = 1024
+
+    # Errors whose message is the same for every entity are created
+    # once, and shared by every element they are reported for, rather
+    # than allocated per element. BatchElementError is immutable.
+    __kReadOnlyError = BatchElementError(
+        BatchElementError.ErrorCode.kEntityAccessError, "Entities are read-only"
+    )
+    __kMalformedReferenceError = BatchElementError(
+        BatchElementError.ErrorCode.kMalformedEntityReference, "Entity identifier is malformed"
+    )
+    __kCreateRelatedError = BatchElementError(
+        BatchElementError.ErrorCode.kEntityAccessError, "Related entities can't be created"
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.__settings = default_settings()
+        self.__catalog = None
+        self.__catalog_lock = threading.Lock()
+        self.__resolve_cache = None
+        self.__snapshot = None
+        self.__memoized_policies = {}
+        self.__bounded = budget.Bounded()
+        # Accessed by the `instrumented` decorator, None if disabled.
+        self._instrumentation = None
 
     def identifier(self):
         return "myorg.manager.my_asset_manager"
@@ -48,11 +91,226 @@ class MyAssetManagerInterface(ManagerInterface):
         # manager to be constructed quickly in situations where full
         # initialization would be unnecessary and undesirable. See :
         # https://openassetio.github.io/OpenAssetIO/classopenassetio_1_1v1_1_1host_api_1_1_manager.html#aa52c7436ff63ae96e33d7db8d6fd38df
-        print(managerSettings)
-        if managerSettings != {}:
-            raise KeyError(
-                "MyAssetManager should take no settings, but managerSettings is not empty"
+        #
+        # Settings not supplied keep their current value, see the
+        # settings module for those understood, and their validation.
+        settings = validated_settings(self.__settings, managerSettings)
+        self.__validate_locations(settings)
+
+        # Any previously cached results may be stale with respect to
+        # the new settings, so always start with an empty cache.
+        new_resolve_cache = None
+        if settings["resolve_cache_size"] > 0:
+            new_resolve_cache = cache.LruCache(
+                settings["resolve_cache_size"],
+                settings["resolve_cache_ttl"],
+                settings["resolve_cache_policy"],
+            )
+        new_instrumentation = None
+        if settings["instrumentation_enabled"]:
+            new_instrumentation = Instrumentation(
+                settings["instrumentation_interval"],
+                settings["instrumentation_path"],
+                hostSession.logger(),
+            )
+            new_instrumentation.add_source(
+                "reference_parse_cache",
+                lambda: references.parse_reference.cache_info()._asdict(),
+            )
+            if new_resolve_cache is not None:
+                new_instrumentation.add_source("resolve_cache", new_resolve_cache.stats)
+            new_instrumentation.add_source("catalog", self.__catalog_stats)
+
+        # A snapshot is small, and memory-mapped, so is cheap to open
+        # here, unlike the catalog.
+        new_snapshot = None
+        if settings["snapshot_path"]:
+            from . import catalog
+
+            new_snapshot = catalog.SqliteCatalog(settings["snapshot_path"])
+
+        with self.__catalog_lock:
+            if self.__catalog is not None:
+                self.__catalog.close()
+            self.__catalog = None
+            if self.__snapshot is not None:
+                self.__snapshot.close()
+            self.__snapshot = new_snapshot
+            self.__settings = settings
+            # Policies depend on whether publishing is enabled.
+            self.__memoized_policies = {}
+        self.__resolve_cache = new_resolve_cache
+        self._instrumentation = new_instrumentation
+
+    def settings(self, hostSession):
+        # The value of every setting in use, including defaults, so that
+        # hosts can inspect, or persist, the manager's configuration.
+        return dict(self.__settings)
+
+    @staticmethod
+    def __validate_locations(settings):
+        # The catalog itself is loaded on first use, see __loaded_catalog,
+        # but a bad path should still be reported here.
+        if settings["catalog_path"] and not os.path.isfile(settings["catalog_path"]):
+            raise ConfigurationException(f"Catalog '{settings['catalog_path']}' does not exist")
+        if settings["catalog_path"] and settings["catalog_url"]:
+            raise ConfigurationException("Only one of catalog_path and catalog_url may be set")
+        if settings["catalog_url"] and not settings["catalog_url"].startswith(
+            ("http://", "https://")
+        ):
+            raise ConfigurationException(
+                f"Catalog URL '{settings['catalog_url']}' is not an http(s) URL"
+            )
+        if settings["catalog_shards"]:
+            from . import sharding
+
+            if settings["catalog_path"] or settings["catalog_url"]:
+                raise ConfigurationException(
+                    "catalog_shards may not be set with catalog_path or catalog_url"
+                )
+            for location in sharding.parse_shards(settings["catalog_shards"]).values():
+                if not location.startswith(("http://", "https://")) and not os.path.isfile(
+                    location
+                ):
+                    raise ConfigurationException(f"Catalog shard '{location}' does not exist")
+        journal_dir = os.path.dirname(os.path.abspath(settings["publish_journal_path"]))
+        if settings["publish_journal_path"] and not os.path.isdir(journal_dir):
+            raise ConfigurationException(
+                f"Publishing journal directory '{journal_dir}' does not exist"
             )
+        if settings["snapshot_path"] and not os.path.isfile(settings["snapshot_path"]):
+            raise ConfigurationException(f"Snapshot '{settings['snapshot_path']}' does not exist")
+        if settings["snapshot_dir"] and not os.path.isdir(settings["snapshot_dir"]):
+            raise ConfigurationException(
+                f"Snapshot directory '{settings['snapshot_dir']}' does not exist"
+            )
+        shared_cache_dir = os.path.dirname(os.path.abspath(settings["shared_cache_path"]))
+        if settings["shared_cache_path"] and not os.path.isdir(shared_cache_dir):
+            raise ConfigurationException(
+                f"Shared cache directory '{shared_cache_dir}' does not exist"
+            )
+
+    def __loaded_catalog(self):
+        # Load the catalog once, on first use, so that it is shared by
+        # all subsequent API calls, rather than re-reading it per batch.
+        loaded_catalog = self.__catalog
+        if loaded_catalog is None:
+            with self.__catalog_lock:
+                if self.__catalog is None:
+                    from . import catalog
+
+                    settings = self.__settings
+                    backend = None
+                    if settings["catalog_shards"]:
+                        from . import sharding
+
+                        shards = sharding.parse_shards(settings["catalog_shards"])
+                        backend = sharding.ShardedCatalog(
+                            {
+                                name: self.__backend(settings, location)
+                                for name, location in shards.items()
+                            }
+                        )
+                    elif settings["catalog_url"] or (
+                        settings["catalog_path"] and settings["catalog_in_memory"]
+                    ):
+                        backend = self.__backend(
+                            settings, settings["catalog_url"] or settings["catalog_path"]
+                        )
+                    new_catalog = catalog.load_catalog(
+                        settings["catalog_path"],
+                        settings["lookup_workers"],
+                        settings["lookup_chunk_size"],
+                        backend,
+                    )
+                    if settings["shared_cache_path"]:
+                        from . import shared_cache
+
+                        new_catalog = shared_cache.SharedCacheCatalog(
+                            new_catalog, settings["shared_cache_path"]
+                        )
+                    if settings["coalesce_lookups"]:
+                        new_catalog = catalog.CoalescingCatalog(new_catalog)
+                    if (
+                        settings["missing_filter_false_positive_rate"]
+                        or settings["missing_cache_size"]
+                    ):
+                        new_catalog = catalog.FilteredCatalog(
+                            new_catalog,
+                            settings["missing_filter_false_positive_rate"],
+                            settings["missing_cache_size"],
+                            settings["missing_cache_ttl"],
+                        )
+                    # Outermost, so that published entities are never
+                    # filtered or cached as missing.
+                    if settings["publish_journal_path"]:
+                        from . import publishing
+
+                        new_catalog = publishing.PublishedCatalog(
+                            new_catalog,
+                            publishing.Journal(
+                                settings["publish_journal_path"],
+                                settings["publish_commit_delay"],
+                            ),
+                        )
+                    self.__catalog = new_catalog
+                loaded_catalog = self.__catalog
+        return loaded_catalog
+
+    @staticmethod
+    def __backend(settings, location):
+        # The catalog at a catalog service URL, or SQLite catalog path.
+        if location.startswith(("http://", "https://")):
+            from . import remote
+
+            return remote.RemoteCatalog(
+                location,
+                settings["remote_max_connections"],
+                settings["remote_max_request_bytes"],
+                settings["remote_retries"],
+                settings["remote_retry_backoff"],
+                settings["remote_timeout"],
+            )
+        if settings["catalog_in_memory"]:
+            from . import compact
+
+            return compact.CompactCatalog.from_sqlite(location)
+        from . import catalog
+
+        return catalog.SqliteCatalog(location)
+
+    def __lookup_catalog(self, snapshot):
+        # The catalog to look entities up in, preferring those in the
+        # supplied snapshot, if any.
+        loaded_catalog = self.__loaded_catalog()
+        if snapshot is None:
+            return loaded_catalog
+        from . import catalog
+
+        return catalog.OverlayCatalog(snapshot, loaded_catalog)
+
+    def __context_snapshot(self, context):
+        # A context restored from a persistence token is served from its
+        # own snapshot, in preference to any configured for the manager.
+        context_state = context.managerState
+        if context_state is not None and context_state.snapshot is not None:
+            return context_state.snapshot
+        return self.__snapshot
+
+    def __catalog_stats(self):
+        loaded_catalog = self.__catalog
+        return loaded_catalog.stats() if loaded_catalog is not None else {}
+
+    def flushCaches(self, hostSession):
+        # Hosts call this when they need to guarantee that subsequent
+        # queries reflect the current state of the backend, so any
+        # cached data must be discarded.
+        if self.__resolve_cache is not None:
+            self.__resolve_cache.clear()
+        # There's no need to load the catalog just to refresh it.
+        loaded_catalog = self.__catalog
+        if loaded_catalog is not None:
+            loaded_catalog.refresh()
 
     def displayName(self):
         return "My Asset Manager"
@@ -66,8 +324,12 @@ class MyAssetManagerInterface(ManagerInterface):
             ManagerInterface.Capability.kManagementPolicyQueries,
             ManagerInterface.Capability.kResolution,
             ManagerInterface.Capability.kEntityTraitIntrospection,
+            ManagerInterface.Capability.kStatefulContexts,
+            ManagerInterface.Capability.kRelationshipQueries,
         ):
             return True
+        if capability == ManagerInterface.Capability.kPublishing:
+            return bool(self.__settings["publish_journal_path"])
 
         return False
 
@@ -80,6 +342,29 @@ class MyAssetManagerInterface(ManagerInterface):
         # to acquire the GIL and enter Python.
         return {constants.kInfoKey_EntityReferencesMatchPrefix: self.__reference_prefix}
 
+    def createState(self, hostSession):
+        # Each context created by the host gets a new state, which
+        # records the entities served to it, if enabled, so that the
+        # exact same data can be served to a context restored from its
+        # persistence token, see persistenceTokenForState.
+        recording = state.Recording() if self.__settings["snapshot_dir"] else None
+        return state.ManagerState(recording)
+
+    def createChildState(self, parentState, hostSession):
+        return parentState.child()
+
+    def persistenceTokenForState(self, state_, hostSession):
+        # Writes a snapshot of the entities served to the state, so that
+        # a process restoring it, for example a farm job, resolves the
+        # same data without returning to the backend.
+        return state.persistence_token(
+            state_, self.__settings["snapshot_dir"], self.__loaded_catalog()
+        )
+
+    def stateFromPersistenceToken(self, token, hostSession):
+        return state.state_from_persistence_token(token)
+
+    @instrumented
     def managementPolicy(self, traitSets, policyAccess, context, hostSession):
         # The management policy defines which traits the manager is
         # capable of imbuing queried traitSets with. In this case, the
@@ -87,24 +372,56 @@ class MyAssetManagerInterface(ManagerInterface):
         # Note `LocatableContentTrait` is a trait
         # from the openassetio-mediacreation library, see :
         # https://github.com/OpenAssetIO/OpenAssetIO-MediaCreation
+        #
+        # Hosts tend to query the same few trait sets over and over, so
+        # the policy for each distinct trait set is only built once,
+        # and then copied for each element. Copies are returned so that
+        # a host can't modify the memoized policy.
+        memoized_policies = self.__memoized_policies
         policies = []
         for traitSet in traitSets:
-            policy = TraitsData()
-            # The host asks specifically if sets of traits are
-            # supported. In this case, if any of the input traitSets are
-            # for read, and contain LocatableContent, as we can supply
-            # data for that trait, we imbue a managed policy response,
-            # as well as the traits we are able to supply data for. It's
-            # important to get this right, for more info, see:
-            # https://openassetio.github.io/OpenAssetIO/classopenassetio_1_1v1_1_1manager_api_1_1_manager_interface.html#ab86b5623a355d04086bae76875ebee17
-            if policyAccess == PolicyAccess.kRead and LocatableContentTrait.kId in traitSet:
-                ManagedTrait.imbueTo(policy)
-                LocatableContentTrait.imbueTo(policy)
-
-            policies.append(policy)
+            key = (frozenset(traitSet), policyAccess)
+            policy = memoized_policies.get(key)
+            if policy is None:
+                policy = self.__policy(
+                    traitSet,
+                    policyAccess,
+                    self.hasCapability(ManagerInterface.Capability.kPublishing),
+                )
+                # Bound the memo, so that a host querying many distinct
+                # trait sets can't grow it indefinitely.
+                if len(memoized_policies) < self.__kMaxMemoizedPolicies:
+                    memoized_policies[key] = policy
+            policies.append(TraitsData(policy))
 
         return policies
 
+    @staticmethod
+    def __policy(traitSet, policyAccess, publishing):
+        from openassetio_mediacreation.traits.managementPolicy import ManagedTrait
+
+        from . import projection
+
+        policy = TraitsData()
+        # The host asks specifically if sets of traits are
+        # supported. In this case, if any of the input traitSets are
+        # for read, or for write if publishing is enabled, and contain
+        # LocatableContent, or any other trait we can supply data for,
+        # see projection.py, we imbue a managed policy response, as well
+        # as the traits we are able to supply, or store, data for. It's
+        # important to get this right, for more info, see:
+        # https://openassetio.github.io/OpenAssetIO/classopenassetio_1_1v1_1_1manager_api_1_1_manager_interface.html#ab86b5623a355d04086bae76875ebee17
+        trait_ids = projection.resolvable_traits(traitSet)
+        managed_access = policyAccess == PolicyAccess.kRead or (
+            publishing and policyAccess == PolicyAccess.kWrite
+        )
+        if managed_access and trait_ids:
+            ManagedTrait.imbueTo(policy)
+            for trait_id in trait_ids:
+                policy.addTrait(trait_id)
+        return policy
+
+    @instrumented
     def isEntityReferenceString(self, someString, hostSession):
         # This function is used by the host to determine if an entity
         # reference is recognized as one handled by this manager.
@@ -120,6 +437,7 @@ class MyAssetManagerInterface(ManagerInterface):
         # info()
         return someString.startswith(self.__reference_prefix)
 
+    @instrumented
     def entityTraits(
         self,
         entityReferences,
@@ -129,81 +447,95 @@ class MyAssetManagerInterface(ManagerInterface):
         successCallback,
         errorCallback,
     ):
+        # pylint: disable=too-many-branches, too-many-locals
         # This function is used by the host to retrieve the trait sets
         # for specific entities. The behaviour of this function differs
         # per access mode. `kRead` is a request for an exhaustive trait
         # set for an entity according to this manager, whilst `kWrite`
         # is a request for the minimal trait set required to publish to
-        # that entity. As this manager example is read-only, we will
-        # simply reject any `kWrite` requests.
-
-        # For the purposes of this template, we use this fake map of
-        # traits to serve as our "database", arbitrarily assuming that
-        # asset 2 is a config entity of some sort.
-        # Replace this with querying your backend systems.
-        managed_assets_map = {
-            "my_asset_manager:///anAsset": {EntityTrait.kId, LocatableContentTrait.kId},
-            "my_asset_manager:///anAsset2": {
-                EntityTrait.kId,
-                LocatableContentTrait.kId,
-                ConfigTrait.kId,
-            },
-            "my_asset_manager:///anAsset3": {EntityTrait.kId, LocatableContentTrait.kId},
-        }
-
-        # If your manager doesn't support write, like this one, reject
-        # a write access mode via calling the error callback.
+        # that entity. Entities can only be published to if publishing
+        # is enabled, and they aren't already in the read-only catalog.
         if entityTraitsAccess != EntityTraitsAccess.kRead:
-            result = BatchElementError(
-                BatchElementError.ErrorCode.kEntityAccessError, "Entities are read-only"
-            )
-            for idx in range(len(entityReferences)):
-                errorCallback(idx, result)
+            self.__publishing_traits(entityReferences, successCallback, errorCallback)
             return
 
+        # Batches often contain the same reference many times over, so
+        # each distinct reference is only processed once, and its
+        # result then delivered to every index it appears at.
+        ref_strings = [ref.toString() for ref in entityReferences]
+        results = dict.fromkeys(ref_strings)
+
+        # It may be that one of the references you are provided is
+        # recognized for this manager, but has some syntax error or
+        # is otherwise incorrect for your specific resolve context.
+        # For example, an asset reference that specifies a version
+        # for an un-versioned entity could be considered malformed.
+        #
+        # N.B. It's not required to perform an explicit check here
+        # if this is naturally serviced during your backend lookup,
+        # the key is not to error the whole batch, but use the error
+        # callback for relevant references.
+        refs_to_query = []
+        for ref_string in results:
+            if is_malformed_ref(ref_string):
+                results[ref_string] = self.__kMalformedReferenceError
+            else:
+                refs_to_query.append(ref_string)
+
+        # Query the catalog for the whole batch up front, rather than
+        # making a call-out per reference.
+        # Replace the catalog with querying your backend systems, for
+        # example by adapting remote.RemoteCatalog to its protocol.
+        #
+        # If the call has a budget, the lookup is abandoned when it
+        # expires, and the references queried fail, see budget.py.
+        lookup_catalog = self.__lookup_catalog(self.__context_snapshot(context))
+        budget_seconds = budget.call_budget(context, self.__settings["lookup_budget"])
+        if budget_seconds and refs_to_query:
+            managed_assets_map = self.__bounded.call(
+                budget_seconds, lookup_catalog.traits, refs_to_query
+            )
+            if managed_assets_map is None:
+                exceeded_error = budget.budget_exceeded_error(budget_seconds)
+                results.update(dict.fromkeys(refs_to_query, exceeded_error))
+                refs_to_query = []
+                managed_assets_map = {}
+        else:
+            managed_assets_map = lookup_catalog.traits(refs_to_query)
+        recording = context.managerState and context.managerState.recording
+        if recording is not None:
+            recording.traits.update(managed_assets_map)
+
+        for ref_string in refs_to_query:
+            # If our manager has the asset in question, we can let the
+            # host know which traits make up this specific entity.
+            # Otherwise, we don't know about the entity, so we use an
+            # entity resolution error for this specific entity.
+            success_result = managed_assets_map.get(ref_string)
+            if success_result is not None:
+                results[ref_string] = success_result
+            else:
+                results[ref_string] = BatchElementError(
+                    BatchElementError.ErrorCode.kEntityResolutionError,
+                    f"Entity '{ref_string}' not found",
+                )
+
         # Iterate over all the entity references, calling the correct
         # error/success callbacks into the host.
         # You should handle success/failure on an entity-by-entity
         # basis, do not abort your entire operation because any single
         # entity is malformed/can't be processed for any reason, use
         # the error callback and continue.
-        for idx, ref in enumerate(entityReferences):
-            # It may be that one of the references you are provided is
-            # recognized for this manager, but has some syntax error or
-            # is otherwise incorrect for your specific resolve context.
-            # For example, an asset reference that specifies a version
-            # for an un-versioned entity could be considered malformed.
-            #
-            # N.B. It's not required to perform an explicit check here
-            # if this is naturally serviced during your backend lookup,
-            # the key is not to error the whole batch, but use the error
-            # callback for relevant references.
-            identifier_is_malformed = is_malformed_ref(ref)
-            if identifier_is_malformed:
-                error_result = BatchElementError(
-                    BatchElementError.ErrorCode.kMalformedEntityReference,
-                    "Entity identifier is malformed",
-                )
-                errorCallback(idx, error_result)
+        for idx, ref_string in enumerate(ref_strings):
+            result = results[ref_string]
+            if isinstance(result, BatchElementError):
+                errorCallback(idx, result)
             else:
-                # If our manager has the asset in question, we can
-                # let the host know which traits make up this specific
-                # entity.
-                if ref.toString() in managed_assets_map:
-                    # Return the traits imbued the the entity in
-                    # question
-                    success_result = managed_assets_map[ref.toString()]
-                    successCallback(idx, success_result)
-                else:
-                    # Otherwise, we don't know about the entity, so call
-                    # the error callback with an entity resolution error
-                    # for this specific entity.
-                    error_result = BatchElementError(
-                        BatchElementError.ErrorCode.kEntityResolutionError,
-                        f"Entity '{ref.toString()}' not found",
-                    )
-                    errorCallback(idx, error_result)
+                # Catalog trait sets are shared and immutable, but the
+                # callback requires a set.
+                successCallback(idx, set(result))
 
+    @instrumented
     def resolve(
         self,
         entityReferences,
@@ -214,38 +546,197 @@ class MyAssetManagerInterface(ManagerInterface):
         successCallback,
         errorCallback,
     ):
-        # pylint: disable=too-many-locals
+        # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+        from . import projection
+
         # If your resolver doesn't support write, like this one, reject
         # a write access mode via calling the error callback.
         if resolveAccess != ResolveAccess.kRead:
-            result = BatchElementError(
-                BatchElementError.ErrorCode.kEntityAccessError, "Entities are read-only"
-            )
             for idx in range(len(entityReferences)):
-                errorCallback(idx, result)
+                errorCallback(idx, self.__kReadOnlyError)
             return
 
-        # If the requested traitSet (which is constant for the batch),
-        # doesn't contain LocatableContent trait ID, there is no need to
-        # do any further processing, early out.
-        if LocatableContentTrait.kId not in traitSet:
+        # The requested traitSet is constant for the batch, so the
+        # catalog fields needed to resolve it are worked out once, and
+        # only those fields fetched. If it contains no traits that we
+        # can resolve, there is no need to do any further processing,
+        # early out.
+        trait_set = frozenset(traitSet)
+        batch_projection = projection.project(trait_set)
+        # Each index still gets its own empty result, as hosts are free
+        # to modify the data they are given.
+        if not batch_projection.fields:
             for idx in range(len(entityReferences)):
                 successCallback(idx, TraitsData())
             return
 
+        # Batches often contain the same reference many times over, so
+        # each distinct reference is only processed once, and its
+        # result then delivered to every index it appears at.
+        ref_strings = [ref.toString() for ref in entityReferences]
+        results = dict.fromkeys(ref_strings)
+
+        # Any references resolved by a previous call are served from
+        # the resolve cache, if enabled.
+        # Results differ between contexts restored from different
+        # snapshots, so they are cached separately.
+        snapshot = self.__context_snapshot(context)
+        recording = context.managerState and context.managerState.recording
+        recorded_fields = []
+        if recording is not None:
+            recorded_fields = [recording.values(field) for field in batch_projection.fields]
+        resolve_cache = self.__resolve_cache
+        if resolve_cache is not None:
+            cache_key_suffix = (trait_set, resolveAccess, snapshot)
+            for ref_string in results:
+                result = resolve_cache.get((ref_string, *cache_key_suffix))
+                results[ref_string] = result
+                if result is not None:
+                    for recorded in recorded_fields:
+                        recorded.setdefault(ref_string, None)
+
+        # It may be that one of the references you are provided is
+        # recognized for this manager, but has some syntax error or
+        # is otherwise incorrect for your specific resolve context.
+        # For example, an asset reference that specifies a version
+        # for an un-versioned entity could be considered malformed.
+        #
+        # N.B. It's not required to perform an explicit check here
+        # if this is naturally serviced during your backend lookup,
+        # the key is not to error the whole batch, but use the error
+        # callback for relevant references.
+        #
         # You should attempt to retrieve your data at this point,
         # especially if your backend supports batch operations. It's
         # likely that there will be many entityReferences, and avoiding
-        # costly call-outs inside the loop below will be advantageous.
+        # costly call-outs per reference will be advantageous.
+        #
+        # For the purposes of this template, the catalog loaded in
+        # `initialize` serves as our "database".
+        # Replace this with querying your backend systems, see
+        # remote.RemoteCatalog for a client that makes one bulk request
+        # per chunk of the batch.
         #
-        # For the purposes of this template, we use this fake map
-        # of LocatableContent paths to serve as our "database".
-        # Replace this with querying your backend systems.
-        managed_filesystem_locations = {
-            "my_asset_manager:///anAsset": "file:///some/filesystem/path",
-            "my_asset_manager:///anAsset2": "file:///some/filesystem/path2",
-            "my_asset_manager:///anAsset3": "file:///some/filesystem/path3",
-        }
+        # Each index is given its own copy of a result that is shared,
+        # between duplicate references or with the resolve cache, as
+        # hosts are free to modify the data they are given. Otherwise,
+        # results are handed over as they are.
+        #
+        # If the call has a budget, pages are looked up until it
+        # expires, and the references not yet looked up then fail,
+        # see budget.py.
+        lookup_catalog = self.__lookup_catalog(snapshot)
+        budget_seconds = budget.call_budget(context, self.__settings["lookup_budget"])
+        copy_results = resolve_cache is not None or len(results) < len(ref_strings)
+        page_size = self.__settings["resolve_page_size"]
+        positions = None
+        if page_size and len(results) > page_size:
+            # Large batches are looked up a page at a time, and the
+            # results of each page delivered as soon as it arrives, so
+            # that hosts receive their first results sooner, and only a
+            # page of results is held at once. Results that are already
+            # known are delivered up front, and references are checked
+            # as each page is drawn, so as not to delay the first page.
+            positions = {}
+            for idx, ref_string in enumerate(ref_strings):
+                result = results[ref_string]
+                if result is None:
+                    positions.setdefault(ref_string, []).append(idx)
+                else:
+                    _deliver(idx, result, copy_results, successCallback, errorCallback)
+            refs_to_query = (
+                ref_string
+                for ref_string, result in results.items()
+                if result is None and not is_malformed_ref(ref_string)
+            )
+            pages = lookup_catalog.field_pages(
+                refs_to_query, batch_projection.lookup_fields, page_size
+            )
+        else:
+            refs_to_query = []
+            for ref_string, result in results.items():
+                if result is not None:
+                    continue
+                if is_malformed_ref(ref_string):
+                    results[ref_string] = self.__kMalformedReferenceError
+                else:
+                    refs_to_query.append(ref_string)
+            # Looked up lazily, so that the lookup can be bounded.
+            pages = (
+                (
+                    refs_to_query,
+                    lookup_catalog.fields(refs_to_query, batch_projection.lookup_fields),
+                )
+                for _ in (None,)
+            )
+        if budget_seconds:
+            pages = self.__bounded.items(pages, budget_seconds)
+
+        def settle(ref_string, result):
+            if resolve_cache is not None and isinstance(result, TraitsData):
+                resolve_cache.put((ref_string, *cache_key_suffix), result)
+            if positions is None:
+                results[ref_string] = result
+            else:
+                for idx in positions.pop(ref_string):
+                    _deliver(idx, result, copy_results, successCallback, errorCallback)
+
+        for page, field_values in pages:
+            for recorded, field in zip(recorded_fields, batch_projection.fields):
+                recorded.update(field_values[field])
+            trait_values = [
+                (trait_field.imbue, field_values[trait_field.field])
+                for trait_field in batch_projection.trait_fields
+            ]
+            trait_sets = field_values["traits"]
+
+            for ref_string in page:
+                # If our manager has the asset in question, we can let
+                # the host know about the requested traits, such as the
+                # LocatableContent, for this specific entity.
+                result = None
+                for imbue, values in trait_values:
+                    value = values.get(ref_string)
+                    if value is not None:
+                        if result is None:
+                            result = TraitsData()
+                        imbue(result, value)
+                # An entity may exist, but have no data for any of
+                # the requested traits, e.g. it has no location, in
+                # which case it resolves to no traits. Otherwise, we
+                # haven't got the entity available for resolution, so
+                # we use an entity resolution error for this specific
+                # entity.
+                if result is None:
+                    trait_set = trait_sets.get(ref_string)
+                    if trait_set is None:
+                        result = BatchElementError(
+                            BatchElementError.ErrorCode.kEntityResolutionError,
+                            f"Entity '{ref_string}' not found",
+                        )
+                    else:
+                        if recording is not None:
+                            recording.traits[ref_string] = trait_set
+                        result = TraitsData()
+                settle(ref_string, result)
+
+        # References not drawn into a page are malformed, or, if the
+        # budget expired, weren't looked up in time.
+        exceeded_error = budget.budget_exceeded_error(budget_seconds) if budget_seconds else None
+        if positions is not None:
+            for ref_string, indices in positions.items():
+                error = (
+                    self.__kMalformedReferenceError
+                    if is_malformed_ref(ref_string)
+                    else exceeded_error
+                )
+                for idx in indices:
+                    errorCallback(idx, error)
+            return
+        if budget_seconds:
+            for ref_string, result in results.items():
+                if result is None:
+                    results[ref_string] = exceeded_error
 
         # Iterate over all the entity references, calling the correct
         # error/success callbacks into the host.
@@ -253,42 +744,241 @@ class MyAssetManagerInterface(ManagerInterface):
         # basis, do not abort your entire resolve because any single
         # entity is malformed/can't be processed for any reason, use
         # the error callback and continue.
-        for idx, ref in enumerate(entityReferences):
-            # It may be that one of the references you are provided is
-            # recognized for this manager, but has some syntax error or
-            # is otherwise incorrect for your specific resolve context.
-            # For example, an asset reference that specifies a version
-            # for an un-versioned entity could be considered malformed.
-            #
-            # N.B. It's not required to perform an explicit check here
-            # if this is naturally serviced during your backend lookup,
-            # the key is not to error the whole batch, but use the error
-            # callback for relevant references.
-            identifier_is_malformed = is_malformed_ref(ref)
-            if identifier_is_malformed:
-                error_result = BatchElementError(
-                    BatchElementError.ErrorCode.kMalformedEntityReference,
-                    "Entity identifier is malformed",
+        for idx, ref_string in enumerate(ref_strings):
+            _deliver(idx, results[ref_string], copy_results, successCallback, errorCallback)
+
+    @instrumented
+    def preflight(
+        self,
+        entityReferences,
+        traitsHints,
+        publishingAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        # Hosts preflight a publish before generating the data for it,
+        # to check that each entity can be published to, and find the
+        # reference to publish to. For this manager, that is the same
+        # reference, and nothing needs reserving in the meantime.
+        if publishingAccess != PublishingAccess.kWrite:
+            for idx in range(len(entityReferences)):
+                errorCallback(idx, self.__kCreateRelatedError)
+            return
+
+        ref_strings = [ref.toString() for ref in entityReferences]
+        publish_errors = self.__publish_errors(ref_strings)
+        for idx, ref_string in enumerate(ref_strings):
+            error = publish_errors.get(ref_string)
+            if error is not None:
+                errorCallback(idx, error)
+            else:
+                successCallback(idx, entityReferences[idx])
+
+    @instrumented
+    def register(
+        self,
+        entityReferences,
+        entityTraitsDatas,
+        publishingAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        # pylint: disable=too-many-locals
+        # Publishes the data for each entity, from when it is served to
+        # subsequent resolves. The whole batch is written to the
+        # journal, and synced to disk, at once, before any success is
+        # reported, rather than an entity at a time.
+        if publishingAccess != PublishingAccess.kWrite:
+            for idx in range(len(entityReferences)):
+                errorCallback(idx, self.__kCreateRelatedError)
+            return
+        from . import publishing
+
+        ref_strings = [ref.toString() for ref in entityReferences]
+        publish_errors = self.__publish_errors(ref_strings)
+        # An entity registered more than once in a batch is published
+        # with the data of its last index.
+        entries = {}
+        trait_sets = {}
+        for ref_string, traits_data in zip(ref_strings, entityTraitsDatas):
+            if ref_string not in publish_errors:
+                entries[ref_string] = publishing.catalog_entry(traits_data, trait_sets)
+        if entries:
+            try:
+                self.__loaded_catalog().register(entries.items())
+            except OSError as exc:
+                # None of the batch was published, so each entity that
+                # would have been is reported as an error.
+                write_error = BatchElementError(
+                    BatchElementError.ErrorCode.kEntityAccessError, str(exc)
                 )
-                errorCallback(idx, error_result)
+                publish_errors.update(dict.fromkeys(entries, write_error))
             else:
-                # If our manager has the asset in question, we can
-                # let the host know about the LocatableContent for
-                # this specific entity.
-                if ref.toString() in managed_filesystem_locations:
-                    success_result = TraitsData()
-                    trait = LocatableContentTrait(success_result)
-                    trait.setLocation(managed_filesystem_locations[ref.toString()])
-                    successCallback(idx, success_result)
-                else:
-                    # Otherwise, we haven't got the entity available for
-                    # resolution, to call the error callback with an
-                    # entity resolution error for this specific entity.
-                    error_result = BatchElementError(
-                        BatchElementError.ErrorCode.kEntityResolutionError,
-                        f"Entity '{ref.toString()}' not found",
-                    )
-                    errorCallback(idx, error_result)
+                # Results cached for re-published entities are now stale.
+                if self.__resolve_cache is not None:
+                    self.__resolve_cache.clear()
+
+        for idx, ref_string in enumerate(ref_strings):
+            error = publish_errors.get(ref_string)
+            if error is not None:
+                errorCallback(idx, error)
+            else:
+                successCallback(idx, entityReferences[idx])
+
+    @instrumented
+    def getWithRelationship(
+        self,
+        entityReferences,
+        relationshipTraitsData,
+        resultTraitSet,
+        pageSize,
+        relationsAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        # Hosts query relationships such as all versions of an entity,
+        # or all dependencies of a shot. Each entity is given a pager
+        # that reads its related entities from the catalog's adjacency
+        # index as the host pages through them, rather than looking
+        # them all up here, so that even vast relationships are
+        # streamed in bounded memory.
+        self.__related_pagers(
+            [ref.toString() for ref in entityReferences],
+            [relationshipTraitsData] * len(entityReferences),
+            resultTraitSet,
+            pageSize,
+            relationsAccess,
+            context,
+            successCallback,
+            errorCallback,
+        )
+
+    def getWithRelationships(
+        self,
+        entityReference,
+        relationshipTraitsDatas,
+        resultTraitSet,
+        pageSize,
+        relationsAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        # As getWithRelationship, but for many relationships of a
+        # single entity, indexed by relationship.
+        self.__related_pagers(
+            [entityReference.toString()] * len(relationshipTraitsDatas),
+            relationshipTraitsDatas,
+            resultTraitSet,
+            pageSize,
+            relationsAccess,
+            context,
+            successCallback,
+            errorCallback,
+        )
+
+    def __related_pagers(  # pylint: disable=too-many-locals
+        self,
+        ref_strings,
+        relationship_traits_datas,
+        result_trait_set,
+        page_size,
+        relations_access,
+        context,
+        successCallback,
+        errorCallback,
+    ):
+        # Deliver a pager for the related entities of each reference
+        # and relationship, or an error for malformed references, and
+        # references to entities that aren't in the catalog, which are
+        # found with a single batch lookup.
+        if relations_access != RelationsAccess.kRead:
+            for idx in range(len(ref_strings)):
+                errorCallback(idx, self.__kReadOnlyError)
+            return
+        from . import relationships
+
+        lookup_catalog = self.__lookup_catalog(self.__context_snapshot(context))
+        errors = {}
+        candidates = []
+        for ref_string in dict.fromkeys(ref_strings):
+            if is_malformed_ref(ref_string):
+                errors[ref_string] = self.__kMalformedReferenceError
+            else:
+                candidates.append(ref_string)
+        known = lookup_catalog.traits(candidates)
+        for ref_string in candidates:
+            if ref_string not in known:
+                errors[ref_string] = BatchElementError(
+                    BatchElementError.ErrorCode.kEntityResolutionError,
+                    f"Entity '{ref_string}' not found",
+                )
+
+        for idx, (ref_string, traits_data) in enumerate(
+            zip(ref_strings, relationship_traits_datas)
+        ):
+            error = errors.get(ref_string)
+            if error is not None:
+                errorCallback(idx, error)
+                continue
+            relationship = relationships.relationship_key(traits_data)
+            successCallback(
+                idx,
+                relationships.RelatedPager(
+                    lookup_catalog, ref_string, relationship, page_size, result_trait_set
+                ),
+            )
+
+    def __publishing_traits(self, entityReferences, successCallback, errorCallback):
+        # The traits needed to publish to each entity, which are those
+        # that the manager stores: the location of a published entity,
+        # along with whatever other traits it has.
+        from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+        ref_strings = [ref.toString() for ref in entityReferences]
+        publish_errors = self.__publish_errors(ref_strings)
+        for idx, ref_string in enumerate(ref_strings):
+            error = publish_errors.get(ref_string)
+            if error is not None:
+                errorCallback(idx, error)
+            else:
+                successCallback(idx, {LocatableContentTrait.kId})
+
+    def __publish_errors(self, ref_strings):
+        # The error to report for each distinct reference that can't be
+        # published to: all of them, if publishing isn't enabled,
+        # otherwise those that are malformed, or in the read-only
+        # catalog, which are found with a single batch lookup.
+        if not self.__settings["publish_journal_path"]:
+            return dict.fromkeys(ref_strings, self.__kReadOnlyError)
+        errors = {}
+        candidates = []
+        for ref_string in dict.fromkeys(ref_strings):
+            if is_malformed_ref(ref_string):
+                errors[ref_string] = self.__kMalformedReferenceError
+            else:
+                candidates.append(ref_string)
+        for ref_string in self.__loaded_catalog().read_only(candidates):
+            errors[ref_string] = self.__kReadOnlyError
+        return errors
+
+
+def _deliver(idx, result, copy_result, successCallback, errorCallback):
+    # Deliver a resolve result, or error, to the host, copying a result
+    # that is shared.
+    if isinstance(result, BatchElementError):
+        errorCallback(idx, result)
+    elif copy_result:
+        successCallback(idx, TraitsData(result))
+    else:
+        successCallback(idx, result)
 
 
 # Internal function used in Resolve and EntityTraits, replace with logic
@@ -297,5 +987,9 @@ class MyAssetManagerInterface(ManagerInterface):
 # parameters, then invent a completely arbitrary query parameter that we
 # don't support. (We then test our implementation using the api
 # compliance suite, see fixtures.py)
-def is_malformed_ref(entityReference):
-    return "?unsupportedQueryParam" in entityReference.toString()
+#
+# The parsed form of each reference is cached, so repeated checks of the
+# same reference cost a single dictionary lookup.
+def is_malformed_ref(entity_reference_string):
+    parsed_reference = references.parse_reference(entity_reference_string)
+    return parsed_reference is None or parsed_reference.has_param("unsupportedQueryParam")
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Time budgets for the catalog lookups of a batch, so that a slow
+backend can't stall a host, for example an interactive host calling
+from its UI thread, for longer than it is prepared to wait.
+
+The budget of a call is the `lookup_budget` setting, unless the host
+supplies one for the call, as the "seconds" property of the budget
+trait of its `Context` locale, e.g.:
+
+    context.locale.setTraitProperty(BUDGET_TRAIT_ID, "seconds", 0.05)
+
+When the budget expires, the results of the lookups already made are
+delivered as usual, and only the entities still being looked up fail,
+with an error distinguishable from them not being found, so that
+hosts can retry just those later.
+"""
+import threading
+import time
+
+from openassetio.errors import BatchElementError
+
+# The ID of the trait of a `Context` locale that overrides the budget
+# of the calls made with it.
+BUDGET_TRAIT_ID = "myorg.manager.my_asset_manager.budget"
+
+
+def call_budget(context, default):
+    """
+    Return the budget, in seconds, of a call made with `context`, or
+    `default` if the host hasn't supplied one. 0 means unbounded.
+    """
+    locale = context.locale
+    if locale is None or not locale.hasTrait(BUDGET_TRAIT_ID):
+        return default
+    seconds = locale.getTraitProperty(BUDGET_TRAIT_ID, "seconds")
+    return default if seconds is None else max(float(seconds), 0.0)
+
+
+def budget_exceeded_error(budget):
+    """
+    Return the error for an entity that wasn't looked up within the
+    budget of its call, which is shared by every such entity.
+    """
+    return BatchElementError(
+        BatchElementError.ErrorCode.kUnknown,
+        f"Lookup not completed within the budget of {budget:g}s",
+    )
+
+
+class Bounded:
+    """
+    Draws the items of iterables, such as the pages of results of
+    `catalog.Catalog.field_pages`, on worker threads, so that callers
+    can stop waiting for them at a deadline.
+
+    Workers are only started once first needed. A lookup that is still
+    running at the deadline is abandoned to finish on its worker. If
+    every worker is busy with such stragglers, further lookups wait for
+    one to be free, and so fail as soon as their own budget expires,
+    rather than adding to a backlog. By default, there are as many
+    workers as `concurrent.futures.ThreadPoolExecutor` would start.
+    """
+
+    def __init__(self, max_workers=None):
+        self.__max_workers = max_workers
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def items(self, iterable, budget):
+        """
+        Yield the items of `iterable` until it is exhausted, or until
+        `budget` seconds from now, whichever is sooner. The next item
+        is drawn whilst the caller processes the current one.
+        """
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        deadline = time.monotonic() + budget
+        iterator = iter(iterable)
+        exhausted = object()
+        executor = self.__started()
+        future = executor.submit(next, iterator, exhausted)
+        while True:
+            try:
+                item = future.result(max(deadline - time.monotonic(), 0.0))
+            except FutureTimeoutError:
+                # Only if it hasn't yet started, so no worker is spent.
+                future.cancel()
+                return
+            if item is exhausted:
+                return
+            future = executor.submit(next, iterator, exhausted)
+            yield item
+
+    def call(self, budget, function, *args):
+        """
+        Return the result of calling `function` with `args`, or None if
+        it doesn't return within `budget` seconds.
+        """
+        return next(self.items((function(*args) for _ in (None,)), budget), None)
+
+    def __started(self):
+        executor = self.__executor
+        if executor is None:
+            with self.__lock:
+                if self.__executor is None:
+                    # Deferred, as it is comparatively slow to import
+                    # and only needed when a budget has been set.
+                    # pylint: disable=import-outside-toplevel
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self.__executor = ThreadPoolExecutor(
+                        self.__max_workers, thread_name_prefix="MyAssetManagerBudget"
+                    )
+                executor = self.__executor
+        return executor
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Bounded, thread-safe caches and filters used to avoid backend lookups.
+"""
+import functools
+import math
+import random
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+
+class LruCache:  # pylint: disable=too-many-instance-attributes
+    """
+    A bounded mapping with optional time-based expiry.
+
+    Once `max_size` entries are held, inserting a new entry evicts an
+    existing one according to the eviction `policy`:
+      - "lru": the least recently used entry (reads count as use).
+      - "fifo": the oldest inserted entry, regardless of reads.
+
+    If `ttl` is non-zero, entries older than `ttl` seconds are treated
+    as missing. Hit, miss and eviction counts are kept for reporting.
+    """
+
+    kPolicies = ("lru", "fifo")
+
+    def __init__(self, max_size, ttl=0.0, policy="lru", clock=time.monotonic):
+        if max_size < 1:
+            raise ValueError(f"Cache size must be positive, got {max_size}")
+        if ttl < 0:
+            raise ValueError(f"Cache TTL must not be negative, got {ttl}")
+        if policy not in self.kPolicies:
+            raise ValueError(f"Unknown cache eviction policy '{policy}'")
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__touch_on_read = policy == "lru"
+        self.__clock = clock
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for `key`, or `default` if there is no
+        such entry, or it has expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                value, expiry = entry
+                if expiry is None or expiry > self.__clock():
+                    if self.__touch_on_read:
+                        self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return value
+                del self.__entries[key]
+            self.__misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Cache `value` for `key`, evicting an existing entry if the cache
+        is full.
+        """
+        expiry = self.__clock() + self.__ttl if self.__ttl else None
+        with self.__lock:
+            entries = self.__entries
+            if key in entries:
+                entries.move_to_end(key)
+            elif len(entries) >= self.__max_size:
+                entries.popitem(last=False)
+                self.__evictions += 1
+            entries[key] = (value, expiry)
+
+    def clear(self):
+        """
+        Remove all entries. Counters are preserved.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self):
+        """
+        Return a dict of the cache's size and hit/miss/eviction counts.
+        """
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+            }
+
+
+class BloomFilter:
+    """
+    A compact, probabilistic set of strings, sized for `capacity`
+    entries at the given `false_positive_rate`.
+
+    Membership tests never report a string that was added as missing,
+    but may report a string that was never added as present, at
+    roughly the configured rate once `capacity` strings are held.
+
+    The filter is blocked: all of a string's bits are set in a single
+    64-bit word, so a test costs one word read rather than one read
+    per hash function. This needs slightly more memory than a classic
+    filter for the same false positive rate, which is accounted for
+    when sizing, and means that rates much below 0.1% aren't reached,
+    as each string's bits are one of a fixed table of masks. Bits are
+    chosen using the built-in `hash`, so a filter is only meaningful
+    within the process that built it.
+    """
+
+    # Bits per word, and the number of distinct bit masks that a
+    # string's hash selects between.
+    _kWordBits = 64
+    _kMaskCount = 1 << 12
+
+    def __init__(self, capacity, false_positive_rate):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(
+                f"False positive rate must be between 0 and 1, got {false_positive_rate}"
+            )
+        word_count, hash_count = self.__dimensions(max(capacity, 1), false_positive_rate)
+        self.__words = array("Q", bytes(8 * word_count))
+        self.__masks = _bloom_masks(self._kWordBits, hash_count, self._kMaskCount)
+        self.__hash_count = hash_count
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def __contains__(self, key):
+        key_hash = hash(key)
+        mask = self.__masks[(key_hash >> 52) & 0xFFF]
+        return self.__words[key_hash % len(self.__words)] & mask == mask
+
+    def add(self, key):
+        """
+        Add a string to the filter.
+        """
+        key_hash = hash(key)
+        self.__words[key_hash % len(self.__words)] |= self.__masks[(key_hash >> 52) & 0xFFF]
+        self.__count += 1
+
+    def select(self, keys):
+        """
+        Return a list of the supplied strings that may be in the
+        filter, in their original order.
+        """
+        # Inlined rather than using __contains__, as this is called
+        # with whole batches, and the per-key call overhead dominates.
+        # Each key is hashed once.
+        words = self.__words
+        masks = self.__masks
+        word_count = len(words)
+        selected = []
+        for key in keys:
+            key_hash = hash(key)
+            mask = masks[(key_hash >> 52) & 0xFFF]
+            if words[key_hash % word_count] & mask == mask:
+                selected.append(key)
+        return selected
+
+    def stats(self):
+        """
+        Return a dict of the filter's size in bytes, number of bits set
+        per string, and number of strings added.
+        """
+        return {
+            "bytes": self.__words.itemsize * len(self.__words),
+            "hashes": self.__hash_count,
+            "entries": self.__count,
+        }
+
+    @classmethod
+    def __dimensions(cls, capacity, false_positive_rate):
+        # Start from the size of a classic filter, and grow it until the
+        # expected rate of the blocked layout meets the target. The
+        # model ignores strings that share a mask, and so is optimistic
+        # at low rates, hence the margin.
+        bits = -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        word_count = max(1, math.ceil(bits / cls._kWordBits))
+        while True:
+            keys_per_word = capacity / word_count
+            hash_count = min(16, max(1, round(cls._kWordBits / keys_per_word * math.log(2))))
+            rate = _blocked_false_positive_rate(cls._kWordBits, keys_per_word, hash_count)
+            if rate <= false_positive_rate / 2:
+                return word_count, hash_count
+            word_count = math.ceil(word_count * 1.05)
+
+
+def _blocked_false_positive_rate(word_bits, keys_per_word, hash_count):
+    """
+    The expected false positive rate of a blocked Bloom filter, given
+    the mean number of keys per word. Keys per word are Poisson
+    distributed, see Putze et al., "Cache-, Hash- and Space-Efficient
+    Bloom Filters".
+    """
+    rate = 0.0
+    probability = math.exp(-keys_per_word)
+    keys = 0
+    while keys < 2 * keys_per_word or probability > 1e-12:
+        bit_set = 1 - (1 - 1 / word_bits) ** (hash_count * keys)
+        rate += probability * bit_set**hash_count
+        keys += 1
+        probability *= keys_per_word / keys
+    return rate
+
+
+@functools.lru_cache(maxsize=None)
+def _bloom_masks(word_bits, hash_count, mask_count):
+    """
+    A table of `mask_count` words, each with `hash_count` distinct bits
+    set, shared by all filters with the same dimensions.
+    """
+    rng = random.Random(hash_count)
+    bits = range(word_bits)
+    return array(
+        "Q", (sum(1 << bit for bit in rng.sample(bits, hash_count)) for _ in range(mask_count))
+    )
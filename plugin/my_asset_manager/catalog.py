@@ -0,0 +1,850 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Catalog backends that hold the entity data served by MyAssetManager.
+
+A catalog is loaded once, on first use, and then shared by all
+subsequent API calls. Lookups are made for a whole batch of entity
+reference strings at a time, so that backends that support bulk
+queries can service a batch with as few round trips as possible.
+"""
+import collections
+import itertools
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import NamedTuple, Optional
+
+from openassetio.errors import ConfigurationException
+
+from . import cache
+from .sqlite_connections import (
+    SQLITE_MAX_QUERY_PARAMS,
+    SQLITE_MMAP_SIZE,
+    SqliteConnections,
+    chunks,
+)
+
+
+class CatalogEntry(NamedTuple):
+    """
+    The data held by a catalog for a single entity.
+    """
+
+    location: Optional[str]
+    traits: frozenset
+
+
+# The `Catalog` method that looks up each field of a `CatalogEntry`.
+_FIELD_LOOKUPS = {"location": "locations", "traits": "traits"}
+
+# An entry of which no fields have been looked up.
+_NO_ENTRY = CatalogEntry(None, None)
+
+
+class Catalog:
+    """
+    Read-only view of the entities known to the manager.
+
+    Implementations must be safe to call concurrently from multiple
+    threads, as hosts are free to call into the manager from any
+    thread.
+    """
+
+    def locations(self, references):
+        """
+        Look up the LocatableContent location of each of the supplied
+        entity reference strings.
+
+        Returns a dict of reference string to location. References
+        that are not in the catalog, or that have no location, are
+        omitted from the result, so to tell the two apart, callers
+        look up the references omitted with `traits`.
+        """
+        raise NotImplementedError
+
+    def traits(self, references):
+        """
+        Look up the trait set of each of the supplied entity reference
+        strings.
+
+        Returns a dict of reference string to a frozenset of trait IDs.
+        References that are not in the catalog are omitted from the
+        result.
+        """
+        raise NotImplementedError
+
+    def fields(self, references, fields):
+        """
+        Look up only the named fields of each of the supplied entity
+        reference strings, where fields are those of `CatalogEntry`, so
+        that backends needn't fetch data that won't be used.
+
+        Returns a dict of field name to a dict of reference string to
+        value, omitting references as `locations` and `traits` do.
+        """
+        references = list(references)
+        return {field: getattr(self, _FIELD_LOOKUPS[field])(references) for field in fields}
+
+    def field_pages(self, references, fields, page_size):
+        """
+        Look up the named fields of the supplied entity reference
+        strings a page of at most `page_size` references at a time.
+
+        Returns a generator of a tuple of each page of references, and
+        its fields as returned by `fields`, so that callers can process
+        each page as it arrives, rather than waiting for, and holding,
+        the whole batch. `references` may be any iterable, and is only
+        consumed as each page is drawn from it.
+        """
+        for page in _pages(references, page_size):
+            yield page, self.fields(page, fields)
+
+    def related(self, reference, relationship, start, count):  # pylint: disable=unused-argument
+        """
+        Look up at most `count` of the entity reference strings related
+        to `reference` by the relationship with the supplied key, see
+        `relationships.relationship_key`, from the `start`th onwards.
+
+        Returns a list of reference strings, in the order held by the
+        catalog, which is empty if there are no more, or the catalog
+        doesn't hold relationships.
+        """
+        return []
+
+    def references(self):
+        """
+        Return an iterable of every entity reference string in the
+        catalog.
+        """
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def refresh(self):
+        """
+        Discard any state derived from the backing data, so that
+        subsequent lookups reflect its current contents.
+        """
+
+    def stats(self):
+        """
+        Return a dict of statistics for reporting, if the catalog keeps
+        any.
+        """
+        return {}
+
+    def close(self):
+        """
+        Release any resources held by the catalog.
+        """
+
+
+def _pages(references, page_size):
+    """
+    Return an iterator of lists of at most `page_size` of the supplied
+    references, drawn from them lazily.
+    """
+    references = iter(references)
+    return iter(lambda: list(itertools.islice(references, page_size)), [])
+
+
+def forwarded_pages(catalog, references, fields, page_size, split, merge=None):
+    """
+    Look up pages of references, as for `Catalog.field_pages`, for a
+    catalog that wraps `catalog`.
+
+    `split` is called with each page, and returns the references that
+    the wrapping catalog serves itself, their fields, and the rest of
+    the page. Those served are yielded as pages of their own, and the
+    rest looked up by `catalog.field_pages`, so that any prefetching it
+    does, see `ConcurrentCatalog`, is kept. The fields of each page it
+    yields are passed through `merge`, if given, with the page.
+    """
+    # pylint: disable=too-many-arguments
+    served_pages = collections.deque()
+
+    def forwarded():
+        for page in _pages(references, page_size):
+            served, found, rest = split(page)
+            if served:
+                served_pages.append((served, found))
+            yield from rest
+
+    for page, found in catalog.field_pages(forwarded(), fields, page_size):
+        while served_pages:
+            yield served_pages.popleft()
+        yield page, found if merge is None else merge(page, found)
+    while served_pages:
+        yield served_pages.popleft()
+
+
+def _by_reference(found):
+    """
+    Return a dict of reference to `CatalogEntry` of the fields returned
+    by `Catalog.fields`, with None for the fields not looked up.
+    """
+    entries = {}
+    for field, values in found.items():
+        for reference, value in values.items():
+            entry = entries.get(reference, _NO_ENTRY)
+            entries[reference] = entry._replace(**{field: value})
+    return entries
+
+
+def by_field(entries, fields):
+    """
+    Return the named fields of a dict of reference to `CatalogEntry`,
+    as returned by `Catalog.fields`.
+    """
+    found = {field: {} for field in fields}
+    for field, values in found.items():
+        for reference, entry in entries.items():
+            value = getattr(entry, field)
+            if value is not None:
+                values[reference] = value
+    return found
+
+
+class MemoryCatalog(Catalog):
+    """
+    A catalog held entirely in memory, as a dict keyed on entity
+    reference string, and any relationships between them, as an
+    iterable of triples, see `relationships.AdjacencyIndex`.
+    """
+
+    def __init__(self, entries, relationships=()):
+        # pylint: disable=import-outside-toplevel
+        from .relationships import AdjacencyIndex
+
+        self.__entries = dict(entries)
+        self.__relationships = AdjacencyIndex(relationships)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def references(self):
+        return iter(self.__entries)
+
+    def locations(self, references):
+        entries = self.__entries
+        found = {}
+        for reference in references:
+            entry = entries.get(reference)
+            if entry is not None and entry.location is not None:
+                found[reference] = entry.location
+        return found
+
+    def traits(self, references):
+        entries = self.__entries
+        found = {}
+        for reference in references:
+            entry = entries.get(reference)
+            if entry is not None:
+                found[reference] = entry.traits
+        return found
+
+    def related(self, reference, relationship, start, count):
+        return self.__relationships.related(reference, relationship, start, count)
+
+
+class SqliteCatalog(Catalog):
+    """
+    A catalog backed by a read-only SQLite database, see
+    `write_sqlite_catalog` for the expected schema, and
+    `relationships.write_sqlite_relationships` for that of the
+    optional relationships between entities.
+
+    The database file is memory-mapped, and each entity is found via
+    the primary key index, so lookups stay fast for catalogs of many
+    millions of entities without loading them into memory. Each
+    thread is given its own connection, so that lookups from
+    concurrent host threads don't serialize on a single connection.
+    """
+
+    def __init__(self, path):
+        if not os.path.isfile(path):
+            raise ConfigurationException(f"Catalog '{path}' does not exist")
+        self.__connections = SqliteConnections(
+            f"{pathlib.Path(path).absolute().as_uri()}?mode=ro", [f"mmap_size={SQLITE_MMAP_SIZE}"]
+        )
+        # Trait sets are stored as text, many entities share the same
+        # set, so we only ever build one frozenset per distinct set.
+        self.__trait_sets = {}
+        self.__has_relationships = None
+
+    def __len__(self):
+        return self.__connections.get().execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def references(self):
+        for (reference,) in self.__connections.get().execute("SELECT ref FROM entities"):
+            yield reference
+
+    def entries(self):
+        """
+        Yield a (reference, CatalogEntry) pair for every entity.
+        """
+        trait_sets = self.__trait_sets
+        for reference, location, traits in self.__connections.get().execute(
+            "SELECT ref, location, traits FROM entities"
+        ):
+            yield reference, CatalogEntry(location, parse_trait_set(trait_sets, traits))
+
+    def relationships(self):
+        """
+        Yield a (reference, relationship key, related reference) triple
+        for every relationship, in order.
+        """
+        if self.__relationships_exist():
+            yield from self.__connections.get().execute(
+                "SELECT ref, relationship, related FROM relationships"
+                " ORDER BY ref, relationship, position"
+            )
+
+    def locations(self, references):
+        return dict(
+            self.__query("location", references, "AND location IS NOT NULL"),
+        )
+
+    def traits(self, references):
+        trait_sets = self.__trait_sets
+        return {
+            reference: parse_trait_set(trait_sets, traits)
+            for reference, traits in self.__query("traits", references)
+        }
+
+    def fields(self, references, fields):
+        # Fetch only the requested columns, all in a single query.
+        found = {field: {} for field in fields}
+        for field in found:
+            if field not in _FIELD_LOOKUPS:
+                raise KeyError(field)
+        if not found:
+            return found
+        trait_sets = self.__trait_sets
+        for reference, *values in self.__query(", ".join(found), references):
+            for field, value in zip(found, values):
+                if field == "traits":
+                    found[field][reference] = parse_trait_set(trait_sets, value)
+                elif value is not None:
+                    found[field][reference] = value
+        return found
+
+    def related(self, reference, relationship, start, count):
+        if not self.__relationships_exist():
+            return []
+        return [
+            related
+            for (related,) in self.__connections.get().execute(
+                "SELECT related FROM relationships WHERE ref = ? AND relationship = ?"
+                " AND position >= ? ORDER BY position LIMIT ?",
+                (reference, relationship, start, count),
+            )
+        ]
+
+    def close(self):
+        self.__connections.close()
+
+    def __relationships_exist(self):
+        # Relationships are optional, so older catalogs lack the table.
+        if self.__has_relationships is None:
+            self.__has_relationships = (
+                self.__connections.get()
+                .execute("SELECT 1 FROM sqlite_master WHERE name = 'relationships'")
+                .fetchone()
+                is not None
+            )
+        return self.__has_relationships
+
+    def __query(self, column, references, condition=""):
+        connection = self.__connections.get()
+        for chunk in chunks(references, SQLITE_MAX_QUERY_PARAMS):
+            placeholders = ",".join("?" * len(chunk))
+            yield from connection.execute(
+                f"SELECT ref, {column} FROM entities WHERE ref IN ({placeholders}) {condition}",
+                chunk,
+            )
+
+
+class ConcurrentCatalog(Catalog):
+    """
+    Wraps another catalog, splitting large batches into chunks that are
+    looked up concurrently on a pool of worker threads.
+
+    This only helps where the wrapped catalog releases the GIL during a
+    lookup, as `SqliteCatalog` does whilst SQLite executes a query, or
+    a client of a remote service would whilst waiting on the network.
+    Batches no larger than a single chunk are looked up directly on the
+    calling thread. Results are merged before they are returned, so
+    callers never observe the worker threads.
+    """
+
+    def __init__(self, catalog, max_workers, chunk_size):
+        if max_workers < 1:
+            raise ValueError(f"Worker count must be positive, got {max_workers}")
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        # Deferred, as it is comparatively slow to import and only
+        # needed when concurrency has been configured.
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.__catalog = catalog
+        self.__max_workers = max_workers
+        self.__chunk_size = chunk_size
+        self.__executor = ThreadPoolExecutor(max_workers, thread_name_prefix="MyAssetManager")
+
+    def __len__(self):
+        return len(self.__catalog)
+
+    def locations(self, references):
+        return self.__lookup(self.__catalog.locations, references)
+
+    def traits(self, references):
+        return self.__lookup(self.__catalog.traits, references)
+
+    def fields(self, references, fields):
+        # Each chunk's fields are looked up together, so that the
+        # wrapped catalog can fetch them at once.
+        found = {field: {} for field in fields}
+        for chunk_found in self.__map(
+            lambda chunk: self.__catalog.fields(chunk, fields), references
+        ):
+            for field, values in chunk_found.items():
+                found[field].update(values)
+        return found
+
+    def related(self, reference, relationship, start, count):
+        return self.__catalog.related(reference, relationship, start, count)
+
+    def field_pages(self, references, fields, page_size):
+        # Pages are looked up on the workers ahead of the caller, at
+        # most one per worker, so that the next pages arrive whilst the
+        # caller processes the current one, without every page being
+        # held, or drawn from `references`, at once.
+        pages = _pages(references, page_size)
+        pending = collections.deque(
+            (page, self.__executor.submit(self.__catalog.fields, page, fields))
+            for page in itertools.islice(pages, self.__max_workers)
+        )
+        while pending:
+            page, future = pending.popleft()
+            for next_page in itertools.islice(pages, 1):
+                pending.append(
+                    (next_page, self.__executor.submit(self.__catalog.fields, next_page, fields))
+                )
+            yield page, future.result()
+
+    def references(self):
+        return self.__catalog.references()
+
+    def refresh(self):
+        self.__catalog.refresh()
+
+    def stats(self):
+        return self.__catalog.stats()
+
+    def close(self):
+        self.__executor.shutdown()
+        self.__catalog.close()
+
+    def __lookup(self, lookup, references):
+        found = {}
+        for chunk_found in self.__map(lookup, references):
+            found.update(chunk_found)
+        return found
+
+    def __map(self, lookup, references):
+        references = list(references)
+        if len(references) <= self.__chunk_size:
+            return [lookup(references)]
+        return self.__executor.map(lookup, chunks(references, self.__chunk_size))
+
+
+class CoalescingCatalog(Catalog):
+    """
+    Wraps another catalog, so that concurrent lookups of the same
+    reference from different threads are made only once.
+
+    Each reference in a batch that isn't already being looked up is
+    looked up by the calling thread, as usual. References that another
+    thread is already looking up are instead waited for, and that
+    thread's result used. A thread always completes its own lookup
+    before waiting on others, so threads can't wait on each other.
+
+    Paged lookups are coalesced a page at a time, as each page is
+    drawn, so aren't prefetched by a wrapped `ConcurrentCatalog`, as
+    prefetched pages would hold up the threads waiting on them.
+    """
+
+    def __init__(self, catalog):
+        self.__catalog = catalog
+        self.__lock = threading.Lock()
+        self.__in_flight = {}
+        self.__coalesced = 0
+
+    def __len__(self):
+        return len(self.__catalog)
+
+    def locations(self, references):
+        return self.__lookup("locations", self.__catalog.locations, references)
+
+    def traits(self, references):
+        return self.__lookup("traits", self.__catalog.traits, references)
+
+    def fields(self, references, fields):
+        fields = tuple(fields)
+        entries = self.__lookup(
+            fields, lambda refs: _by_reference(self.__catalog.fields(refs, fields)), references
+        )
+        return by_field(entries, fields)
+
+    def related(self, reference, relationship, start, count):
+        return self.__catalog.related(reference, relationship, start, count)
+
+    def references(self):
+        return self.__catalog.references()
+
+    def refresh(self):
+        self.__catalog.refresh()
+
+    def stats(self):
+        with self.__lock:
+            stats = {"coalesced": self.__coalesced}
+        catalog_stats = self.__catalog.stats()
+        if catalog_stats:
+            stats["catalog"] = catalog_stats
+        return stats
+
+    def close(self):
+        self.__catalog.close()
+
+    def __lookup(self, kind, lookup, references):
+        flight = _Flight()
+        owned = []
+        awaited = {}
+        in_flight = self.__in_flight
+        with self.__lock:
+            for ref in references:
+                key = (kind, ref)
+                other_flight = in_flight.get(key)
+                if other_flight is None:
+                    in_flight[key] = flight
+                    owned.append(ref)
+                elif other_flight is not flight:
+                    awaited[ref] = other_flight
+            self.__coalesced += len(awaited)
+
+        try:
+            found = lookup(owned) if owned else {}
+            flight.found = found
+        finally:
+            with self.__lock:
+                for ref in owned:
+                    del in_flight[(kind, ref)]
+            flight.done.set()
+
+        if awaited:
+            found = dict(found)
+            failed = []
+            for ref, other_flight in awaited.items():
+                other_flight.done.wait()
+                if other_flight.found is None:
+                    failed.append(ref)
+                elif ref in other_flight.found:
+                    found[ref] = other_flight.found[ref]
+            # Any references whose lookup failed in another thread are
+            # tried again in this one.
+            if failed:
+                found.update(lookup(failed))
+        return found
+
+
+class _Flight:  # pylint: disable=too-few-public-methods
+    """
+    A batch lookup in progress, on which other threads can wait.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        # The lookup's result, or None if it failed.
+        self.found = None
+
+
+class OverlayCatalog(Catalog):  # pylint: disable=abstract-method
+    """
+    Serves lookups from `overlay` for the entities that it holds, and
+    from `catalog` for all others. For example, to serve entities from
+    a snapshot in preference to the live catalog.
+
+    Only supports lookups, neither catalog is owned.
+    """
+
+    def __init__(self, overlay, catalog):
+        self.__overlay = overlay
+        self.__catalog = catalog
+
+    def locations(self, references):
+        found = self.__overlay.locations(references)
+        remaining = [ref for ref in references if ref not in found]
+        if remaining:
+            # Entities in the overlay without a location mustn't be
+            # looked up in the catalog.
+            known = self.__overlay.traits(remaining)
+            found.update(self.__catalog.locations([ref for ref in remaining if ref not in known]))
+        return found
+
+    def traits(self, references):
+        found = self.__overlay.traits(references)
+        remaining = [ref for ref in references if ref not in found]
+        if remaining:
+            found.update(self.__catalog.traits(remaining))
+        return found
+
+    def field_pages(self, references, fields, page_size):
+        def split(page):
+            known = self.__overlay.traits(page)
+            found = self.__overlay.fields([ref for ref in page if ref in known], fields)
+            return list(known), found, [ref for ref in page if ref not in known]
+
+        return forwarded_pages(self.__catalog, references, fields, page_size, split)
+
+    def related(self, reference, relationship, start, count):
+        # Snapshots don't hold relationships.
+        return self.__catalog.related(reference, relationship, start, count)
+
+
+class FilteredCatalog(Catalog):  # pylint: disable=too-many-instance-attributes
+    """
+    Wraps another catalog, omitting references that it doesn't hold
+    from results without consulting it, where possible.
+
+    If `false_positive_rate` is non-zero, a `cache.BloomFilter` of
+    every reference in the wrapped catalog is built up front, and
+    references that it rules out are never looked up. If
+    `missing_cache_size` is non-zero, references that the wrapped
+    catalog didn't return are remembered for `missing_cache_ttl`
+    seconds, and not looked up again in that time.
+
+    The filter is a snapshot of the wrapped catalog, so references
+    added to it afterwards are reported missing until `refresh` is
+    called, which rebuilds it. Testing a reference costs roughly as
+    much as a primary key lookup in a local `SqliteCatalog`, so this
+    only pays off where lookups are comparatively expensive, such as
+    when the catalog is a remote service.
+    """
+
+    def __init__(self, catalog, false_positive_rate, missing_cache_size=0, missing_cache_ttl=0.0):
+        self.__catalog = catalog
+        self.__false_positive_rate = false_positive_rate
+        self.__filter = self.__build_filter() if false_positive_rate else None
+        self.__missing_cache = None
+        if missing_cache_size:
+            self.__missing_cache = cache.LruCache(missing_cache_size, missing_cache_ttl)
+        self.__lock = threading.Lock()
+        self.__requested = 0
+        self.__filtered = 0
+        self.__looked_up = 0
+        self.__missed = 0
+
+    def __len__(self):
+        return len(self.__catalog)
+
+    def locations(self, references):
+        return self.fields(references, ["location"])["location"]
+
+    def traits(self, references):
+        return self.fields(references, ["traits"])["traits"]
+
+    def fields(self, references, fields):
+        candidates = self.__candidates(list(references), fields)
+        found = self.__catalog.fields(candidates, fields) if candidates else {}
+        return self.__record(candidates, fields, found)
+
+    def field_pages(self, references, fields, page_size):
+        def split(page):
+            candidates = self.__candidates(page, fields)
+            candidate_set = set(candidates)
+            filtered = [ref for ref in page if ref not in candidate_set]
+            return filtered, {field: {} for field in fields}, candidates
+
+        def record(page, found):
+            return self.__record(page, fields, found)
+
+        return forwarded_pages(self.__catalog, references, fields, page_size, split, record)
+
+    def related(self, reference, relationship, start, count):
+        return self.__catalog.related(reference, relationship, start, count)
+
+    def references(self):
+        return self.__catalog.references()
+
+    def refresh(self):
+        self.__catalog.refresh()
+        if self.__false_positive_rate:
+            self.__filter = self.__build_filter()
+        if self.__missing_cache is not None:
+            self.__missing_cache.clear()
+
+    def stats(self):
+        with self.__lock:
+            stats = {
+                "requested": self.__requested,
+                "filtered": self.__filtered,
+                "looked_up": self.__looked_up,
+                "missed": self.__missed,
+            }
+        if self.__filter is not None:
+            stats["filter"] = self.__filter.stats()
+        if self.__missing_cache is not None:
+            stats["missing_cache"] = self.__missing_cache.stats()
+        catalog_stats = self.__catalog.stats()
+        if catalog_stats:
+            stats["catalog"] = catalog_stats
+        return stats
+
+    def close(self):
+        self.__catalog.close()
+
+    def __candidates(self, references, fields):
+        # The references to look up the supplied fields of.
+        candidates = references
+        bloom_filter = self.__filter
+        if bloom_filter is not None:
+            candidates = bloom_filter.select(candidates)
+        # Entities without a location are missing from `locations`,
+        # but not `traits`, so misses are remembered per field, and
+        # only references missing every field are filtered.
+        missing_cache = self.__missing_cache
+        if missing_cache is not None:
+            candidates = [
+                ref
+                for ref in candidates
+                if any(missing_cache.get((field, ref)) is None for field in fields)
+            ]
+        with self.__lock:
+            self.__requested += len(references)
+            self.__filtered += len(references) - len(candidates)
+        return candidates
+
+    def __record(self, candidates, fields, found):
+        # Remember the candidates that weren't found, returning the
+        # fields found, with any not looked up.
+        found = {field: found.get(field, {}) for field in fields}
+        if len(found) == 1:
+            missed = len(candidates) - len(next(iter(found.values())))
+        else:
+            missed = len(candidates) - len(set().union(*found.values()))
+        missing_cache = self.__missing_cache
+        if missing_cache is not None:
+            for field, values in found.items():
+                if len(values) < len(candidates):
+                    for ref in candidates:
+                        if ref not in values:
+                            missing_cache.put((field, ref), True)
+        with self.__lock:
+            self.__looked_up += len(candidates)
+            self.__missed += missed
+        return found
+
+    def __build_filter(self):
+        bloom_filter = cache.BloomFilter(len(self.__catalog), self.__false_positive_rate)
+        for reference in self.__catalog.references():
+            bloom_filter.add(reference)
+        return bloom_filter
+
+
+def parse_trait_set(trait_sets, traits):
+    """
+    Return the frozenset of the space-separated trait IDs in `traits`,
+    shared with any previous call with the same `trait_sets` cache.
+    """
+    trait_set = trait_sets.get(traits)
+    if trait_set is None:
+        trait_set = trait_sets.setdefault(traits, frozenset(traits.split()))
+    return trait_set
+
+
+def write_sqlite_catalog(path, entries):
+    """
+    Write a SQLite catalog to the supplied path, for use with
+    `SqliteCatalog`.
+
+    `entries` is an iterable of (reference, CatalogEntry) pairs, it is
+    consumed lazily so that large catalogs can be written without
+    holding them all in memory.
+    """
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities"
+                " (ref TEXT PRIMARY KEY, location TEXT, traits TEXT NOT NULL) WITHOUT ROWID"
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?)",
+                (
+                    (reference, entry.location, " ".join(sorted(entry.traits)))
+                    for reference, entry in entries
+                ),
+            )
+    finally:
+        connection.close()
+
+
+def template_catalog():
+    """
+    Create the catalog used when no catalog path is configured.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassetio_mediacreation.traits.content import LocatableContentTrait
+    from openassetio_mediacreation.traits.application import ConfigTrait
+    from openassetio_mediacreation.traits.lifecycle import VersionTrait
+    from openassetio_mediacreation.traits.usage import EntityTrait
+
+    # For the purposes of this template, we use this fake set of
+    # entities to serve as our "database", arbitrarily assuming that
+    # asset 2 is a config entity of some sort, and that assets 1 and 3
+    # are versions of the same logical entity.
+    # Replace this with querying your backend systems.
+    versions = ["my_asset_manager:///anAsset", "my_asset_manager:///anAsset3"]
+    return MemoryCatalog(
+        {
+            "my_asset_manager:///anAsset": CatalogEntry(
+                "file:///some/filesystem/path",
+                frozenset({EntityTrait.kId, LocatableContentTrait.kId}),
+            ),
+            "my_asset_manager:///anAsset2": CatalogEntry(
+                "file:///some/filesystem/path2",
+                frozenset({EntityTrait.kId, LocatableContentTrait.kId, ConfigTrait.kId}),
+            ),
+            "my_asset_manager:///anAsset3": CatalogEntry(
+                "file:///some/filesystem/path3",
+                frozenset({EntityTrait.kId, LocatableContentTrait.kId}),
+            ),
+        },
+        [(reference, VersionTrait.kId, version) for reference in versions for version in versions],
+    )
+
+
+def load_catalog(path, max_workers=1, chunk_size=0, backend=None):
+    """
+    Load the catalog at the supplied path, or the template catalog if
+    the path is empty. If a `backend` catalog is given, such as a
+    `remote.RemoteCatalog` or `compact.CompactCatalog`, it is used
+    instead.
+
+    If `max_workers` is greater than one, batches larger than
+    `chunk_size` are split and looked up concurrently, see
+    `ConcurrentCatalog`.
+    """
+    if backend is not None:
+        catalog = backend
+    else:
+        catalog = SqliteCatalog(path) if path else template_catalog()
+    if max_workers > 1:
+        catalog = ConcurrentCatalog(catalog, max_workers, chunk_size)
+    return catalog
@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+A local stand-in for a remote catalog service, serving any catalog
+over the protocol understood by `remote.RemoteCatalog`.
+
+It is intended for tests and benchmarks, not production: it can add
+a fixed latency to every request, to approximate a service across a
+network, and fail a given number of requests, to exercise retries.
+
+Usage, to serve a SQLite catalog on port 8000:
+
+    python -m my_asset_manager.catalog_server catalog.db --port 8000
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .catalog import SqliteCatalog
+
+
+class CatalogServer(ThreadingHTTPServer):
+    """
+    An HTTP server for `catalog`, listening on `address`, by default
+    on an unused local port. Each request is delayed by `latency`
+    seconds before it is answered.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, catalog, address=("127.0.0.1", 0), latency=0.0):
+        super().__init__(address, _Handler)
+        self.catalog = catalog
+        self.latency = latency
+        self.__lock = threading.Lock()
+        self.__failures = []
+        self.__requests = 0
+        self.__thread = None
+
+    @property
+    def url(self):
+        """
+        The URL that the server is listening on.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self):
+        """
+        The number of requests received.
+        """
+        return self.__requests
+
+    def fail_requests(self, count, status=503):
+        """
+        Answer the next `count` requests with the given HTTP status.
+        """
+        with self.__lock:
+            self.__failures.extend([status] * count)
+
+    def start(self):
+        """
+        Serve requests from a background thread, returning the server.
+        """
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving, and release the listening socket.
+        """
+        if self.__thread is not None:
+            self.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.server_close()
+
+    def next_failure(self):
+        """
+        Count a received request, returning the status to fail it
+        with, or None to answer it.
+        """
+        with self.__lock:
+            self.__requests += 1
+            return self.__failures.pop(0) if self.__failures else None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections open between requests, as a real service would.
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which, with Nagle's
+    # algorithm, stalls each response on the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Answer a request for a page of references, or their count.
+        """
+        catalog = self.__begin()
+        if catalog is None:
+            return
+        url = urllib.parse.urlsplit(self.path)
+        if url.path.endswith("/references"):
+            query = urllib.parse.parse_qs(url.query)
+            try:
+                start = int(query.get("start", ["0"])[0])
+                count = int(query["count"][0]) if "count" in query else None
+                page = itertools.islice(
+                    catalog.references(), start, None if count is None else start + count
+                )
+            except ValueError:
+                self.__respond(400, {"error": "Expected non-negative integer start and count"})
+                return
+            # Pages are sliced from a fresh iteration each time, which
+            # is fine for a stand-in, though a real service would page
+            # through an index.
+            self.__respond(200, list(page))
+        elif url.path.endswith("/count"):
+            self.__respond(200, {"count": len(catalog)})
+        else:
+            self.__respond(404, {"error": f"Unknown endpoint '{self.path}'"})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        Answer a lookup of the locations, trait sets or fields of a
+        batch of references, or of a page of the entities related to
+        one.
+        """
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        catalog = self.__begin()
+        if catalog is None:
+            return
+        if self.path.endswith("/related"):
+            try:
+                query = json.loads(body)
+                related = catalog.related(
+                    query["reference"], query["relationship"], query["start"], query["count"]
+                )
+            except (ValueError, TypeError, KeyError):
+                self.__respond(
+                    400, {"error": "Expected a body of {'reference': ..., 'relationship': ...}"}
+                )
+                return
+            self.__respond(200, related)
+            return
+        try:
+            query = json.loads(body)
+            references = query["references"]
+        except (ValueError, TypeError, KeyError):
+            self.__respond(400, {"error": "Expected a body of {'references': [...]}"})
+            return
+        if self.path.endswith("/fields"):
+            try:
+                found = catalog.fields(references, query["fields"])
+            except (TypeError, KeyError):
+                self.__respond(400, {"error": "Expected known fields in {'fields': [...]}"})
+                return
+            if "traits" in found:
+                found["traits"] = {
+                    reference: " ".join(sorted(traits))
+                    for reference, traits in found["traits"].items()
+                }
+            self.__respond(200, found)
+        elif self.path.endswith("/locations"):
+            self.__respond(200, catalog.locations(references))
+        elif self.path.endswith("/traits"):
+            self.__respond(
+                200,
+                {
+                    reference: " ".join(sorted(traits))
+                    for reference, traits in catalog.traits(references).items()
+                },
+            )
+        else:
+            self.__respond(404, {"error": f"Unknown endpoint '{self.path}'"})
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        # Requests are far too frequent to log.
+        pass
+
+    def __begin(self):
+        # Apply the server's latency and any pending failure, returning
+        # the catalog to answer from, or None if the request failed.
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        status = self.server.next_failure()
+        if status is not None:
+            self.__respond(status, {"error": "Injected failure"})
+            return None
+        return self.server.catalog
+
+    def __respond(self, status, payload):
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main(argv=None):
+    """
+    Serve the SQLite catalog given on the command line until
+    interrupted.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("catalog_path", help="Path to a SQLite catalog to serve.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = CatalogServer(
+        SqliteCatalog(args.catalog_path), (args.host, args.port), args.latency_ms / 1000
+    )
+    print(f"Serving '{args.catalog_path}' on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+A compact, array-backed in-memory catalog, for holding catalogs of
+many millions of entities in memory without a Python object per
+entity.
+"""
+import functools
+import io
+import itertools
+import sys
+from array import array
+from typing import NamedTuple
+
+from .catalog import Catalog, SqliteCatalog
+from .relationships import AdjacencyIndex
+
+
+class CompactCatalog(Catalog):
+    """
+    A catalog held entirely in memory in a compact, array-backed form,
+    for catalogs too large to hold as a dict of `catalog.CatalogEntry`.
+
+    References and locations are each concatenated into one string,
+    and sliced out by offset. Each distinct trait set is held once, and
+    entities refer to it by index, so the trait sets returned are
+    shared rather than allocated per entity. References are found
+    through an open addressing hash table of entity indices. Beyond the
+    characters of its reference and location, each entity costs around
+    thirty bytes, rather than the couple of hundred of a dict entry,
+    `catalog.CatalogEntry` and its strings. In exchange, lookups are roughly
+    twice as slow as a dict, though still faster than `catalog.SqliteCatalog`.
+    Any `relationships` between entities are held in an
+    `relationships.AdjacencyIndex`.
+
+    If `reload` is given, `refresh` calls it for a new pair of iterables
+    of entries and relationships and swaps them in, see `from_sqlite`.
+    """
+
+    def __init__(self, entries, reload=None, relationships=()):
+        self.__reload = reload
+        self.__tables = _CompactTables.build(entries)
+        self.__relationships = AdjacencyIndex(relationships)
+
+    @classmethod
+    def from_sqlite(cls, path):
+        """
+        Load the SQLite catalog at `path`, see `catalog.SqliteCatalog`,
+        which is reloaded by `refresh`.
+        """
+        entries, relationships = _read_sqlite(path)
+        return cls(entries, functools.partial(_read_sqlite, path), relationships)
+
+    def __len__(self):
+        return self.__tables.count
+
+    def references(self):
+        # Yielded in the order the entities are stored, straight from
+        # their offsets, skipping any replaced by a later entry for the
+        # same reference, which only need be looked for if there are
+        # fewer distinct references than entities.
+        tables = self.__tables
+        text = tables.reference_text
+        offsets = tables.reference_offsets
+        spans = zip(offsets, itertools.islice(offsets, 1, None))
+        if tables.count == len(offsets) - 1:
+            for start, end in spans:
+                yield text[start:end]
+            return
+        for entity, (start, end) in enumerate(spans):
+            reference = text[start:end]
+            if tables.find((reference,))[0][1] == entity:
+                yield reference
+
+    def locations(self, references):
+        tables = self.__tables
+        text = tables.location_text
+        offsets = tables.location_offsets
+        has_location = tables.has_location
+        return {
+            reference: text[offsets[index] : offsets[index + 1]]
+            for reference, index in tables.find(references)
+            if has_location[index]
+        }
+
+    def traits(self, references):
+        tables = self.__tables
+        trait_set_ids = tables.trait_set_ids
+        trait_sets = tables.trait_sets
+        return {
+            reference: trait_sets[trait_set_ids[index]]
+            for reference, index in tables.find(references)
+        }
+
+    def related(self, reference, relationship, start, count):
+        return self.__relationships.related(reference, relationship, start, count)
+
+    def refresh(self):
+        if self.__reload is not None:
+            # Lookups take a reference to the current tables once, so
+            # see either the old or new entries, never a mix.
+            entries, relationships = self.__reload()
+            self.__tables = _CompactTables.build(entries)
+            self.__relationships = AdjacencyIndex(relationships)
+
+    def stats(self):
+        tables = self.__tables
+        return {
+            "entities": tables.count,
+            "relationships": len(self.__relationships),
+            "bytes": tables.size() + self.__relationships.size(),
+            "trait_sets": len(tables.trait_sets),
+        }
+
+
+class _CompactTables(NamedTuple):
+    """
+    The entries of a `CompactCatalog`, indexed by entity.
+    """
+
+    reference_text: str
+    reference_offsets: array
+    index: array
+    location_text: str
+    location_offsets: array
+    has_location: bytearray
+    trait_set_ids: array
+    trait_sets: list
+    count: int
+
+    @classmethod
+    def build(cls, entries):
+        """
+        Build the tables of an iterable of (reference, CatalogEntry)
+        pairs. Later entries for the same reference replace earlier
+        ones.
+        """
+        # pylint: disable=too-many-locals
+        reference_text = io.StringIO()
+        reference_offsets = array("Q", [0])
+        location_text = io.StringIO()
+        location_offsets = array("Q", [0])
+        has_location = bytearray()
+        trait_set_ids = array("I")
+        trait_set_indices = {}
+        for reference, entry in entries:
+            reference_offsets.append(reference_offsets[-1] + reference_text.write(reference))
+            location = entry.location
+            has_location.append(location is not None)
+            location_offsets.append(location_offsets[-1] + location_text.write(location or ""))
+            trait_set_id = trait_set_indices.get(entry.traits)
+            if trait_set_id is None:
+                trait_set_id = trait_set_indices.setdefault(entry.traits, len(trait_set_indices))
+            trait_set_ids.append(trait_set_id)
+
+        reference_text = reference_text.getvalue()
+        entity_count = len(reference_offsets) - 1
+        # A power of two, at most half full, so that probe sequences
+        # are short.
+        index = array("q" if entity_count >= 1 << 31 else "i", [-1]) * (
+            1 << max(3, (2 * entity_count).bit_length())
+        )
+        mask = len(index) - 1
+        count = 0
+        for entity in range(entity_count):
+            reference = reference_text[reference_offsets[entity] : reference_offsets[entity + 1]]
+            slot = hash(reference) & mask
+            while True:
+                other = index[slot]
+                if other < 0:
+                    count += 1
+                    break
+                if reference_text[reference_offsets[other] : reference_offsets[other + 1]] == (
+                    reference
+                ):
+                    break
+                slot = (slot + 1) & mask
+            index[slot] = entity
+
+        return cls(
+            reference_text,
+            reference_offsets,
+            index,
+            location_text.getvalue(),
+            location_offsets,
+            has_location,
+            trait_set_ids,
+            list(trait_set_indices),
+            count,
+        )
+
+    def find(self, references):
+        """
+        Return a list of (reference, entity) pairs for each of the
+        supplied references in the tables.
+        """
+        # A single loop, without helper calls, as this is called with
+        # whole batches, and per-reference call overhead dominates.
+        index = self.index
+        mask = len(index) - 1
+        text = self.reference_text
+        offsets = self.reference_offsets
+        found = []
+        for reference in references:
+            slot = hash(reference) & mask
+            entity = index[slot]
+            while entity >= 0:
+                # Compared in place, without slicing out the reference.
+                start = offsets[entity]
+                if offsets[entity + 1] - start == len(reference) and text.startswith(
+                    reference, start
+                ):
+                    found.append((reference, entity))
+                    break
+                slot = (slot + 1) & mask
+                entity = index[slot]
+        return found
+
+    def size(self):
+        """
+        Return the approximate number of bytes held by the tables,
+        excluding the trait sets.
+        """
+        arrays = (
+            self.reference_offsets,
+            self.index,
+            self.location_offsets,
+            self.trait_set_ids,
+        )
+        return (
+            sys.getsizeof(self.reference_text)
+            + sys.getsizeof(self.location_text)
+            + len(self.has_location)
+            + sum(array_.itemsize * len(array_) for array_ in arrays)
+        )
+
+
+def _read_sqlite(path):
+    """
+    Return iterables of a (reference, CatalogEntry) pair for every
+    entity in the SQLite catalog at `path`, and of a triple for every
+    relationship, see `catalog.SqliteCatalog.relationships`. Each is
+    read lazily, as it is consumed.
+    """
+    return _read_sqlite_rows(path, "entries"), _read_sqlite_rows(path, "relationships")
+
+
+def _read_sqlite_rows(path, method):
+    sqlite_catalog = SqliteCatalog(path)
+    try:
+        yield from getattr(sqlite_catalog, method)()
+    finally:
+        sqlite_catalog.close()
@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Opt-in instrumentation of the MyAssetManager API methods.
+
+Calls to methods decorated with `instrumented` are timed and counted
+when the manager has an `Instrumentation` instance, and cost a single
+attribute check otherwise.
+"""
+import functools
+import json
+import threading
+import time
+from collections import Counter
+
+from openassetio.log import LoggerInterface
+
+
+class LatencyHistogram:
+    """
+    A histogram of call latencies, bucketed by powers of two
+    microseconds, from which approximate percentiles can be read.
+    """
+
+    # Calls of 2^31us (~36 minutes) or more share the last bucket.
+    kBucketCount = 32
+
+    def __init__(self):
+        self.buckets = [0] * self.kBucketCount
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """
+        Record a single latency.
+        """
+        bucket = min(int(seconds * 1e6).bit_length(), self.kBucketCount - 1)
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction):
+        """
+        Return an upper bound, in seconds, on the latency of the given
+        fraction of calls.
+        """
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        cumulative = 0
+        for bucket, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+
+class MethodStats:  # pylint: disable=too-few-public-methods
+    """
+    Accumulated statistics for calls to a single API method.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.elements = 0
+        self.successes = 0
+        self.errors = Counter()
+        self.latency = LatencyHistogram()
+
+    def snapshot(self):
+        """
+        Return the statistics as a JSON-compatible dict.
+        """
+        latency = self.latency
+        return {
+            "calls": self.calls,
+            "elements": self.elements,
+            "successes": self.successes,
+            "errors": dict(self.errors),
+            "latency_ms": {
+                "mean": latency.total / latency.count * 1000 if latency.count else 0.0,
+                "p50": latency.percentile(0.5) * 1000,
+                "p99": latency.percentile(0.99) * 1000,
+                "max": latency.max * 1000,
+                "histogram_us": {
+                    f"<{1 << bucket}": count
+                    for bucket, count in enumerate(latency.buckets)
+                    if count
+                },
+            },
+        }
+
+
+class Instrumentation:  # pylint: disable=too-many-instance-attributes
+    """
+    Collects per-method call statistics, and periodically exports a
+    snapshot of them.
+
+    Snapshots are exported at most once every `interval` seconds, as
+    calls complete, either appended as a line of JSON to the file at
+    `path`, or, if no path is given, logged through `logger`. An
+    interval of 0 disables periodic export, `export` can still be
+    called explicitly.
+
+    Additional statistics, such as cache hit counts, can be included
+    in snapshots by registering a function with `add_source`. A hit
+    rate is added to any such statistics with "hits" and "misses".
+    """
+
+    def __init__(self, interval=0.0, path="", logger=None, clock=time.monotonic):
+        self.__interval = interval
+        self.__path = path
+        self.__logger = logger
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__methods = {}
+        self.__sources = {}
+        self.__last_export = self.__clock()
+
+    def add_source(self, name, stats_fn):
+        """
+        Include the dict returned by `stats_fn` in snapshots, under
+        `name`.
+        """
+        self.__sources[name] = stats_fn
+
+    def record(self, method, elements, seconds, successes, errors):
+        # pylint: disable=too-many-arguments
+        """
+        Record a single call to `method`. `errors` is a mapping of error
+        code name to count.
+        """
+        with self.__lock:
+            stats = self.__methods.get(method)
+            if stats is None:
+                stats = self.__methods[method] = MethodStats()
+            stats.calls += 1
+            stats.elements += elements
+            stats.successes += successes
+            stats.errors.update(errors)
+            stats.latency.add(seconds)
+            export_due = bool(self.__interval) and (
+                self.__clock() - self.__last_export >= self.__interval
+            )
+            if export_due:
+                self.__last_export = self.__clock()
+        if export_due:
+            self.export()
+
+    def snapshot(self):
+        """
+        Return the statistics collected so far as a JSON-compatible
+        dict.
+        """
+        with self.__lock:
+            snapshot = {
+                "time": time.time(),
+                "methods": {name: stats.snapshot() for name, stats in self.__methods.items()},
+            }
+        for name, stats_fn in self.__sources.items():
+            stats = stats_fn()
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            if lookups:
+                stats["hit_rate"] = stats["hits"] / lookups
+            snapshot[name] = stats
+        return snapshot
+
+    def export(self):
+        """
+        Export a snapshot to the configured file or logger.
+        """
+        line = json.dumps(self.snapshot(), sort_keys=True)
+        if self.__path:
+            with open(self.__path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+        elif self.__logger is not None:
+            self.__logger.log(LoggerInterface.Severity.kDebug, f"MyAssetManager stats: {line}")
+
+
+def instrumented(method):
+    """
+    Decorator that records calls to a manager method with the
+    instance's `Instrumentation`, if it has one.
+
+    The instance exposes its instrumentation through an
+    `_instrumentation` attribute, which is None if disabled. Methods
+    with trailing success and error callback arguments are counted per
+    element of their first argument. Other methods are counted per
+    element of a list result, or else as a single element that
+    succeeded if the result is truthy.
+    """
+    name = method.__name__
+    code = method.__code__
+    has_callbacks = code.co_varnames[code.co_argcount - 2 : code.co_argcount] == (
+        "successCallback",
+        "errorCallback",
+    )
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        instrumentation = self._instrumentation  # pylint: disable=protected-access
+        if instrumentation is None:
+            return method(self, *args)
+
+        elements = len(args[0]) if has_callbacks else 1
+        successes = 0
+        errors = Counter()
+        if has_callbacks:
+            success_callback, error_callback = args[-2], args[-1]
+
+            def counting_success_callback(idx, value):
+                nonlocal successes
+                successes += 1
+                success_callback(idx, value)
+
+            def counting_error_callback(idx, error):
+                errors[error.code.name] += 1
+                error_callback(idx, error)
+
+            args = (*args[:-2], counting_success_callback, counting_error_callback)
+
+        start = time.perf_counter()
+        result = method(self, *args)
+        elapsed = time.perf_counter() - start
+
+        if not has_callbacks:
+            if isinstance(result, list):
+                elements = successes = len(result)
+            else:
+                successes = int(bool(result))
+        instrumentation.record(name, elements, elapsed, successes, errors)
+        return result
+
+    return wrapper
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Projection of the trait sets requested of `resolve` onto the catalog
+fields needed to supply them, so that each batch only fetches the data
+it returns.
+
+To resolve a new trait, add the catalog field that holds its data, see
+`catalog.Catalog.fields`, and an entry to `_TRAIT_FIELDS` that imbues a
+result with that data.
+"""
+import functools
+from typing import Callable, NamedTuple, Tuple
+
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+
+class TraitField(NamedTuple):
+    """
+    The catalog field that holds a trait's data, and a function that
+    imbues the trait into a `TraitsData` given a value of that field.
+    """
+
+    trait_id: str
+    field: str
+    imbue: Callable
+
+
+class Projection(NamedTuple):
+    """
+    The catalog fields that hold the data of a trait set, and the
+    traits that can be resolved from them. `lookup_fields` are the
+    fields to fetch, which add the trait set of each entity, so that
+    an entity without data for any of the traits can be told apart
+    from a missing one in the same lookup.
+    """
+
+    fields: Tuple[str, ...]
+    trait_fields: Tuple[TraitField, ...]
+    lookup_fields: Tuple[str, ...]
+
+
+def _imbue_location(traits_data, location):
+    # Set directly, rather than through a LocatableContentTrait view,
+    # to avoid constructing a view per resolved entity.
+    traits_data.setTraitProperty(LocatableContentTrait.kId, "location", location)
+
+
+# Every trait that the manager can resolve.
+_TRAIT_FIELDS = (TraitField(LocatableContentTrait.kId, "location", _imbue_location),)
+
+
+def resolvable_traits(trait_set):
+    """
+    Return the IDs of the traits in `trait_set` that can be resolved.
+    """
+    return [trait_field.trait_id for trait_field in project(frozenset(trait_set)).trait_fields]
+
+
+@functools.lru_cache(maxsize=1024)
+def project(trait_set):
+    """
+    Return the `Projection` of a frozenset of trait IDs. Hosts resolve
+    the same few trait sets over and over, so projections are cached.
+    """
+    trait_fields = tuple(
+        trait_field for trait_field in _TRAIT_FIELDS if trait_field.trait_id in trait_set
+    )
+    fields = tuple(dict.fromkeys(trait_field.field for trait_field in trait_fields))
+    lookup_fields = tuple(dict.fromkeys((*fields, "traits"))) if fields else ()
+    return Projection(fields, trait_fields, lookup_fields)
@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Publishing of new entities, recorded in a write-ahead journal, and
+served alongside those of a read-only catalog.
+
+Entities registered by a host are appended to the journal, and synced
+to disk, before the registration succeeds, so a published entity is
+never lost once the host has been told of it. Registrations made at
+the same time from several threads are group committed, that is,
+written together with a single sync, so publishing costs a sync per
+batch, or fewer, rather than one per entity.
+
+The journal is a file of JSON objects, one per line, of the form
+{"reference": ..., "location": ..., "traits": "<space-separated IDs>"}.
+Later lines supersede earlier ones for the same reference. Replace it
+with registration in your backend systems, keeping the batching.
+"""
+import json
+import os
+import threading
+
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from .catalog import Catalog, CatalogEntry, forwarded_pages, parse_trait_set
+
+
+def catalog_entry(traits_data, trait_sets):
+    """
+    Return the `CatalogEntry` to publish for the data that a host
+    registers to an entity. Its trait set is shared with any equal one
+    previously seen in the `trait_sets` dict, as publishes of many
+    entities tend to register the same traits for each.
+    """
+    location = None
+    if traits_data.hasTrait(LocatableContentTrait.kId):
+        location = traits_data.getTraitProperty(LocatableContentTrait.kId, "location")
+    traits = frozenset(traits_data.traitSet())
+    return CatalogEntry(
+        location if isinstance(location, str) else None, trait_sets.setdefault(traits, traits)
+    )
+
+
+class Journal:  # pylint: disable=too-many-instance-attributes
+    """
+    An append-only journal of catalog entries at `path`, created if it
+    doesn't exist.
+
+    A commit waits `commit_delay` seconds for further appends from
+    other threads to join it before syncing, trading the latency of
+    each append for fewer syncs.
+    """
+
+    def __init__(self, path, commit_delay=0.0):
+        self.__path = path
+        self.__commit_delay = commit_delay
+        # pylint: disable=consider-using-with
+        self.__file = open(path, "ab")
+        self.__condition = threading.Condition()
+        self.__open_commit = _Commit()
+        self.__committing = False
+        # A failed write may have left a partial record, which the next
+        # write must terminate so that it isn't merged with a valid one.
+        self.__torn = False
+        self.__read_offset = 0
+        self.__records = 0
+        self.__commits = 0
+
+    def append(self, entries):
+        """
+        Append (reference, `CatalogEntry`) pairs to the journal,
+        returning once they are synced to disk.
+
+        Raises `OSError` if they couldn't be written.
+        """
+        data = b"".join(
+            json.dumps(
+                {
+                    "reference": reference,
+                    "location": entry.location,
+                    "traits": " ".join(sorted(entry.traits)),
+                },
+                separators=(",", ":"),
+            ).encode()
+            + b"\n"
+            for reference, entry in entries
+        )
+        if not data:
+            return
+        with self.__condition:
+            commit = self.__open_commit
+            commit.data.append(data)
+            self.__records += data.count(b"\n")
+            # The first thread to find no commit in progress commits
+            # everything appended so far, whilst the rest wait for it.
+            while not commit.done:
+                if self.__committing:
+                    self.__condition.wait()
+                else:
+                    self.__commit()
+        if commit.error is not None:
+            raise OSError(
+                f"Failed to write to publishing journal '{self.__path}': {commit.error}"
+            ) from commit.error
+
+    def read(self):
+        """
+        Return a list of the (reference, `CatalogEntry`) pairs appended
+        to the journal, by any process, since the last call.
+
+        Lines that can't be parsed, such as a partial record left by a
+        failed write, are skipped.
+        """
+        with open(self.__path, "rb") as journal_file:
+            journal_file.seek(self.__read_offset)
+            data = journal_file.read()
+        # Only complete lines, a record may still be being written.
+        end = data.rfind(b"\n") + 1
+        self.__read_offset += end
+        trait_sets = {}
+        entries = []
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+                entries.append(
+                    (
+                        record["reference"],
+                        CatalogEntry(
+                            record["location"], parse_trait_set(trait_sets, record["traits"])
+                        ),
+                    )
+                )
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+        return entries
+
+    def stats(self):
+        """
+        Return a dict of the number of records appended, and the
+        number of commits, and so syncs, made.
+        """
+        with self.__condition:
+            return {"records": self.__records, "commits": self.__commits}
+
+    def close(self):
+        """
+        Close the journal file.
+        """
+        with self.__condition:
+            self.__file.close()
+
+    def __commit(self):
+        # Called with the condition held, which is released whilst
+        # writing, so that other threads can append to the next commit.
+        self.__committing = True
+        if self.__commit_delay:
+            self.__condition.wait(self.__commit_delay)
+        commit = self.__open_commit
+        self.__open_commit = _Commit()
+        data = b"".join(commit.data)
+        if self.__torn:
+            data = b"\n" + data
+        self.__condition.release()
+        try:
+            self.__file.write(data)
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+        except (OSError, ValueError) as exc:
+            commit.error = exc
+        finally:
+            self.__condition.acquire()
+            self.__torn = commit.error is not None
+            self.__commits += 1
+            commit.done = True
+            self.__committing = False
+            self.__condition.notify_all()
+
+
+class _Commit:  # pylint: disable=too-few-public-methods
+    """
+    The data appended to the journal by each thread whose appends are
+    written together, and the outcome once they have been.
+    """
+
+    def __init__(self):
+        self.data = []
+        self.done = False
+        self.error = None
+
+
+class PublishedCatalog(Catalog):
+    """
+    Wraps a read-only catalog, adding the entities published to a
+    `Journal`. Published entities are served as soon as they are
+    registered, in preference to the wrapped catalog.
+
+    The journal is replayed when the catalog is constructed, and any
+    entries appended since, such as by other processes, by `refresh`.
+    """
+
+    def __init__(self, catalog, journal):
+        self.__catalog = catalog
+        self.__journal = journal
+        self.__lock = threading.Lock()
+        self.__published = dict(journal.read())
+
+    def __len__(self):
+        return len(self.__catalog) + len(self.__published)
+
+    def references(self):
+        yield from self.__catalog.references()
+        yield from list(self.__published)
+
+    def locations(self, references):
+        return self.__lookup("location", self.__catalog.locations, references)
+
+    def traits(self, references):
+        return self.__lookup("traits", self.__catalog.traits, references)
+
+    def fields(self, references, fields):
+        if not self.__published:
+            return self.__catalog.fields(references, fields)
+        _, found, unpublished = self.__split(references, fields)
+        if unpublished:
+            for field, values in self.__catalog.fields(unpublished, fields).items():
+                found[field].update(values)
+        return found
+
+    def field_pages(self, references, fields, page_size):
+        if not self.__published:
+            return self.__catalog.field_pages(references, fields, page_size)
+
+        def split(page):
+            return self.__split(page, fields)
+
+        return forwarded_pages(self.__catalog, references, fields, page_size, split)
+
+    def related(self, reference, relationship, start, count):
+        # Published entities don't have relationships.
+        return self.__catalog.related(reference, relationship, start, count)
+
+    def read_only(self, references):
+        """
+        Return the set of the supplied entity reference strings that
+        are in the wrapped catalog, and so can't be published to.
+        """
+        return set(self.__catalog.traits(references))
+
+    def register(self, entries):
+        """
+        Publish (reference, `CatalogEntry`) pairs, returning once they
+        are durable in the journal, from when they are served.
+
+        Raises `OSError` if the journal couldn't be written.
+        """
+        entries = list(entries)
+        self.__journal.append(entries)
+        with self.__lock:
+            self.__published.update(entries)
+
+    def refresh(self):
+        self.__catalog.refresh()
+        entries = self.__journal.read()
+        with self.__lock:
+            self.__published.update(entries)
+
+    def stats(self):
+        return {
+            **self.__catalog.stats(),
+            "published": len(self.__published),
+            "journal": self.__journal.stats(),
+        }
+
+    def close(self):
+        self.__journal.close()
+        self.__catalog.close()
+
+    def __lookup(self, field, lookup, references):
+        published = self.__published
+        if not published:
+            return lookup(references)
+        found = {}
+        unpublished = []
+        for reference in references:
+            entry = published.get(reference)
+            if entry is None:
+                unpublished.append(reference)
+            else:
+                value = getattr(entry, field)
+                if value is not None:
+                    found[reference] = value
+        if unpublished:
+            found.update(lookup(unpublished))
+        return found
+
+    def __split(self, references, fields):
+        # The published references, their fields, and the rest.
+        published = self.__published
+        found = {field: {} for field in fields}
+        served = []
+        unpublished = []
+        for reference in references:
+            entry = published.get(reference)
+            if entry is None:
+                unpublished.append(reference)
+                continue
+            served.append(reference)
+            for field, values in found.items():
+                value = getattr(entry, field)
+                if value is not None:
+                    values[reference] = value
+        return served, found, unpublished
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Parsing of the entity reference strings handled by MyAssetManager.
+
+References take the form:
+
+    my_asset_manager:///<path>[?<key>[=<value>][&<key>[=<value>]...]]
+
+Each distinct reference string is parsed once, and the parsed form
+cached, so that repeated queries for the same reference don't repeat
+any string processing.
+"""
+import functools
+import re
+import sys
+from typing import NamedTuple, Optional
+
+# Entity references provided to this asset manager should be prefixed
+# with this string to be considered valid.
+REFERENCE_PREFIX = "my_asset_manager:///"
+
+# The maximum number of distinct reference strings to hold parsed.
+PARSE_CACHE_SIZE = 1 << 16
+
+_reference_pattern = re.compile(
+    re.escape(REFERENCE_PREFIX) + r"(?P<path>[^?]*)(?:\?(?P<query>.*))?", re.DOTALL
+)
+
+
+class ParsedReference(NamedTuple):
+    """
+    The components of an entity reference.
+
+    `path` is interned, so that equal paths from different references
+    share a single string. `params` is a tuple of (key, value) pairs
+    in the order they appear in the query string, a key with no "="
+    has a value of None.
+    """
+
+    path: str
+    params: tuple = ()
+
+    def has_param(self, key):
+        """
+        Return whether the reference has a query parameter with the
+        supplied key.
+        """
+        return any(param_key == key for param_key, _ in self.params)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_reference(reference_string) -> Optional[ParsedReference]:
+    """
+    Parse an entity reference string, returning None if the string is
+    not a reference for this manager.
+
+    Results are cached, and shared between callers, keyed on reference
+    string.
+    """
+    match = _reference_pattern.fullmatch(reference_string)
+    if match is None:
+        return None
+    path, query = match.group("path", "query")
+    params = ()
+    if query:
+        params = tuple(
+            (key, value if sep else None)
+            for key, sep, value in (param.partition("=") for param in query.split("&") if param)
+        )
+    return ParsedReference(sys.intern(path), params)
@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Relationship queries, such as all versions of an entity, or all
+dependencies of a shot, answered from an adjacency index of the
+related entities of each entity, held by the catalog.
+
+Related entities are read from the index a page at a time, as a host
+advances through the pager for a query, so even relationships with
+millions of related entities are streamed in bounded memory.
+
+A relationship is identified by its trait set, as the sorted,
+space-separated IDs of the traits of the relationship `TraitsData`,
+in the same form as an entity's trait set is held in a catalog. The
+properties of those traits aren't considered.
+"""
+import sqlite3
+import sys
+from array import array
+
+from openassetio import EntityReference
+from openassetio.managerApi import EntityReferencePagerInterface
+
+
+def relationship_key(relationship_traits_data):
+    """
+    Return the key of the relationship described by a `TraitsData`,
+    as used by `catalog.Catalog.related`.
+    """
+    return " ".join(sorted(relationship_traits_data.traitSet()))
+
+
+class AdjacencyIndex:
+    """
+    The related entities of each entity, by relationship, held in
+    memory in a compact form.
+
+    `edges` is an iterable of (reference, relationship key, related
+    reference) triples, where the related entities of each reference
+    and relationship are in the order given. Each distinct related
+    reference is held once, and the related entities of each
+    reference and relationship as a contiguous run of indices of them
+    in a single array, so that each relationship costs four bytes,
+    rather than a Python object.
+    """
+
+    def __init__(self, edges):
+        runs = {}
+        related_ids = {}
+        for reference, relationship, related in edges:
+            related_id = related_ids.get(related)
+            if related_id is None:
+                related_id = related_ids.setdefault(related, len(related_ids))
+            run = runs.get((reference, relationship))
+            if run is None:
+                run = runs[(reference, relationship)] = array("I")
+            run.append(related_id)
+        # Concatenated, so that each run costs a pair of offsets, not
+        # an array of its own.
+        targets = array("I")
+        self.__runs = {}
+        for key, run in runs.items():
+            self.__runs[key] = (len(targets), len(targets) + len(run))
+            targets.extend(run)
+        self.__targets = targets
+        self.__related = list(related_ids)
+
+    def __len__(self):
+        return len(self.__targets)
+
+    def related(self, reference, relationship, start, count):
+        """
+        Return a list of at most `count` of the references related to
+        `reference`, from the `start`th onwards.
+        """
+        run = self.__runs.get((reference, relationship))
+        if run is None:
+            return []
+        begin = run[0] + start
+        related = self.__related
+        return [related[target] for target in self.__targets[begin : min(begin + count, run[1])]]
+
+    def size(self):
+        """
+        Return the approximate number of bytes held by the index,
+        excluding the references.
+        """
+        return (
+            self.__targets.itemsize * len(self.__targets)
+            + sys.getsizeof(self.__runs)
+            + sys.getsizeof(self.__related)
+        )
+
+
+class RelatedPager(EntityReferencePagerInterface):  # pylint: disable=too-many-instance-attributes
+    """
+    Pages through the entities related to `reference` by the keyed
+    `relationship`, as held by `catalog`, `page_size` at a time.
+
+    Only entities with all the traits in `result_trait_set` are
+    returned, which are found by a batch lookup of the traits of each
+    page's worth of related entities. A page is only read when the
+    host asks for it, or whether there is one, so at most two pages
+    are held at once.
+    """
+
+    # The methods of the C++ interface take a host session, and are
+    # documented there.
+    # pylint: disable=invalid-name,missing-function-docstring,unused-argument
+
+    def __init__(self, catalog, reference, relationship, page_size, result_trait_set):
+        # pylint: disable=too-many-arguments
+        super().__init__()
+        self.__catalog = catalog
+        self.__reference = reference
+        self.__relationship = relationship
+        self.__page_size = page_size
+        self.__result_trait_set = frozenset(result_trait_set)
+        # The position of the next related entity to read.
+        self.__position = 0
+        self.__exhausted = False
+        self.__page = self.__read_page()
+        self.__next_page = None
+
+    def hasNext(self, hostSession):
+        return bool(self.__peek())
+
+    def get(self, hostSession):
+        return [EntityReference(reference) for reference in self.__page]
+
+    def next(self, hostSession):
+        self.__page = self.__peek()
+        self.__next_page = None
+
+    def close(self, hostSession):
+        self.__page = []
+        self.__next_page = []
+        self.__exhausted = True
+
+    def __peek(self):
+        if self.__next_page is None:
+            self.__next_page = self.__read_page()
+        return self.__next_page
+
+    def __read_page(self):
+        page = []
+        page_size = self.__page_size
+        result_trait_set = self.__result_trait_set
+        while not self.__exhausted and len(page) < page_size:
+            # When filtering, a page's worth are read at a time, as
+            # some may not be returned, but only as many are consumed
+            # as are needed to fill the page.
+            wanted = page_size if result_trait_set else page_size - len(page)
+            related = self.__catalog.related(
+                self.__reference, self.__relationship, self.__position, wanted
+            )
+            # The run ends with this read, but only once everything read
+            # has been consumed, as a filled page may leave some over.
+            run_ended = len(related) < wanted
+            if not result_trait_set:
+                page.extend(related)
+                self.__position += len(related)
+                self.__exhausted = run_ended
+                continue
+            trait_sets = self.__catalog.traits(related)
+            consumed = 0
+            for reference in related:
+                if len(page) == page_size:
+                    break
+                consumed += 1
+                trait_set = trait_sets.get(reference)
+                if trait_set is not None and result_trait_set <= trait_set:
+                    page.append(reference)
+            self.__position += consumed
+            self.__exhausted = run_ended and consumed == len(related)
+        return page
+
+
+def write_sqlite_relationships(path, edges):
+    """
+    Write the relationships of a SQLite catalog at the supplied path,
+    see `catalog.write_sqlite_catalog`, for use with
+    `catalog.SqliteCatalog.related`.
+
+    `edges` is an iterable of (reference, relationship key, related
+    reference) triples, as for `AdjacencyIndex`, consumed lazily. Any
+    relationships previously written for the same reference and
+    relationship are replaced. Each is held at its position amongst
+    the others of its reference and relationship, indexed by the
+    primary key, so a page of them costs a single index range scan.
+    """
+    positions = {}
+
+    def rows(connection):
+        for reference, relationship, related in edges:
+            key = (reference, relationship)
+            position = positions.get(key)
+            if position is None:
+                connection.execute(
+                    "DELETE FROM relationships WHERE ref = ? AND relationship = ?", key
+                )
+                position = 0
+            positions[key] = position + 1
+            yield reference, relationship, position, related
+
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS relationships (ref TEXT NOT NULL,"
+                " relationship TEXT NOT NULL, position INTEGER NOT NULL, related TEXT NOT NULL,"
+                " PRIMARY KEY (ref, relationship, position)) WITHOUT ROWID"
+            )
+            connection.executemany(
+                "INSERT INTO relationships VALUES (?, ?, ?, ?)", rows(connection)
+            )
+    finally:
+        connection.close()
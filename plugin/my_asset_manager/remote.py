@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+A client for catalogs served over HTTP, such as by `catalog_server`.
+
+Replace the stand-in protocol here with that of your backend service,
+keeping the batching, pooling and retry behaviour: each batch of
+references is sent as as few bulk requests as the maximum request size
+allows, over pooled keep-alive connections, rather than one request
+per entity.
+
+The protocol is JSON over HTTP/1.1:
+  - POST /locations and POST /traits, with a body of
+    {"references": [...]}, return an object mapping each reference
+    found to its location, or its space-separated trait IDs.
+  - POST /fields, with a body of {"references": [...], "fields": [...]},
+    where fields are those of `catalog.CatalogEntry`, returns an object
+    mapping each field to such an object, so that several fields are
+    looked up in one request.
+  - GET /references?start=<index>&count=<count> returns a list of at
+    most count references, from the start'th onwards, so that every
+    reference is listed a page at a time.
+  - GET /count returns {"count": <number of entities>}.
+"""
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.parse
+
+from .catalog import Catalog, CatalogEntry, parse_trait_set
+
+
+class RemoteCatalog(Catalog):  # pylint: disable=too-many-instance-attributes
+    """
+    A catalog looked up from an HTTP catalog service at `url`.
+
+    At most `max_connections` requests are in flight at once, over
+    connections that are kept open between requests. Batches are split
+    so that no request body exceeds roughly `max_request_bytes`.
+
+    Requests that fail with a connection error, a timeout or a
+    transient server error are retried up to `retries` times, waiting
+    `retry_backoff` seconds before the first retry, doubling with each
+    subsequent one, with jitter so that many clients don't retry in
+    lock step. A request that still fails raises `ConnectionError`.
+
+    `references` are listed `references_page_size` at a time, so that
+    neither the service nor the client need hold every reference in a
+    single response.
+    """
+
+    def __init__(
+        self,
+        url,
+        max_connections=8,
+        max_request_bytes=1 << 20,
+        retries=3,
+        retry_backoff=0.05,
+        timeout=10.0,
+        references_page_size=10000,
+    ):  # pylint: disable=too-many-arguments
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Catalog URL '{url}' is not an http(s) URL")
+        if max_connections < 1:
+            raise ValueError(f"Connection count must be positive, got {max_connections}")
+        if references_page_size < 1:
+            raise ValueError(f"Page size must be positive, got {references_page_size}")
+        self.__url = url
+        self.__path = parsed.path.rstrip("/")
+        self.__pool = _ConnectionPool(
+            http.client.HTTPSConnection
+            if parsed.scheme == "https"
+            else http.client.HTTPConnection,
+            parsed.hostname,
+            parsed.port,
+            max_connections,
+            timeout,
+        )
+        self.__max_request_bytes = max_request_bytes
+        self.__references_page_size = references_page_size
+        self.__retries = retries
+        self.__retry_backoff = retry_backoff
+        self.__trait_sets = {}
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__retried = 0
+
+    def __len__(self):
+        return self.__request("GET", "/count")["count"]
+
+    def references(self):
+        page_size = self.__references_page_size
+        start = 0
+        while True:
+            page = self.__request("GET", f"/references?start={start}&count={page_size}")
+            yield from page
+            # A short page is the last.
+            if len(page) < page_size:
+                return
+            start += len(page)
+
+    def locations(self, references):
+        return self.__lookup("/locations", references)
+
+    def traits(self, references):
+        trait_sets = self.__trait_sets
+        return {
+            reference: parse_trait_set(trait_sets, traits)
+            for reference, traits in self.__lookup("/traits", references).items()
+        }
+
+    def fields(self, references, fields):
+        found = {field: {} for field in fields}
+        for field in found:
+            if field not in CatalogEntry._fields:
+                raise KeyError(field)
+        if not found:
+            return found
+        trait_sets = self.__trait_sets
+        for chunk in _payload_chunks(references, self.__max_request_bytes):
+            chunk_found = self.__request(
+                "POST", "/fields", {"references": chunk, "fields": list(found)}
+            )
+            for field, values in chunk_found.items():
+                if field == "traits":
+                    values = {
+                        reference: parse_trait_set(trait_sets, traits)
+                        for reference, traits in values.items()
+                    }
+                found[field].update(values)
+        return found
+
+    def related(self, reference, relationship, start, count):
+        return self.__request(
+            "POST",
+            "/related",
+            {"reference": reference, "relationship": relationship, "start": start, "count": count},
+        )
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "requests": self.__requests,
+                "retries": self.__retried,
+                "connections": self.__pool.stats(),
+            }
+
+    def close(self):
+        self.__pool.close()
+
+    def __lookup(self, endpoint, references):
+        found = {}
+        for chunk in _payload_chunks(references, self.__max_request_bytes):
+            found.update(self.__request("POST", endpoint, {"references": chunk}))
+        return found
+
+    def __request(self, method, endpoint, payload=None):
+        body = None
+        headers = {}
+        if payload is not None:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            headers["Content-Type"] = "application/json"
+        attempt = 0
+        while True:
+            with self.__lock:
+                self.__requests += 1
+            try:
+                return self.__pool.request(method, self.__path + endpoint, body, headers)
+            except _TransientError as exc:
+                if attempt >= self.__retries:
+                    raise ConnectionError(
+                        f"Request to catalog service '{self.__url}' failed after"
+                        f" {attempt + 1} attempts: {exc}"
+                    ) from exc
+            with self.__lock:
+                self.__retried += 1
+            time.sleep(self.__retry_backoff * 2**attempt * random.uniform(0.5, 1.0))
+            attempt += 1
+
+
+# Server responses that indicate that the same request may succeed if
+# retried.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _TransientError(Exception):
+    """
+    A request failure that may not recur if the request is retried.
+    """
+
+
+class _ConnectionPool:
+    """
+    A bounded pool of keep-alive HTTP connections to a single server.
+    """
+
+    def __init__(
+        self, connection_type, host, port, size, timeout
+    ):  # pylint: disable=too-many-arguments
+        self.__connect = lambda: connection_type(host, port, timeout=timeout)
+        self.__slots = threading.BoundedSemaphore(size)
+        self.__lock = threading.Lock()
+        self.__idle = []
+        self.__opened = 0
+
+    def request(self, method, path, body, headers):
+        """
+        Make a request over an idle connection, opening a new one if
+        there are none, and return the decoded JSON response.
+
+        Raises `_TransientError` if the request may succeed if retried.
+        """
+        with self.__slots:
+            with self.__lock:
+                connection = self.__idle.pop() if self.__idle else None
+            if connection is None:
+                connection = self.__connect()
+                with self.__lock:
+                    self.__opened += 1
+            try:
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                # Includes a kept-alive connection that the server has
+                # since closed, which a fresh connection will resolve.
+                connection.close()
+                raise _TransientError(str(exc)) from exc
+            if response.will_close:
+                connection.close()
+            else:
+                with self.__lock:
+                    self.__idle.append(connection)
+        if response.status in _RETRY_STATUSES:
+            raise _TransientError(f"HTTP {response.status} {response.reason}")
+        if response.status != 200:
+            raise ConnectionError(f"Catalog service error: HTTP {response.status} {data!r}")
+        return json.loads(data)
+
+    def stats(self):
+        """
+        Return a dict of the number of connections opened, and idle.
+        """
+        with self.__lock:
+            return {"opened": self.__opened, "idle": len(self.__idle)}
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+        with self.__lock:
+            for connection in self.__idle:
+                connection.close()
+            self.__idle.clear()
+
+
+def _payload_chunks(references, max_bytes):
+    """
+    Split references into lists whose JSON encoding is roughly no more
+    than `max_bytes`, each holding at least one reference.
+    """
+    chunks = []
+    chunk = []
+    size = 0
+    for reference in references:
+        # Quotes and separator. Escaping isn't accounted for, as
+        # references are almost always plain ASCII.
+        reference_size = len(reference) + 3
+        if chunk and size + reference_size > max_bytes:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(reference)
+        size += reference_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+The settings understood by MyAssetManager, with their defaults, and
+the validation of the settings supplied by a host.
+
+Settings are usually supplied from the [manager.settings] table of an
+OpenAssetIO config file, so that each deployment can tune the manager
+to its workload, for example, a large resolve cache and several lookup
+workers for farm processes, but none for lightweight hosts, e.g.:
+
+    [manager]
+    identifier = "myorg.manager.my_asset_manager"
+
+    [manager.settings]
+    catalog_path = "${config_dir}/catalog.db"
+    resolve_cache_size = 100000
+    lookup_workers = 4
+
+Such a file is loaded by hosts through
+`hostApi.ManagerFactory.defaultManagerForInterface`, see
+https://openassetio.github.io/OpenAssetIO/glossary.html#default_config_var
+"""
+from typing import NamedTuple, Optional, Tuple, Union
+
+from openassetio.errors import ConfigurationException
+
+
+class Setting(NamedTuple):
+    """
+    The default value of a setting, which any value supplied for it
+    must match the type of, and the values it may take: at least
+    `minimum`, and less than `maximum`, for a number, or one of
+    `choices`, for a string.
+    """
+
+    default: Union[bool, int, float, str]
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    choices: Tuple[str, ...] = ()
+
+
+# The settings understood by the manager. Cached results are only ever
+# discarded by expiry, eviction, a call to flushCaches, or
+# re-initialization.
+SETTINGS = {
+    # Path to a SQLite catalog of the managed entities, see
+    # catalog.write_sqlite_catalog. If empty, a small in-memory catalog
+    # of example entities is used.
+    "catalog_path": Setting(""),
+    # Read the whole catalog at catalog_path, or each SQLite shard of
+    # catalog_shards, into memory when first used, in a compact form,
+    # and serve lookups from there rather than querying the file.
+    # flushCaches reloads it. See compact.CompactCatalog.
+    "catalog_in_memory": Setting(False),
+    # URL of a catalog service to look entities up from, rather than
+    # catalog_path, see remote.RemoteCatalog and catalog_server for a
+    # local stand-in.
+    "catalog_url": Setting(""),
+    # Comma-separated name=location pairs of catalogs, each a path or
+    # URL as for catalog_path or catalog_url, that each hold the
+    # entities assigned to them by a consistent hash of entity path,
+    # rather than a single catalog_path or catalog_url, see sharding.py.
+    # Shards are looked up concurrently.
+    "catalog_shards": Setting(""),
+    # Maximum number of concurrent requests to the catalog service, each
+    # over a pooled, kept-alive connection.
+    "remote_max_connections": Setting(8, minimum=1),
+    # Approximate maximum size of the body of each request to the
+    # catalog service, larger batches are split into several requests.
+    "remote_max_request_bytes": Setting(1 << 20, minimum=1),
+    # Number of times a request to the catalog service that fails
+    # transiently is retried.
+    "remote_retries": Setting(3, minimum=0),
+    # Seconds to wait before the first retry of a request, doubled for
+    # each subsequent retry.
+    "remote_retry_backoff": Setting(0.05, minimum=0),
+    # Seconds to wait for a response from the catalog service before
+    # retrying.
+    "remote_timeout": Setting(10.0, minimum=0.001),
+    # Path to a journal of the entities published by hosts, see
+    # publishing.Journal. It is created if it doesn't exist. If empty,
+    # entities are read-only, and publishing isn't supported.
+    "publish_journal_path": Setting(""),
+    # Seconds that a write to the publishing journal waits for
+    # registrations from other threads to join it, so that they share a
+    # single sync to disk.
+    "publish_commit_delay": Setting(0.0, minimum=0),
+    # Maximum number of resolve results to cache, 0 disables the cache.
+    "resolve_cache_size": Setting(0, minimum=0),
+    # Seconds after which a cached resolve result expires, 0 means
+    # results never expire.
+    "resolve_cache_ttl": Setting(0.0, minimum=0),
+    # Eviction policy of the resolve cache, either "lru" or "fifo".
+    "resolve_cache_policy": Setting("lru", choices=("lru", "fifo")),
+    # Number of references looked up in the catalog at a time when
+    # resolving, with the results of each page delivered to the host
+    # before the next is looked up. 0 looks up the whole batch at once.
+    "resolve_page_size": Setting(0, minimum=0),
+    # Number of threads used to look up large batches in the catalog
+    # concurrently, 1 disables concurrent lookups.
+    "lookup_workers": Setting(1, minimum=1),
+    # Number of references in each concurrently looked up chunk of a
+    # batch.
+    "lookup_chunk_size": Setting(10000, minimum=1),
+    # Seconds that the catalog lookups of a resolve or entityTraits
+    # batch may take, after which the entities not yet looked up fail,
+    # and the rest are delivered. 0 means lookups are unbounded. Hosts
+    # may override it per call, see budget.call_budget.
+    "lookup_budget": Setting(0.0, minimum=0),
+    # Path to a SQLite file in which to cache catalog entries for all
+    # processes on the machine configured with the same path, see
+    # shared_cache.SharedCacheCatalog. It is created if it doesn't
+    # exist. If empty, entries aren't shared. Entries aren't evicted,
+    # so the file grows until the caches are flushed.
+    "shared_cache_path": Setting(""),
+    # Have concurrent lookups of the same entity from different host
+    # threads wait for a single catalog lookup, see
+    # catalog.CoalescingCatalog.
+    "coalesce_lookups": Setting(False),
+    # Path to a snapshot, as written when persisting a context, see
+    # persistenceTokenForState. Entities it holds are served from it
+    # rather than the catalog, for all contexts.
+    "snapshot_path": Setting(""),
+    # Directory to write snapshots to when persisting a context. If
+    # empty, contexts don't record the entities served to them, and so
+    # can't be restored with the same data.
+    "snapshot_dir": Setting(""),
+    # Target false positive rate of a Bloom filter of every reference in
+    # the catalog, used to report missing entities without a catalog
+    # lookup. 0 disables the filter. It is built when the catalog is
+    # loaded, and rebuilt by flushCaches, see catalog.FilteredCatalog.
+    "missing_filter_false_positive_rate": Setting(0.0, minimum=0, maximum=1),
+    # Maximum number of references to remember as missing from the
+    # catalog, 0 disables the cache.
+    "missing_cache_size": Setting(0, minimum=0),
+    # Seconds for which a reference is remembered as missing, 0 means
+    # until evicted.
+    "missing_cache_ttl": Setting(10.0, minimum=0),
+    # Record the batch size, latency and success/error counts of each
+    # API call.
+    "instrumentation_enabled": Setting(False),
+    # Seconds between exports of recorded statistics, 0 disables
+    # periodic export.
+    "instrumentation_interval": Setting(60.0, minimum=0),
+    # File to append exported statistics to, as lines of JSON. If empty,
+    # they are logged to the host at debug severity.
+    "instrumentation_path": Setting(""),
+}
+
+
+def default_settings():
+    """
+    Return a dict of the default value of every setting.
+    """
+    return {name: setting.default for name, setting in SETTINGS.items()}
+
+
+def validated_settings(settings, manager_settings):
+    """
+    Return a copy of the `settings` dict, updated with the values of
+    the supplied manager settings, once they are validated.
+
+    Integers are accepted for settings whose default is a float, as
+    config files often omit the fractional part, and are converted.
+
+    Raises `KeyError` for settings that aren't understood, and
+    `ConfigurationException` for values of the wrong type, or out of
+    range.
+    """
+    unknown_settings = set(manager_settings) - set(SETTINGS)
+    if unknown_settings:
+        raise KeyError(f"MyAssetManager does not support the settings: {sorted(unknown_settings)}")
+    settings = dict(settings)
+    for name, value in manager_settings.items():
+        settings[name] = _validated_value(name, SETTINGS[name], value)
+    return settings
+
+
+def _validated_value(name, setting, value):
+    expected_type = type(setting.default)
+    if expected_type is float and type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        value = float(value)
+    # Compared exactly, as bool is a subclass of int.
+    if type(value) is not expected_type:  # pylint: disable=unidiomatic-typecheck
+        raise ConfigurationException(
+            f"Setting '{name}' must be of type {expected_type.__name__},"
+            f" got {type(value).__name__} {value!r}"
+        )
+    if setting.minimum is not None and value < setting.minimum:
+        raise ConfigurationException(
+            f"Setting '{name}' must be at least {setting.minimum}, got {value!r}"
+        )
+    if setting.maximum is not None and value >= setting.maximum:
+        raise ConfigurationException(
+            f"Setting '{name}' must be less than {setting.maximum}, got {value!r}"
+        )
+    if setting.choices and value not in setting.choices:
+        raise ConfigurationException(
+            f"Setting '{name}' must be one of {list(setting.choices)}, got {value!r}"
+        )
+    return value
@@ -0,0 +1,348 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Sharding of the catalog across several backend instances, such as
+separate SQLite files, or catalog services, so that the resolve rate
+isn't bounded by what a single backend can serve.
+
+Each entity belongs to one shard, chosen by a consistent hash of its
+entity path, so references to the same entity with different
+query parameters share a shard. Each shard owns many points on a hash
+ring, and an entity belongs to the shard owning the first point at or
+after the hash of its path. Adding or removing a shard so only moves
+the entities between it and the others, about 1/N of them, rather than
+reshuffling the whole catalog.
+
+Shards are named, and the names, not their locations, determine the
+placement of entities, so shards may be moved without rebalancing. A
+set of SQLite shards is written by `write_sqlite_shards`. To add or
+remove shards of a catalog in use, without any entity going missing:
+
+ 1. `rebalance_sqlite_shards(new_shards, removed_shards, prune=False)`
+    copies each entity to its shard amongst the new set, leaving it
+    where it was.
+ 2. The manager is re-initialized with the new `catalog_shards`.
+ 3. `rebalance_sqlite_shards(new_shards, removed_shards)` removes each
+    entity from the shards it no longer belongs to.
+"""
+import bisect
+import collections
+import hashlib
+import itertools
+import sqlite3
+import threading
+import zlib
+
+from openassetio.errors import ConfigurationException
+
+from .catalog import Catalog, write_sqlite_catalog
+from .relationships import write_sqlite_relationships
+
+# The number of points on the hash ring owned by each shard. More points
+# spread entities more evenly, at the cost of a larger ring to search.
+POINTS_PER_SHARD = 128
+
+
+def parse_shards(value):
+    """
+    Parse a `catalog_shards` setting, a comma-separated list of
+    name=location pairs, where a location is the path of a SQLite
+    catalog, or the URL of a catalog service, e.g.:
+
+        "a=/catalogs/a.db, b=/catalogs/b.db, c=http://catalog-c:8080"
+
+    Returns a dict of shard name to location.
+    """
+    shards = {}
+    for shard in value.split(","):
+        name, sep, location = (part.strip() for part in shard.partition("="))
+        if not (name and sep and location):
+            raise ConfigurationException(
+                f"Catalog shard '{shard.strip()}' is not of the form name=location"
+            )
+        if name in shards:
+            raise ConfigurationException(f"Catalog shard '{name}' is given more than once")
+        shards[name] = location
+    return shards
+
+
+def shard_key(reference):
+    """
+    Return the key of the supplied entity reference string by which it
+    is assigned a shard: the reference up to the end of its entity
+    path, without any query string.
+    """
+    # Split directly, rather than parsed, as every reference of every
+    # batch is routed, and large batches would evict the parse cache.
+    return reference.partition("?")[0]
+
+
+# Both hashes are stable across processes, unlike `hash`, so that every
+# process places entities alike, and are 32-bit, sharing the ring.
+
+
+def _point_hash(name):
+    # The points of a shard have similar names, which CRC-32 would
+    # cluster on the ring.
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=4).digest(), "big")
+
+
+def _key_hash(key):
+    # Several times cheaper than a cryptographic hash, and, with the
+    # points spread evenly, spreads entities evenly between shards.
+    return zlib.crc32(key.encode())
+
+
+class HashRing:
+    """
+    A consistent hash ring of the named shards, each owning
+    `points_per_shard` points.
+    """
+
+    def __init__(self, names, points_per_shard=POINTS_PER_SHARD):
+        names = list(names)
+        if not names:
+            raise ValueError("A hash ring needs at least one shard")
+        points = sorted(
+            (_point_hash(f"{name}#{point}"), name)
+            for name in names
+            for point in range(points_per_shard)
+        )
+        self.__hashes = [point_hash for point_hash, _ in points]
+        self.__owners = [name for _, name in points]
+
+    def owner(self, reference):
+        """
+        Return the name of the shard that the supplied entity reference
+        string belongs to.
+        """
+        idx = bisect.bisect_left(self.__hashes, _key_hash(shard_key(reference)))
+        return self.__owners[idx % len(self.__owners)]
+
+    def partition(self, references):
+        """
+        Return a dict of shard name to a list of the supplied entity
+        reference strings that belong to it, omitting shards that none
+        belong to.
+        """
+        partitions = collections.defaultdict(list)
+        for reference in references:
+            partitions[self.owner(reference)].append(reference)
+        return partitions
+
+
+class ShardedCatalog(Catalog):
+    """
+    A catalog of the entities held by several shards, each a catalog
+    of those entities that belong to it, by name.
+
+    Each batch is split by shard, and the shards looked up concurrently
+    on a pool of `max_workers` worker threads, by default as many as
+    `concurrent.futures.ThreadPoolExecutor` would start, with the
+    results merged before they are returned. A batch that belongs to a
+    single shard is looked up directly on the calling thread.
+
+    Shards may be added and removed whilst in use. Entities must be
+    moved between shards to match, see `rebalance_sqlite_shards`.
+    """
+
+    def __init__(self, shards, max_workers=None, points_per_shard=POINTS_PER_SHARD):
+        # Deferred, as it is comparatively slow to import and only
+        # needed when sharding has been configured.
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.__points_per_shard = points_per_shard
+        # The ring and shards are replaced together, so that each
+        # lookup routes consistently, without taking a lock.
+        self.__routing = (HashRing(shards, points_per_shard), dict(shards))
+        self.__lock = threading.Lock()
+        self.__executor = ThreadPoolExecutor(max_workers, thread_name_prefix="MyAssetManagerShard")
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.__routing[1].values())
+
+    def locations(self, references):
+        return self.__lookup(lambda shard, refs: shard.locations(refs), references)
+
+    def traits(self, references):
+        return self.__lookup(lambda shard, refs: shard.traits(refs), references)
+
+    def fields(self, references, fields):
+        found = {field: {} for field in fields}
+        for shard_found in self.__map(lambda shard, refs: shard.fields(refs, fields), references):
+            for field, values in shard_found.items():
+                found[field].update(values)
+        return found
+
+    def related(self, reference, relationship, start, count):
+        ring, shards = self.__routing
+        return shards[ring.owner(reference)].related(reference, relationship, start, count)
+
+    def references(self):
+        return itertools.chain.from_iterable(
+            shard.references() for shard in self.__routing[1].values()
+        )
+
+    def shards(self):
+        """
+        Return a dict of the shards, by name.
+        """
+        return dict(self.__routing[1])
+
+    def add_shard(self, name, catalog):
+        """
+        Add a shard, to which the entities that belong to it are routed
+        from then on.
+        """
+        with self.__lock:
+            shards = self.__routing[1]
+            if name in shards:
+                raise ValueError(f"Shard '{name}' already exists")
+            shards = {**shards, name: catalog}
+            self.__routing = (HashRing(shards, self.__points_per_shard), shards)
+
+    def remove_shard(self, name):
+        """
+        Remove a shard, routing the entities that belonged to it to the
+        remaining shards from then on. Returns the removed catalog,
+        which is left open for any lookups still in progress.
+        """
+        with self.__lock:
+            shards = dict(self.__routing[1])
+            if len(shards) == 1 and name in shards:
+                raise ValueError("The last shard can't be removed")
+            catalog = shards.pop(name)
+            self.__routing = (HashRing(shards, self.__points_per_shard), shards)
+        return catalog
+
+    def refresh(self):
+        for shard in self.__routing[1].values():
+            shard.refresh()
+
+    def stats(self):
+        return {name: shard.stats() for name, shard in self.__routing[1].items()}
+
+    def close(self):
+        self.__executor.shutdown()
+        for shard in self.__routing[1].values():
+            shard.close()
+
+    def __lookup(self, lookup, references):
+        found = {}
+        for shard_found in self.__map(lookup, references):
+            found.update(shard_found)
+        return found
+
+    def __map(self, lookup, references):
+        # The results of `lookup` for each shard, with the references
+        # that belong to it.
+        ring, shards = self.__routing
+        partitions = ring.partition(references)
+        if len(partitions) <= 1:
+            return [lookup(shards[name], refs) for name, refs in partitions.items()]
+        return self.__executor.map(
+            lambda partition: lookup(shards[partition[0]], partition[1]), partitions.items()
+        )
+
+
+def write_sqlite_shards(shards, entries, relationships=()):
+    """
+    Write a set of SQLite catalogs, one per shard, for use with
+    `ShardedCatalog`, placing each entity in the shard it belongs to.
+
+    `shards` is a dict of shard name to path. `entries` and
+    `relationships` are as for `catalog.write_sqlite_catalog` and
+    `relationships.write_sqlite_relationships`. They are written to the
+    first shard, then moved to the shards they belong to by
+    `rebalance_sqlite_shards`.
+    """
+    first_path = next(iter(shards.values()))
+    write_sqlite_catalog(first_path, entries)
+    write_sqlite_relationships(first_path, relationships)
+    rebalance_sqlite_shards(shards)
+
+
+def rebalance_sqlite_shards(shards, retired=None, prune=True):
+    """
+    Move the entities of a set of SQLite shards, see
+    `write_sqlite_shards`, to the shards they belong to amongst
+    `shards`, a dict of shard name to path, creating any shards that
+    don't yet exist. Returns the number of entities moved.
+
+    The entities of any shards being removed, in `retired`, a dict of
+    shard name to path, are moved to the remaining shards. Retired
+    shards are left empty, and may be deleted afterwards.
+
+    Relationships belong to the shard of the entity they relate from,
+    and are moved with it. Entities are copied to the shard they belong
+    to before they are removed from the shard they were in. If `prune`
+    is False, they aren't removed, so that a catalog using either the
+    previous or the new shards finds every entity, see the module
+    docstring.
+    """
+    ring = HashRing(shards)
+    for path in shards.values():
+        write_sqlite_catalog(path, ())
+        write_sqlite_relationships(path, ())
+    moved = 0
+    for name, path in {**(retired or {}), **shards}.items():
+        # Rows are moved by SQLite itself, with the ring as a function,
+        # so the shards needn't be read into memory.
+        connection = sqlite3.connect(path, isolation_level=None)
+        try:
+            connection.create_function("shard", 1, ring.owner, deterministic=True)
+            connection.execute(
+                "CREATE TEMP TABLE moves AS SELECT ref, shard(ref) AS shard"
+                " FROM entities WHERE shard(ref) != ?",
+                (name,),
+            )
+            has_relationships = (
+                connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'relationships'"
+                ).fetchone()
+                is not None
+            )
+            relationship_moves = "SELECT NULL WHERE 0"
+            if has_relationships:
+                connection.execute(
+                    "CREATE TEMP TABLE relationship_moves AS SELECT DISTINCT ref,"
+                    " shard(ref) AS shard FROM relationships WHERE shard(ref) != ?",
+                    (name,),
+                )
+                relationship_moves = "SELECT ref FROM relationship_moves WHERE shard = ?"
+            for owner, owner_path in shards.items():
+                if owner == name:
+                    continue
+                connection.execute("ATTACH DATABASE ? AS owner", (owner_path,))
+                connection.execute("BEGIN")
+                moved += connection.execute(
+                    "INSERT OR REPLACE INTO owner.entities SELECT entities.* FROM entities"
+                    " JOIN moves USING (ref) WHERE moves.shard = ?",
+                    (owner,),
+                ).rowcount
+                if has_relationships:
+                    connection.execute(
+                        f"DELETE FROM owner.relationships WHERE ref IN ({relationship_moves})",
+                        (owner,),
+                    )
+                    connection.execute(
+                        "INSERT INTO owner.relationships SELECT * FROM relationships"
+                        f" WHERE ref IN ({relationship_moves})",
+                        (owner,),
+                    )
+                connection.execute("COMMIT")
+                connection.execute("DETACH DATABASE owner")
+            if prune:
+                connection.execute("BEGIN")
+                connection.execute("DELETE FROM entities WHERE ref IN (SELECT ref FROM moves)")
+                if has_relationships:
+                    connection.execute(
+                        "DELETE FROM relationships"
+                        " WHERE ref IN (SELECT ref FROM relationship_moves)"
+                    )
+                connection.execute("COMMIT")
+        finally:
+            connection.close()
+    return moved
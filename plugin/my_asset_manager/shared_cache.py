@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+A cache of catalog entries in a SQLite file, shared by every process
+on a machine, so that entities looked up by one process needn't be
+looked up again by the others.
+"""
+import pathlib
+import sqlite3
+import threading
+
+from .catalog import Catalog, CatalogEntry, by_field, forwarded_pages, parse_trait_set
+from .sqlite_connections import (
+    SQLITE_MAX_QUERY_PARAMS,
+    SQLITE_MMAP_SIZE,
+    SqliteConnections,
+    chunks,
+)
+
+
+class SharedCacheCatalog(Catalog):  # pylint: disable=too-many-instance-attributes
+    """
+    Wraps another catalog, caching the entries it returns in a SQLite
+    file shared by every process on the machine that is configured
+    with the same `path`.
+
+    Lookups are served from the file first, and only references it
+    doesn't hold are looked up in the wrapped catalog. The location and
+    trait set of each entity found are then written to the file, so
+    that other processes needn't look it up. The file is memory-mapped,
+    so entries are read from pages shared through the OS page cache,
+    rather than each process holding its own copy.
+
+    Any process may populate the file. SQLite serializes writers, and
+    in its write-ahead log mode, readers are never blocked by them and
+    always see a consistent snapshot. If a write can't be made within
+    `_kWriteTimeout`, it is skipped, as the entries are only a cache.
+
+    Entries are tagged with the version of the cache that was current
+    when they were looked up. `invalidate` increments the version,
+    which immediately hides all existing entries from every process,
+    including those being written concurrently from lookups made
+    before the invalidation.
+
+    Entries are never evicted, so the file grows with the number of
+    distinct entities looked up, until `invalidate` removes those of
+    earlier versions. Hosts with long-lived caches should point
+    `shared_cache_path` at a file that is periodically removed, or call
+    `flushCaches`.
+    """
+
+    # Seconds to wait for another process to finish writing.
+    _kWriteTimeout = 0.05
+
+    def __init__(self, catalog, path):
+        self.__catalog = catalog
+        self.__connections = SqliteConnections(
+            pathlib.Path(path).absolute().as_uri(),
+            [
+                f"mmap_size={SQLITE_MMAP_SIZE}",
+                f"busy_timeout={int(self._kWriteTimeout * 1000)}",
+                # The entries can always be looked up again, so there's
+                # no need to wait for them to reach the disk.
+                "synchronous=OFF",
+            ],
+        )
+        _create_shared_cache(pathlib.Path(path).absolute().as_uri())
+        self.__trait_sets = {}
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__writes = 0
+        self.__skipped_writes = 0
+
+    def __len__(self):
+        return len(self.__catalog)
+
+    def locations(self, references):
+        return self.fields(references, ["location"])["location"]
+
+    def traits(self, references):
+        return self.fields(references, ["traits"])["traits"]
+
+    def fields(self, references, fields):
+        references = list(references)
+        found, version = self.__cached(references)
+        missed = [ref for ref in references if ref not in found]
+        if missed:
+            found.update(
+                self.__populate(self.__catalog.fields(missed, CatalogEntry._fields), version)
+            )
+        return by_field(found, fields)
+
+    def field_pages(self, references, fields, page_size):
+        # Entries looked up in the wrapped catalog are written at the
+        # version of the cache when the first page was read, so that
+        # they are hidden if it is invalidated in the meantime.
+        versions = []
+
+        def split(page):
+            found, version = self.__cached(page)
+            versions.append(version)
+            return list(found), by_field(found, fields), [ref for ref in page if ref not in found]
+
+        return forwarded_pages(
+            self.__catalog,
+            references,
+            CatalogEntry._fields,
+            page_size,
+            split,
+            lambda page, found: by_field(self.__populate(found, versions[0]), fields),
+        )
+
+    def related(self, reference, relationship, start, count):
+        return self.__catalog.related(reference, relationship, start, count)
+
+    def references(self):
+        return self.__catalog.references()
+
+    def refresh(self):
+        self.__catalog.refresh()
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Hide all existing entries from every process using the file.
+        """
+        connection = self.__connections.get()
+        with connection:
+            # Incremented in place, as the first statement of the
+            # transaction, so that the write lock is held from the
+            # start, and concurrent invalidations each take effect.
+            connection.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+            (version,) = connection.execute(_SHARED_CACHE_VERSION_QUERY).fetchone()
+            connection.execute("DELETE FROM entities WHERE version < ?", (version,))
+
+    def stats(self):
+        with self.__lock:
+            stats = {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "writes": self.__writes,
+                "skipped_writes": self.__skipped_writes,
+            }
+        catalog_stats = self.__catalog.stats()
+        if catalog_stats:
+            stats["catalog"] = catalog_stats
+        return stats
+
+    def close(self):
+        self.__connections.close()
+        self.__catalog.close()
+
+    def __cached(self, references):
+        """
+        Return a dict of the entries in the file for the supplied
+        references, and the version of the cache they were read at.
+        """
+        connection = self.__connections.get()
+        trait_sets = self.__trait_sets
+        found = {}
+        # Reading the version and entries in one transaction guarantees
+        # that they are consistent with each other.
+        with connection:
+            connection.execute("BEGIN")
+            (version,) = connection.execute(_SHARED_CACHE_VERSION_QUERY).fetchone()
+            for chunk in chunks(references, SQLITE_MAX_QUERY_PARAMS - 1):
+                placeholders = ",".join("?" * len(chunk))
+                for reference, location, traits in connection.execute(
+                    "SELECT ref, location, traits FROM entities"
+                    f" WHERE version = ? AND ref IN ({placeholders})",
+                    [version, *chunk],
+                ):
+                    found[reference] = CatalogEntry(location, parse_trait_set(trait_sets, traits))
+        with self.__lock:
+            self.__hits += len(found)
+            self.__misses += len(references) - len(found)
+        return found, version
+
+    def __populate(self, found, version):
+        """
+        Write the entities found in the wrapped catalog, as returned by
+        its `fields`, to the file at the supplied version. Returns a
+        dict of reference to `CatalogEntry` of the entities found.
+        """
+        locations = found["location"]
+        entries = {
+            ref: CatalogEntry(locations.get(ref), trait_set)
+            for ref, trait_set in found["traits"].items()
+        }
+        if entries:
+            try:
+                with self.__connections.get() as connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)",
+                        (
+                            (ref, version, entry.location, " ".join(sorted(entry.traits)))
+                            for ref, entry in entries.items()
+                        ),
+                    )
+                written = True
+            except sqlite3.OperationalError:
+                # Another process held the write lock for too long.
+                written = False
+            with self.__lock:
+                if written:
+                    self.__writes += 1
+                else:
+                    self.__skipped_writes += 1
+        return entries
+
+
+_SHARED_CACHE_VERSION_QUERY = "SELECT value FROM meta WHERE key = 'version'"
+
+
+def _create_shared_cache(uri):
+    """
+    Create the tables of a `SharedCacheCatalog`, if another process
+    hasn't already.
+    """
+    # Processes on a machine are often started together, so allow
+    # longer than usual for the others to finish creating the tables.
+    connection = sqlite3.connect(uri, uri=True, timeout=10)
+    try:
+        with connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta"
+                " (key TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute("INSERT OR IGNORE INTO meta VALUES ('version', 0)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities (ref TEXT PRIMARY KEY,"
+                " version INTEGER NOT NULL, location TEXT, traits TEXT NOT NULL) WITHOUT ROWID"
+            )
+    finally:
+        connection.close()
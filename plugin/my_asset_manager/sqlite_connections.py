@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Per-thread connections to SQLite databases, as used by the SQLite
+backed catalogs, so that lookups from concurrent host threads don't
+serialize on a single connection, and the limits that lookups through
+them work within.
+"""
+import sqlite3
+import threading
+import weakref
+
+# SQLite limits the number of parameters that can be bound to a single
+# statement, so batch lookups are split into chunks.
+SQLITE_MAX_QUERY_PARAMS = 900
+# Upper bound on the amount of a database file that SQLite will access
+# through a memory map rather than read() calls.
+SQLITE_MMAP_SIZE = 1 << 30
+
+
+def chunks(references, size):
+    """
+    Return a list of lists of at most `size` of the supplied references,
+    such as to bind at most `SQLITE_MAX_QUERY_PARAMS` to a statement.
+    """
+    references = list(references)
+    return [references[start : start + size] for start in range(0, len(references), size)]
+
+
+class SqliteConnections:
+    """
+    Per-thread connections to a single SQLite database, each configured
+    with the supplied pragmas when first used.
+
+    A thread's connection is closed when the thread exits, so that hosts
+    that call from many short-lived threads don't accumulate an open
+    file, and memory map, per thread.
+    """
+
+    def __init__(self, uri, pragmas=()):
+        self.__uri = uri
+        self.__pragmas = list(pragmas)
+        self.__local = threading.local()
+        # Re-entrant, as a connection may be released by the garbage
+        # collector on a thread that already holds the lock.
+        self.__lock = threading.RLock()
+        self.__connections = set()
+
+    def get(self):
+        """
+        Return the calling thread's connection.
+        """
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.__uri, uri=True, check_same_thread=False)
+            for pragma in self.__pragmas:
+                connection.execute(f"PRAGMA {pragma}")
+            with self.__lock:
+                self.__connections.add(connection)
+            # Thread-local values are released when their thread exits,
+            # so the connection is closed along with the token.
+            token = _ThreadToken()
+            weakref.finalize(token, _release, self.__connections, self.__lock, connection)
+            self.__local.token = token
+            self.__local.connection = connection
+        return connection
+
+    def close(self):
+        """
+        Close the connections of all threads.
+        """
+        with self.__lock:
+            for connection in self.__connections:
+                connection.close()
+            self.__connections.clear()
+        self.__local = threading.local()
+
+
+class _ThreadToken:  # pylint: disable=too-few-public-methods
+    """
+    Held by a thread for as long as it lives, as the weak reference
+    target for closing its connection.
+    """
+
+
+def _release(connections, lock, connection):
+    # Close a thread's connection, unless it was already closed along
+    # with all the others.
+    with lock:
+        if connection in connections:
+            connections.discard(connection)
+            connection.close()
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Manager state, shared by a context and its children, and its
+persistence as snapshots of the entities it has seen.
+
+A state created with a `Recording` keeps the catalog entries served
+to its contexts. Persisting the state writes them to a snapshot file,
+and the persistence token names that file. A state restored from the
+token serves lookups from the snapshot before the live catalog, so
+that, for example, a farm job resolves exactly the data that the
+artist who submitted it saw, without returning to the backend.
+"""
+import functools
+import json
+import os
+import threading
+import uuid
+
+from openassetio.errors import InputValidationException
+from openassetio.managerApi import ManagerStateBase
+
+
+class Recording:
+    """
+    The catalog entries served to the contexts sharing a state.
+
+    Locations and trait sets are recorded separately, as `resolve` and
+    `entityTraits` each only see one of them. A value of None records
+    that a reference was served, but its value wasn't seen, for
+    example because it came from the resolve cache.
+    """
+
+    def __init__(self):
+        self.locations = _RecordedValues()
+        self.traits = _RecordedValues()
+        self.__lock = threading.Lock()
+        self.__persisted = None
+
+    def values(self, field):
+        """
+        Return the dict of recorded values of a `catalog.CatalogEntry`
+        field, by reference.
+        """
+        return {"location": self.locations, "traits": self.traits}[field]
+
+    def entries(self, live_catalog):
+        """
+        Return a dict of reference to `catalog.CatalogEntry` for every
+        recorded entity, looking up any values not seen in the supplied
+        catalog.
+        """
+        # pylint: disable=import-outside-toplevel
+        from .catalog import CatalogEntry
+
+        locations = dict(self.locations)
+        trait_sets = dict(self.traits)
+        references = locations.keys() | trait_sets.keys()
+        locations.update(
+            live_catalog.locations([ref for ref in references if locations.get(ref) is None])
+        )
+        trait_sets.update(
+            live_catalog.traits([ref for ref in references if trait_sets.get(ref) is None])
+        )
+        return {
+            ref: CatalogEntry(locations.get(ref), trait_set)
+            for ref, trait_set in trait_sets.items()
+            if trait_set is not None
+        }
+
+    def persist(self, directory, live_catalog):
+        """
+        Write the recorded entries to a new snapshot in `directory`,
+        returning its path. If nothing has been recorded since the last
+        call, the previous snapshot's path is returned instead, or None
+        if nothing has been recorded at all.
+        """
+        # pylint: disable=import-outside-toplevel
+        from .catalog import write_sqlite_catalog
+
+        with self.__lock:
+            # Read before the entries are, so that any changes made
+            # whilst they are written are persisted by the next call.
+            changes = (self.locations.changes, self.traits.changes)
+            if changes == (0, 0):
+                return None
+            if self.__persisted is not None and self.__persisted[0] == changes:
+                return self.__persisted[1]
+            path = os.path.join(directory, f"{uuid.uuid4().hex}.snapshot")
+            # Written under a temporary name, so that a snapshot is
+            # never seen partially written.
+            partial_path = f"{path}.partial"
+            write_sqlite_catalog(partial_path, self.entries(live_catalog).items())
+            os.replace(partial_path, path)
+            self.__persisted = (changes, path)
+            return path
+
+
+# Distinguishes a reference that hasn't been recorded from one recorded
+# with a value of None.
+_UNRECORDED = object()
+
+
+class _RecordedValues(dict):
+    """
+    The recorded values of a field, by reference, counting the writes
+    that change them, so that a `Recording` can tell whether it has
+    changed since it was last persisted.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.changes = 0
+
+    def __setitem__(self, reference, value):
+        if self.get(reference, _UNRECORDED) != value:
+            self.changes += 1
+        super().__setitem__(reference, value)
+
+    def setdefault(self, reference, default=None):
+        if reference not in self:
+            self.changes += 1
+        return super().setdefault(reference, default)
+
+    def update(self, values):  # pylint: disable=arguments-differ
+        for reference, value in values.items():
+            self[reference] = value
+
+
+class ManagerState(ManagerStateBase):  # pylint: disable=too-few-public-methods
+    """
+    The state of a context, and any children created from it.
+
+    `recording` is a `Recording` of the entries served, or None if
+    recording is disabled. `snapshot` is a catalog that lookups are
+    served from before the live catalog, or None, and `snapshot_path`
+    the file it was loaded from.
+    """
+
+    def __init__(self, recording=None, snapshot=None, snapshot_path=None):
+        ManagerStateBase.__init__(self)
+        self.recording = recording
+        self.snapshot = snapshot
+        self.snapshot_path = snapshot_path
+
+    def child(self):
+        """
+        Create a state for a child context, which shares this state's
+        recording and snapshot.
+        """
+        return ManagerState(self.recording, self.snapshot, self.snapshot_path)
+
+
+def persistence_token(state, snapshot_dir, live_catalog):
+    """
+    Return a token from which `state` can be restored by
+    `state_from_persistence_token`, writing a snapshot of its recorded
+    entries to `snapshot_dir` if it has a recording.
+    """
+    snapshot_path = state.snapshot_path
+    if state.recording is not None:
+        snapshot_path = state.recording.persist(snapshot_dir, live_catalog)
+    return json.dumps({"snapshot": snapshot_path})
+
+
+def state_from_persistence_token(token):
+    """
+    Restore a state from a token returned by `persistence_token`.
+    """
+    try:
+        snapshot_path = json.loads(token)["snapshot"]
+    except (ValueError, TypeError, KeyError) as exc:
+        raise InputValidationException(f"Invalid persistence token '{token}'") from exc
+    if snapshot_path is None:
+        return ManagerState()
+    if not os.path.isfile(snapshot_path):
+        raise InputValidationException(f"Snapshot '{snapshot_path}' does not exist")
+    return ManagerState(snapshot=_open_snapshot(snapshot_path), snapshot_path=snapshot_path)
+
+
+@functools.lru_cache(maxsize=16)
+def _open_snapshot(path):
+    """
+    Open the snapshot at `path`. Snapshots are never modified once
+    written, so all states restored from the same snapshot share it.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .catalog import SqliteCatalog
+
+    return SqliteCatalog(path)
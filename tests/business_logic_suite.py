@@ -8,9 +8,12 @@ MyAssetManager behaves with the correct business logic.
 
 # pylint: disable=invalid-name, missing-function-docstring, missing-class-docstring
 
-from openassetio.access import ResolveAccess, EntityTraitsAccess
+from openassetio.access import PolicyAccess, ResolveAccess, EntityTraitsAccess
+from openassetio.errors import BatchElementError
+from openassetio.hostApi import Manager
 from openassetio.test.manager.harness import FixtureAugmentedTestCase
 from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.managementPolicy import ManagedTrait
 from openassetio_mediacreation.traits.usage import EntityTrait
 
 
@@ -59,6 +62,50 @@ class Test_resolve(FixtureAugmentedTestCase):
             for property_, value in self.__test_entity[1][trait].items():
                 self.assertEqual(result[0].getTraitProperty(trait, property_), value)
 
+    def test_when_batch_has_duplicate_refs_then_each_index_gets_own_result(self):
+        refs = [
+            self._manager.createEntityReference(ref_str)
+            for ref_str in (
+                self.__test_entity[0],
+                "my_asset_manager:///missing",
+                self.__test_entity[0],
+                "my_asset_manager:///anAsset?unsupportedQueryParam",
+                "my_asset_manager:///missing",
+                "my_asset_manager:///anAsset?unsupportedQueryParam",
+            )
+        ]
+
+        results = self._manager.resolve(
+            refs,
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            self.createTestContext(),
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+
+        self.assertEqual(len(results), 6)
+        expected_location = self.__test_entity[1][LocatableContentTrait.kId]["location"]
+        for idx in (0, 2):
+            self.assertEqual(
+                results[idx].getTraitProperty(LocatableContentTrait.kId, "location"),
+                expected_location,
+            )
+        for idx in (1, 4):
+            self.assertEqual(results[idx].code, BatchElementError.ErrorCode.kEntityResolutionError)
+            self.assertEqual(
+                results[idx].message, "Entity 'my_asset_manager:///missing' not found"
+            )
+        for idx in (3, 5):
+            self.assertEqual(
+                results[idx].code, BatchElementError.ErrorCode.kMalformedEntityReference
+            )
+
+        results[0].setTraitProperty(LocatableContentTrait.kId, "location", "modified")
+        self.assertEqual(
+            results[2].getTraitProperty(LocatableContentTrait.kId, "location"),
+            expected_location,
+        )
+
 
 class Test_entityTraits(FixtureAugmentedTestCase):
     """
@@ -93,3 +140,65 @@ class Test_entityTraits(FixtureAugmentedTestCase):
         self.assertTrue(len(results) == 1)
         expected_trait_set = {EntityTrait.kId, LocatableContentTrait.kId}
         assert results[0] == expected_trait_set
+
+    def test_when_batch_has_duplicate_refs_then_each_index_gets_own_result(self):
+        refs = [
+            self._manager.createEntityReference(ref_str)
+            for ref_str in (
+                "my_asset_manager:///anAsset",
+                "my_asset_manager:///missing",
+                "my_asset_manager:///anAsset",
+                "my_asset_manager:///missing",
+            )
+        ]
+
+        results = self._manager.entityTraits(
+            refs,
+            EntityTraitsAccess.kRead,
+            self.createTestContext(),
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+
+        self.assertEqual(len(results), 4)
+        expected_trait_set = {EntityTrait.kId, LocatableContentTrait.kId}
+        self.assertEqual(results[0], expected_trait_set)
+        self.assertEqual(results[2], expected_trait_set)
+        self.assertEqual(results[1].code, BatchElementError.ErrorCode.kEntityResolutionError)
+        self.assertEqual(results[3].code, BatchElementError.ErrorCode.kEntityResolutionError)
+
+
+class Test_managementPolicy(FixtureAugmentedTestCase):
+    """
+    Test suite for the managementPolicy business logic of
+    MyAssetManager
+    """
+
+    def test_when_trait_sets_repeated_then_each_policy_is_independent(self):
+        trait_sets = [{LocatableContentTrait.kId}, {EntityTrait.kId}] * 2
+        context = self.createTestContext()
+
+        policies = self._manager.managementPolicy(trait_sets, PolicyAccess.kRead, context)
+
+        self.assertEqual(len(policies), 4)
+        self.assertTrue(policies[0].hasTrait(ManagedTrait.kId))
+        self.assertTrue(policies[0].hasTrait(LocatableContentTrait.kId))
+        self.assertFalse(policies[1].hasTrait(ManagedTrait.kId))
+        self.assertEqual(policies[0], policies[2])
+        self.assertEqual(policies[1], policies[3])
+
+        policies[0].addTrait("aHostTrait")
+
+        self.assertFalse(policies[2].hasTrait("aHostTrait"))
+        repeat_policies = self._manager.managementPolicy(
+            trait_sets[:1], PolicyAccess.kRead, context
+        )
+        self.assertFalse(repeat_policies[0].hasTrait("aHostTrait"))
+
+    def test_when_access_is_not_read_then_policy_is_unmanaged(self):
+        context = self.createTestContext()
+
+        policies = self._manager.managementPolicy(
+            [{LocatableContentTrait.kId}], PolicyAccess.kWrite, context
+        )
+
+        self.assertFalse(policies[0].hasTrait(ManagedTrait.kId))
@@ -11,8 +11,12 @@ Shared fixtures for MyAssetManager pytest coverage.
 import os
 import pytest
 
+from openassetio import hostApi, log
+from openassetio.pluginSystem import PythonPluginSystemManagerImplementationFactory
 from openassetio.test.manager import harness
 
+from my_asset_manager import catalog
+
 
 @pytest.fixture
 def harness_fixtures(base_dir):
@@ -31,3 +35,74 @@ def base_dir():
     codebase.
     """
     return os.path.dirname(os.path.dirname(__file__))
+
+
+@pytest.fixture
+def entries():
+    """
+    Provides a small set of catalog entries, including an entity
+    without a location.
+    """
+    return {
+        "my_asset_manager:///a": catalog.CatalogEntry("file:///a", frozenset({"t1", "t2"})),
+        "my_asset_manager:///b": catalog.CatalogEntry("file:///b", frozenset({"t1"})),
+        "my_asset_manager:///c": catalog.CatalogEntry(None, frozenset({"t2"})),
+    }
+
+
+@pytest.fixture
+def sqlite_path(tmp_path, entries):
+    """
+    Provides the path to a SQLite catalog of the `entries` fixture.
+    """
+    path = str(tmp_path / "catalog.db")
+    catalog.write_sqlite_catalog(path, entries.items())
+    return path
+
+
+@pytest.fixture
+def create_manager():
+    """
+    Provides a function that creates a host-side Manager for
+    MyAssetManager, initialized with the supplied settings.
+    """
+    logger = log.SeverityFilter(log.ConsoleLogger())
+    logger.setSeverity(log.LoggerInterface.Severity.kError)
+    factory_impl = PythonPluginSystemManagerImplementationFactory(logger)
+
+    def create(settings=None):
+        manager = hostApi.ManagerFactory.createManagerForInterface(
+            "myorg.manager.my_asset_manager", TestHostInterface(), factory_impl, logger
+        )
+        manager.initialize(settings or {})
+        return manager
+
+    return create
+
+
+@pytest.fixture
+def create_manager_from_config():
+    """
+    Provides a function that creates a host-side Manager from the
+    OpenAssetIO config file at the supplied path.
+    """
+    logger = log.SeverityFilter(log.ConsoleLogger())
+    logger.setSeverity(log.LoggerInterface.Severity.kError)
+    factory_impl = PythonPluginSystemManagerImplementationFactory(logger)
+
+    def create(config_path):
+        return hostApi.ManagerFactory.defaultManagerForInterface(
+            config_path, TestHostInterface(), factory_impl, logger
+        )
+
+    return create
+
+
+class TestHostInterface(hostApi.HostInterface):
+    __test__ = False
+
+    def identifier(self):
+        return "org.openassetio.test.my_asset_manager"
+
+    def displayName(self):
+        return "MyAssetManager Tests"
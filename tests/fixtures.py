@@ -8,6 +8,7 @@ Manager test harness test case fixtures for My Asset Manager.
 from openassetio import constants
 from openassetio_mediacreation.traits.content import LocatableContentTrait
 from openassetio_mediacreation.traits.application import ConfigTrait
+from openassetio_mediacreation.traits.lifecycle import VersionTrait
 from openassetio_mediacreation.traits.usage import EntityTrait
 
 IDENTIFIER = "myorg.manager.my_asset_manager"
@@ -82,4 +83,23 @@ fixtures = {
             },
         },
     },
+    "Test_getWithRelationship_All": {
+        "shared": {
+            "a_reference": EXISTING_REF,
+            "a_relationship_trait_set": {VersionTrait.kId},
+            "expected_related_entity_references": [
+                "my_asset_manager:///anAsset",
+                "my_asset_manager:///anAsset3",
+            ],
+            "an_entity_trait_set_to_filter_by": {LocatableContentTrait.kId},
+            "a_reference_to_a_missing_entity": MISSING_ENTITY_REF,
+            "a_malformed_reference": MALFORMED_REF,
+        },
+        "test_when_querying_missing_reference_then_resolution_error_is_returned": {
+            "expected_error_message": ERROR_MSG_MISSING_ENTITY
+        },
+        "test_when_querying_malformed_reference_then_malformed_reference_error_is_returned": {
+            "expected_error_message": ERROR_MSG_MALFORMED_REF,
+        },
+    },
 }
@@ -0,0 +1,266 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Smoke tests for the MyAssetManager benchmarks, so that they don't rot
+between the occasions that they are run in earnest.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name,import-outside-toplevel
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+
+import pytest
+
+
+class Test_bench_manager:
+    def test_when_run_then_results_recorded_for_each_scenario(self, bench_manager, tmp_path):
+        output = str(tmp_path / "results.json")
+
+        exit_code = bench_manager.main(
+            ["--batch-sizes", "1", "20", "--catalog-size", "50", "--min-time", "0"]
+            + ["--output", output]
+        )
+
+        import benchmark_utils
+
+        results = benchmark_utils.read_results(output)
+        assert exit_code == 0
+        assert len(results["results"]) == len(bench_manager.default_scenarios([1, 20]))
+        for result in results["results"]:
+            assert result["successes"] + result["errors"] == result["batch_size"]
+            assert result["throughput"] > 0
+            assert result["p99_ms"] >= result["p50_ms"]
+            assert 0 < result["first_result_ms"]
+
+    def test_when_run_remotely_then_scenarios_succeed(self, bench_manager, tmp_path):
+        output = str(tmp_path / "results.json")
+
+        exit_code = bench_manager.main(
+            ["--batch-sizes", "20", "--catalog-size", "50", "--min-time", "0", "--remote"]
+            + ["--filter", "miss=0,malformed=0,", "--output", output]
+        )
+
+        import benchmark_utils
+
+        results = benchmark_utils.read_results(output)
+        assert exit_code == 0
+        assert results["settings"]["remote_latency_ms"] == 0
+        assert all(result["successes"] > 0 for result in results["results"])
+
+    @pytest.mark.parametrize(
+        "scenario,max_blocks_per_element",
+        [
+            # One TraitsData per resolved entity.
+            (("resolve", 2000), 1.05),
+            # Errors with a constant message are shared.
+            (("resolve", 2000, 0.0, 1.0), 0.05),
+            (("entityTraits", 2000, 0.0, 1.0), 0.05),
+            # Results are only built once per distinct reference.
+            (("resolve", 2000, 0.0, 0.0, 0.9), 1.05),
+        ],
+    )
+    def test_when_scenario_run_then_per_element_allocations_bounded(
+        self, bench_manager, tmp_path, scenario, max_blocks_per_element
+    ):
+        catalog_path = str(tmp_path / "catalog.db")
+        bench_manager.write_catalog(catalog_path, 5000)
+
+        import benchmark_utils
+
+        settings = {"catalog_path": catalog_path}
+        result = bench_manager.run_scenario(
+            benchmark_utils.create_manager(settings),
+            bench_manager.Scenario(*scenario),
+            5000,
+            min_time=0,
+            direct_manager=benchmark_utils.DirectManager(settings),
+        )
+
+        assert result["retained_blocks_per_element"] <= max_blocks_per_element
+
+    def test_when_batch_made_then_ratios_applied_to_distinct_references(self, bench_manager):
+        scenario = bench_manager.Scenario(
+            "resolve", 100, miss_ratio=0.3, malformed_ratio=0.2, duplicate_ratio=0.5
+        )
+
+        refs = bench_manager.make_reference_strings(
+            scenario, catalog_size=1000, rng=bench_manager.random.Random(0)
+        )
+
+        unique_refs = set(refs)
+        assert len(refs) == 100
+        assert len(unique_refs) == 50
+        assert sum("?unsupportedQueryParam" in ref for ref in unique_refs) == 10
+        assert sum("missing" in ref for ref in unique_refs) == 15
+
+    def test_when_compared_against_faster_baseline_then_regressions_reported(self, bench_manager):
+        baseline = {
+            "results": [{"name": "a", "throughput": 100, "p99_ms": 1, "peak_memory_bytes": 10}]
+        }
+        results = {
+            "results": [{"name": "a", "throughput": 85, "p99_ms": 1.3, "peak_memory_bytes": 10}]
+        }
+
+        assert not bench_manager.compare(results, baseline, tolerance=0.3)
+        regressions = bench_manager.compare(results, baseline, tolerance=0.1)
+        assert len(regressions) == 2
+
+
+class Test_bench_startup:
+    def test_when_run_then_each_phase_timed(self, bench_startup, tmp_path):
+        output = str(tmp_path / "startup.json")
+
+        exit_code = bench_startup.main(["--samples", "1", "--output", output])
+
+        import benchmark_utils
+
+        medians = benchmark_utils.read_results(output)["median_ms"]
+        assert exit_code == 0
+        for phase in bench_startup.PHASES:
+            assert medians[phase] > 0
+        assert medians["process"] > medians["plugin_total"]
+
+    def test_when_over_budget_then_fails(self, bench_startup):
+        assert bench_startup.main(["--samples", "1", "--budget-ms", "0"]) == 1
+
+
+class Test_bench_threads:
+    def test_when_run_then_results_recorded_with_and_without_coalescing(
+        self, bench_threads, tmp_path
+    ):
+        output = str(tmp_path / "threads.json")
+
+        exit_code = bench_threads.main(
+            ["--threads", "3", "--batch-size", "20", "--catalog-size", "100", "--rounds", "2"]
+            + ["--output", output]
+        )
+
+        import benchmark_utils
+
+        results = benchmark_utils.read_results(output)["results"]
+        assert exit_code == 0
+        assert [result["name"] for result in results] == [
+            "resolve[threads=3,coalesce=False]",
+            "resolve[threads=3,coalesce=True]",
+        ]
+
+    def test_when_batches_made_then_overlap_shared_between_threads(self, bench_threads):
+        batches = bench_threads.make_batches(4, 10, 0.3, 1000, bench_threads.random.Random(0))
+
+        assert all(len(batch) == 10 for batch in batches)
+        assert len(set.intersection(*map(set, batches))) == 3
+        assert len(set().union(*batches)) == 3 + 4 * 7
+
+
+class Test_bench_stress:
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            [],
+            ["resolve_cache_size=100", "coalesce_lookups=true", "lookup_workers=2"]
+            + ["lookup_chunk_size=10"],
+        ],
+    )
+    def test_when_run_then_results_correct_for_each_thread_count(
+        self, bench_stress, tmp_path, settings
+    ):
+        output = str(tmp_path / "stress.json")
+
+        exit_code = bench_stress.main(
+            ["--threads", "1", "2", "--duration", "0.3", "--warmup", "0.1"]
+            + ["--sample-interval", "0.1", "--batch-size", "20", "--catalog-size", "100"]
+            + [arg for setting in settings for arg in ("--setting", setting)]
+            + ["--output", output]
+        )
+
+        import benchmark_utils
+
+        results = benchmark_utils.read_results(output)["results"]
+        assert exit_code == 0
+        assert [result["name"] for result in results] == [
+            "mixed[threads=1]",
+            "mixed[threads=2]",
+        ]
+        assert all(result["calls"] > 0 and result["mismatches"] == 0 for result in results)
+        assert results[0]["scaling"] == 1
+
+    def test_when_result_wrong_then_mismatch_reported(self, bench_stress, create_manager):
+        manager = create_manager()
+        batch = (
+            [
+                manager.createEntityReference("my_asset_manager:///anAsset"),
+                manager.createEntityReference("my_asset_manager:///missing"),
+            ],
+            ["file:///wrong.exr", bench_stress.expected_result("my_asset_manager:///missing")],
+        )
+
+        elements, mismatches = bench_stress.call_and_check(
+            manager, "resolve", batch, manager.createContext(), []
+        )
+
+        assert elements == 2
+        assert len(mismatches) == 1
+        assert mismatches[0].startswith("resolve[0]: got ")
+
+
+class Test_bench_publish:  # pylint: disable=too-few-public-methods
+    def test_when_run_then_batches_share_syncs(self, bench_publish, tmp_path):
+        output = str(tmp_path / "publish.json")
+
+        exit_code = bench_publish.main(
+            ["--entities", "100", "--batch-sizes", "10", "100", "--threads", "2"]
+            + ["--output", output]
+        )
+
+        import benchmark_utils
+
+        results = benchmark_utils.read_results(output)["results"]
+        assert exit_code == 0
+        assert [result["name"] for result in results] == [
+            "register[batch=10,threads=2]",
+            "register[batch=100,threads=2]",
+        ]
+        assert results[0]["syncs"] <= 10
+        assert results[1]["syncs"] == 1
+
+
+@pytest.fixture
+def bench_manager(base_dir, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(base_dir, "benchmarks"))
+    import bench_manager
+
+    return bench_manager
+
+
+@pytest.fixture
+def bench_publish(base_dir, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(base_dir, "benchmarks"))
+    import bench_publish
+
+    return bench_publish
+
+
+@pytest.fixture
+def bench_startup(base_dir, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(base_dir, "benchmarks"))
+    import bench_startup
+
+    return bench_startup
+
+
+@pytest.fixture
+def bench_stress(base_dir, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(base_dir, "benchmarks"))
+    import bench_stress
+
+    return bench_stress
+
+
+@pytest.fixture
+def bench_threads(base_dir, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(base_dir, "benchmarks"))
+    import bench_threads
+
+    return bench_threads
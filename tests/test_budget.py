@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the time budgets of batch lookups of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+import time
+
+import pytest
+
+from openassetio.access import EntityTraitsAccess, ResolveAccess
+from openassetio.errors import BatchElementError
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import budget, catalog, catalog_server
+
+
+class Test_Bounded:
+    def test_when_items_arrive_in_time_then_all_yielded(self):
+        assert list(budget.Bounded(1).items(range(5), 10)) == [0, 1, 2, 3, 4]
+
+    def test_when_budget_expires_then_items_already_drawn_yielded(self):
+        release = threading.Event()
+
+        def stalled():
+            yield 1
+            release.wait()
+            yield 2
+
+        start = time.monotonic()
+        items = list(budget.Bounded(1).items(stalled(), 0.1))
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert items == [1]
+        assert elapsed < 1
+
+    def test_when_workers_busy_with_stragglers_then_fails_fast(self):
+        release = threading.Event()
+        bounded = budget.Bounded(1)
+
+        assert bounded.call(0.05, release.wait) is None
+        start = time.monotonic()
+        assert bounded.call(0.05, lambda: "never run") is None
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 1
+        assert bounded.call(1, lambda: "run") == "run"
+
+
+class Test_call_budget:
+    def test_when_context_has_no_budget_then_default_returned(self, create_manager):
+        assert budget.call_budget(create_manager().createContext(), 0.5) == 0.5
+
+    def test_when_context_has_budget_then_it_overrides_default(self, create_manager):
+        context = create_manager().createContext()
+        context.locale.setTraitProperty(budget.BUDGET_TRAIT_ID, "seconds", 0.1)
+
+        assert budget.call_budget(context, 0.5) == 0.1
+
+
+class Test_MyAssetManager_lookup_budget:
+    def test_when_budget_expires_then_only_outstanding_entities_fail(self, slow_manager):
+        manager, server = slow_manager
+        refs = [
+            manager.createEntityReference("my_asset_manager:///a"),
+            manager.createEntityReference("my_asset_manager:///b"),
+            manager.createEntityReference("my_asset_manager:///a?unsupportedQueryParam"),
+            manager.createEntityReference("my_asset_manager:///a"),
+        ]
+        context = manager.createContext()
+        resolve(manager, refs[:1], context)
+        server.latency = 2
+
+        start = time.monotonic()
+        results = resolve(manager, refs, context)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1
+        assert results[0] == results[3] == "file:///a"
+        assert results[1].code == BatchElementError.ErrorCode.kUnknown
+        assert "budget" in results[1].message
+        assert results[2].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+    @pytest.mark.parametrize("page_size", [0, 1])
+    def test_when_lookups_in_time_then_all_resolved(self, slow_manager, page_size):
+        manager, _ = slow_manager
+        manager.initialize({"resolve_page_size": page_size})
+        refs = [
+            manager.createEntityReference("my_asset_manager:///b"),
+            manager.createEntityReference("my_asset_manager:///missing"),
+            manager.createEntityReference("my_asset_manager:///a?unsupportedQueryParam"),
+        ]
+
+        results = resolve(manager, refs, manager.createContext())
+
+        assert results[0] == "file:///b"
+        assert results[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+        assert results[2].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+    @pytest.mark.parametrize("page_size", [0, 2])
+    def test_when_entities_unresolved_then_told_apart_within_one_lookup(
+        self, slow_manager, page_size
+    ):
+        manager, server = slow_manager
+        manager.initialize({"resolve_page_size": page_size})
+        refs = [
+            manager.createEntityReference("my_asset_manager:///c"),
+            manager.createEntityReference("my_asset_manager:///missing"),
+        ]
+        requests = server.requests
+
+        results = resolve(manager, refs, manager.createContext())
+
+        assert server.requests == requests + 1
+        assert results[0] is None
+        assert results[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+
+    @pytest.mark.parametrize("page_size", [0, 1])
+    def test_when_context_budget_expires_then_resolve_fails_fast(self, slow_manager, page_size):
+        manager, server = slow_manager
+        manager.initialize({"resolve_page_size": page_size, "lookup_budget": 0})
+        server.latency = 2
+        context = manager.createContext()
+        context.locale.setTraitProperty(budget.BUDGET_TRAIT_ID, "seconds", 0.05)
+        refs = [
+            manager.createEntityReference("my_asset_manager:///a"),
+            manager.createEntityReference("my_asset_manager:///a?unsupportedQueryParam"),
+        ]
+
+        start = time.monotonic()
+        results = resolve(manager, refs, context)
+
+        assert time.monotonic() - start < 1
+        assert results[0].code == BatchElementError.ErrorCode.kUnknown
+        assert results[1].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+    def test_when_entity_traits_budget_expires_then_outstanding_entities_fail(self, slow_manager):
+        manager, server = slow_manager
+        server.latency = 2
+        refs = [
+            manager.createEntityReference("my_asset_manager:///a"),
+            manager.createEntityReference("my_asset_manager:///a?unsupportedQueryParam"),
+        ]
+        results = [None] * len(refs)
+
+        start = time.monotonic()
+        manager.entityTraits(
+            refs,
+            EntityTraitsAccess.kRead,
+            manager.createContext(),
+            results.__setitem__,
+            results.__setitem__,
+        )
+
+        assert time.monotonic() - start < 1
+        assert results[0].code == BatchElementError.ErrorCode.kUnknown
+        assert results[1].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+
+def resolve(manager, refs, context):
+    """
+    Resolve the location of each reference, returning the location, or
+    the error, for each, by index.
+    """
+    results = [None] * len(refs)
+
+    def success(idx, traits_data):
+        results[idx] = traits_data.getTraitProperty(LocatableContentTrait.kId, "location")
+
+    manager.resolve(
+        refs,
+        {LocatableContentTrait.kId},
+        ResolveAccess.kRead,
+        context,
+        success,
+        results.__setitem__,
+    )
+    return results
+
+
+@pytest.fixture
+def slow_manager(create_manager, sqlite_path):
+    """
+    Provides a manager that resolves from a catalog server, caching
+    results, with a lookup budget of 0.2s, and the server, whose
+    latency may be raised to exceed it.
+    """
+    server = catalog_server.CatalogServer(catalog.SqliteCatalog(sqlite_path)).start()
+    manager = create_manager(
+        {
+            "catalog_url": server.url,
+            "resolve_cache_size": 10,
+            "lookup_budget": 0.2,
+            "remote_retries": 0,
+        }
+    )
+    yield manager, server
+    server.stop()
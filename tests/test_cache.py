@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the caches used by MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.access import ResolveAccess
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog
+from my_asset_manager.cache import BloomFilter, LruCache
+
+
+class Test_LruCache:
+    def test_when_key_missing_then_default_returned_and_miss_counted(self):
+        cache = LruCache(2)
+
+        assert cache.get("a") is None
+        assert cache.get("a", 1) == 1
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 2, "evictions": 0}
+
+    def test_when_key_present_then_value_returned_and_hit_counted(self):
+        cache = LruCache(2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 0, "evictions": 0}
+
+    def test_when_full_with_lru_policy_then_least_recently_used_evicted(self):
+        cache = LruCache(2, policy="lru")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_when_full_with_fifo_policy_then_oldest_evicted(self):
+        cache = LruCache(2, policy="fifo")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_when_ttl_elapsed_then_entry_expired(self):
+        now = [0.0]
+        cache = LruCache(2, ttl=10, clock=lambda: now[0])
+        cache.put("a", 1)
+
+        now[0] = 9.9
+        assert cache.get("a") == 1
+        now[0] = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_when_cleared_then_entries_removed(self):
+        cache = LruCache(2)
+        cache.put("a", 1)
+
+        cache.clear()
+
+        assert cache.get("a") is None
+
+    @pytest.mark.parametrize(
+        "args", [{"max_size": 0}, {"max_size": 1, "ttl": -1}, {"max_size": 1, "policy": "lfu"}]
+    )
+    def test_when_invalid_arguments_then_ValueError_raised(self, args):
+        with pytest.raises(ValueError):
+            LruCache(**args)
+
+
+class Test_BloomFilter:
+    def test_when_keys_added_then_always_reported_present(self):
+        bloom_filter = BloomFilter(1000, 0.01)
+        keys = [f"key{i}" for i in range(1000)]
+        for key in keys:
+            bloom_filter.add(key)
+
+        assert all(key in bloom_filter for key in keys)
+        assert bloom_filter.select(keys) == keys
+        assert len(bloom_filter) == 1000
+
+    def test_when_keys_not_added_then_false_positives_near_configured_rate(self):
+        bloom_filter = BloomFilter(10000, 0.01)
+        for i in range(10000):
+            bloom_filter.add(f"key{i}")
+
+        false_positives = bloom_filter.select(f"other{i}" for i in range(10000))
+
+        assert len(false_positives) < 200
+
+    def test_when_empty_then_all_keys_rejected(self):
+        assert not BloomFilter(10, 0.01).select(["a", "b"])
+
+    @pytest.mark.parametrize("rate", [0, 1, -0.1])
+    def test_when_invalid_rate_then_ValueError_raised(self, rate):
+        with pytest.raises(ValueError):
+            BloomFilter(10, rate)
+
+
+class Test_MyAssetManager_resolve_cache:
+    def test_when_cache_enabled_then_results_served_until_flushed(self, create_manager, tmp_path):
+        path = str(tmp_path / "catalog.db")
+        write_catalog(path, "file:///original")
+        manager = create_manager({"catalog_path": path, "resolve_cache_size": 10})
+
+        assert resolve_location(manager) == "file:///original"
+        write_catalog(path, "file:///updated")
+        assert resolve_location(manager) == "file:///original"
+
+        manager.flushCaches()
+
+        assert resolve_location(manager) == "file:///updated"
+
+    def test_when_cache_disabled_then_results_always_looked_up(self, create_manager, tmp_path):
+        path = str(tmp_path / "catalog.db")
+        write_catalog(path, "file:///original")
+        manager = create_manager({"catalog_path": path})
+
+        assert resolve_location(manager) == "file:///original"
+        write_catalog(path, "file:///updated")
+        assert resolve_location(manager) == "file:///updated"
+
+    def test_when_cached_result_modified_by_host_then_cache_unaffected(self, create_manager):
+        manager = create_manager({"resolve_cache_size": 10})
+
+        resolve(manager).setTraitProperty(LocatableContentTrait.kId, "location", "modified")
+
+        assert resolve_location(manager) == "file:///some/filesystem/path"
+
+
+def write_catalog(path, location):
+    catalog.write_sqlite_catalog(
+        path,
+        [
+            (
+                "my_asset_manager:///anAsset",
+                catalog.CatalogEntry(location, frozenset({LocatableContentTrait.kId})),
+            )
+        ],
+    )
+
+
+def resolve(manager):
+    return manager.resolve(
+        manager.createEntityReference("my_asset_manager:///anAsset"),
+        {LocatableContentTrait.kId},
+        ResolveAccess.kRead,
+        manager.createContext(),
+    )
+
+
+def resolve_location(manager):
+    return resolve(manager).getTraitProperty(LocatableContentTrait.kId, "location")
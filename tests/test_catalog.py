@@ -0,0 +1,769 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the catalog backends of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from openassetio.access import ResolveAccess, EntityTraitsAccess
+from openassetio.errors import BatchElementError, ConfigurationException
+from openassetio.hostApi import Manager
+from openassetio.trait import TraitsData
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog, compact, shared_cache
+
+
+class Test_MemoryCatalog:
+    def test_when_references_looked_up_then_only_known_references_returned(self, entries):
+        a_catalog = catalog.MemoryCatalog(entries)
+
+        assert a_catalog.locations(["my_asset_manager:///a", "my_asset_manager:///missing"]) == {
+            "my_asset_manager:///a": "file:///a"
+        }
+        assert a_catalog.traits(["my_asset_manager:///b", "my_asset_manager:///missing"]) == {
+            "my_asset_manager:///b": frozenset({"t1"})
+        }
+
+    def test_when_entity_has_no_location_then_omitted_from_locations(self, entries):
+        a_catalog = catalog.MemoryCatalog(entries)
+
+        assert not a_catalog.locations(["my_asset_manager:///c"])
+        assert a_catalog.traits(["my_asset_manager:///c"]) == {
+            "my_asset_manager:///c": frozenset({"t2"})
+        }
+
+
+class Test_Catalog_fields:  # pylint: disable=too-few-public-methods
+    @pytest.mark.parametrize("catalog_type", ["memory", "compact", "sqlite"])
+    def test_when_fields_requested_then_only_those_fields_returned(
+        self, catalog_type, entries, sqlite_path
+    ):
+        if catalog_type == "memory":
+            a_catalog = catalog.MemoryCatalog(entries)
+        elif catalog_type == "compact":
+            a_catalog = compact.CompactCatalog(entries.items())
+        else:
+            a_catalog = catalog.SqliteCatalog(sqlite_path)
+        references = ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///x"]
+
+        assert a_catalog.fields(references, ("location",)) == {
+            "location": {"my_asset_manager:///a": "file:///a"}
+        }
+        assert a_catalog.fields(references, ("location", "traits")) == {
+            "location": {"my_asset_manager:///a": "file:///a"},
+            "traits": {
+                "my_asset_manager:///a": frozenset({"t1", "t2"}),
+                "my_asset_manager:///c": frozenset({"t2"}),
+            },
+        }
+        assert a_catalog.fields(references, ()) == {}
+        with pytest.raises(KeyError):
+            a_catalog.fields(references, ("unknown",))
+
+
+class Test_Catalog_field_pages:
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_when_pages_iterated_then_each_page_looked_up_in_order(self, entries, concurrent):
+        recording_catalog = RecordingCatalog(entries)
+        a_catalog = recording_catalog
+        if concurrent:
+            a_catalog = catalog.ConcurrentCatalog(recording_catalog, max_workers=2, chunk_size=10)
+        references = [
+            "my_asset_manager:///a",
+            "my_asset_manager:///x",
+            "my_asset_manager:///b",
+            "my_asset_manager:///c",
+            "my_asset_manager:///y",
+        ]
+
+        pages = list(a_catalog.field_pages(references, ("location",), 2))
+        a_catalog.close()
+
+        assert pages == [
+            (references[:2], {"location": {"my_asset_manager:///a": "file:///a"}}),
+            (references[2:4], {"location": {"my_asset_manager:///b": "file:///b"}}),
+            (references[4:], {"location": {}}),
+        ]
+        assert sorted(call for call, _ in recording_catalog.calls) == sorted(
+            [references[:2], references[2:4], references[4:]]
+        )
+
+    @pytest.mark.parametrize("wrapper", ["filtered", "shared_cache", "overlay", "coalescing"])
+    def test_when_wrapped_then_all_references_returned_in_pages(self, entries, tmp_path, wrapper):
+        recording_catalog = RecordingCatalog(entries)
+        concurrent_catalog = catalog.ConcurrentCatalog(
+            recording_catalog, max_workers=2, chunk_size=10
+        )
+        if wrapper == "filtered":
+            a_catalog = catalog.FilteredCatalog(concurrent_catalog, 0.0001, missing_cache_size=10)
+        elif wrapper == "shared_cache":
+            a_catalog = shared_cache.SharedCacheCatalog(
+                concurrent_catalog, str(tmp_path / "shared.db")
+            )
+        elif wrapper == "overlay":
+            a_catalog = catalog.OverlayCatalog(
+                catalog.MemoryCatalog({"my_asset_manager:///b": entries["my_asset_manager:///b"]}),
+                concurrent_catalog,
+            )
+        else:
+            a_catalog = catalog.CoalescingCatalog(concurrent_catalog)
+        references = [
+            "my_asset_manager:///a",
+            "my_asset_manager:///x",
+            "my_asset_manager:///b",
+            "my_asset_manager:///c",
+            "my_asset_manager:///y",
+        ]
+
+        for _ in range(2):
+            pages = list(a_catalog.field_pages(references, ("location", "traits"), 2))
+
+            found = {"location": {}, "traits": {}}
+            for page, page_found in pages:
+                assert len(page) <= 2
+                for field, values in page_found.items():
+                    found[field].update(values)
+            assert sorted(ref for page, _ in pages for ref in page) == sorted(references)
+            assert found == catalog.MemoryCatalog(entries).fields(
+                references, ("location", "traits")
+            )
+        # Only coalesced lookups aren't prefetched on the workers.
+        assert recording_catalog.calls
+        assert all(
+            (thread is threading.current_thread()) == (wrapper == "coalescing")
+            for _, thread in recording_catalog.calls
+        )
+        a_catalog.close()
+        concurrent_catalog.close()
+
+
+class Test_SqliteCatalog:
+    def test_when_references_looked_up_then_only_known_references_returned(self, sqlite_path):
+        a_catalog = catalog.SqliteCatalog(sqlite_path)
+
+        assert len(a_catalog) == 3
+        assert a_catalog.locations(
+            ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///missing"]
+        ) == {"my_asset_manager:///a": "file:///a"}
+        assert a_catalog.traits(["my_asset_manager:///a", "my_asset_manager:///missing"]) == {
+            "my_asset_manager:///a": frozenset({"t1", "t2"})
+        }
+        a_catalog.close()
+
+    def test_when_batch_exceeds_query_limit_then_all_references_found(self, tmp_path):
+        path = str(tmp_path / "large.db")
+        references = [f"my_asset_manager:///{i}" for i in range(2000)]
+        catalog.write_sqlite_catalog(
+            path,
+            ((ref, catalog.CatalogEntry(ref + ".exr", frozenset({"t"}))) for ref in references),
+        )
+        a_catalog = catalog.SqliteCatalog(path)
+
+        locations = a_catalog.locations(references)
+
+        assert len(locations) == len(references)
+        assert locations["my_asset_manager:///1999"] == "my_asset_manager:///1999.exr"
+        a_catalog.close()
+
+    def test_when_path_does_not_exist_then_ConfigurationException_raised(self, tmp_path):
+        with pytest.raises(ConfigurationException):
+            catalog.SqliteCatalog(str(tmp_path / "missing.db"))
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="Needs /proc/self/fd")
+    def test_when_looked_up_from_short_lived_threads_then_connections_closed(self, sqlite_path):
+        a_catalog = catalog.SqliteCatalog(sqlite_path)
+        a_catalog.locations(["my_asset_manager:///a"])
+        open_files = len(os.listdir("/proc/self/fd"))
+
+        for _ in range(300):
+            thread = threading.Thread(
+                target=a_catalog.locations, args=(["my_asset_manager:///a"],)
+            )
+            thread.start()
+            thread.join()
+
+        assert len(os.listdir("/proc/self/fd")) < open_files + 10
+        a_catalog.close()
+
+
+class Test_ConcurrentCatalog:
+    def test_when_batch_larger_than_chunk_then_chunks_looked_up_on_workers(self, entries):
+        recording_catalog = RecordingCatalog(entries)
+        a_catalog = catalog.ConcurrentCatalog(recording_catalog, max_workers=2, chunk_size=2)
+
+        locations = a_catalog.locations(
+            ["my_asset_manager:///a", "my_asset_manager:///b", "my_asset_manager:///missing"]
+        )
+        a_catalog.close()
+
+        assert locations == {
+            "my_asset_manager:///a": "file:///a",
+            "my_asset_manager:///b": "file:///b",
+        }
+        assert sorted(len(chunk) for chunk, _ in recording_catalog.calls) == [1, 2]
+        assert all(
+            thread is not threading.current_thread() for _, thread in recording_catalog.calls
+        )
+
+    def test_when_batch_fits_in_chunk_then_looked_up_on_calling_thread(self, entries):
+        recording_catalog = RecordingCatalog(entries)
+        a_catalog = catalog.ConcurrentCatalog(recording_catalog, max_workers=2, chunk_size=2)
+
+        trait_sets = a_catalog.traits(["my_asset_manager:///a", "my_asset_manager:///c"])
+        a_catalog.close()
+
+        assert trait_sets == {
+            "my_asset_manager:///a": frozenset({"t1", "t2"}),
+            "my_asset_manager:///c": frozenset({"t2"}),
+        }
+        assert recording_catalog.calls == [
+            (["my_asset_manager:///a", "my_asset_manager:///c"], threading.current_thread())
+        ]
+
+    def test_when_fields_looked_up_then_all_fields_of_each_chunk_looked_up_at_once(self, entries):
+        fields_catalog = FieldsRecordingCatalog(entries)
+        a_catalog = catalog.ConcurrentCatalog(fields_catalog, max_workers=2, chunk_size=2)
+        references = ["my_asset_manager:///b", "my_asset_manager:///x", "my_asset_manager:///c"]
+
+        found = a_catalog.fields(references, ("location", "traits"))
+        a_catalog.close()
+
+        assert found == {
+            "location": {"my_asset_manager:///b": "file:///b"},
+            "traits": {
+                "my_asset_manager:///b": frozenset({"t1"}),
+                "my_asset_manager:///c": frozenset({"t2"}),
+            },
+        }
+        assert sorted(fields_catalog.calls) == [
+            (references[:2], ("location", "traits")),
+            (references[2:], ("location", "traits")),
+        ]
+
+    def test_when_pages_iterated_then_references_drawn_as_pages_prefetched(self, entries):
+        a_catalog = catalog.ConcurrentCatalog(
+            catalog.MemoryCatalog(entries), max_workers=2, chunk_size=10
+        )
+        drawn = []
+
+        def references():
+            for name in "abcxy":
+                drawn.append(name)
+                yield f"my_asset_manager:///{name}"
+
+        pages = a_catalog.field_pages(references(), ("location",), 1)
+        next(pages)
+
+        assert drawn == ["a", "b", "c"]
+        assert len(list(pages)) == 4
+        a_catalog.close()
+
+    @pytest.mark.parametrize("args", [(0, 1), (1, 0)])
+    def test_when_invalid_arguments_then_ValueError_raised(self, entries, args):
+        with pytest.raises(ValueError):
+            catalog.ConcurrentCatalog(catalog.MemoryCatalog(entries), *args)
+
+
+class Test_CoalescingCatalog:
+    def test_when_reference_in_flight_then_other_thread_waits_for_result(self, entries):
+        gated_catalog = GatedCatalog(entries)
+        a_catalog = catalog.CoalescingCatalog(gated_catalog)
+        results = {}
+        first = threading.Thread(
+            target=lambda: results.update(
+                first=a_catalog.locations(["my_asset_manager:///a", "my_asset_manager:///b"])
+            )
+        )
+        first.start()
+        gated_catalog.entered.wait()
+
+        second = threading.Thread(
+            target=lambda: results.update(
+                second=a_catalog.locations(["my_asset_manager:///b", "my_asset_manager:///c"])
+            )
+        )
+        second.start()
+        while a_catalog.stats()["coalesced"] == 0:
+            time.sleep(0.001)
+        gated_catalog.gate.set()
+        first.join()
+        second.join()
+
+        assert results["second"] == {"my_asset_manager:///b": "file:///b"}
+        assert sorted(refs for refs, _ in gated_catalog.calls) == [
+            ["my_asset_manager:///a", "my_asset_manager:///b"],
+            ["my_asset_manager:///c"],
+        ]
+
+    def test_when_in_flight_lookup_fails_then_waiting_thread_looks_up_itself(self, entries):
+        gated_catalog = GatedCatalog(entries, fail_first=True)
+        a_catalog = catalog.CoalescingCatalog(gated_catalog)
+        results = {}
+
+        def first_lookup():
+            with pytest.raises(RuntimeError):
+                a_catalog.traits(["my_asset_manager:///a"])
+
+        first = threading.Thread(target=first_lookup)
+        first.start()
+        gated_catalog.entered.wait()
+        second = threading.Thread(
+            target=lambda: results.update(second=a_catalog.traits(["my_asset_manager:///a"]))
+        )
+        second.start()
+        while a_catalog.stats()["coalesced"] == 0:
+            time.sleep(0.001)
+        gated_catalog.gate.set()
+        first.join()
+        second.join()
+
+        assert results["second"] == {"my_asset_manager:///a": frozenset({"t1", "t2"})}
+
+
+class Test_FilteredCatalog:
+    def test_when_filter_enabled_then_only_possible_references_looked_up(self, entries):
+        recording_catalog = RecordingCatalog(entries)
+        a_catalog = catalog.FilteredCatalog(recording_catalog, false_positive_rate=0.0001)
+        missing = [f"my_asset_manager:///missing{i}" for i in range(100)]
+
+        locations = a_catalog.locations(["my_asset_manager:///a", *missing])
+
+        assert locations == {"my_asset_manager:///a": "file:///a"}
+        assert len(recording_catalog.calls[0][0]) < 10
+        assert a_catalog.stats()["filter"]["entries"] == 3
+
+    def test_when_missing_cache_enabled_then_misses_not_looked_up_again(self, entries):
+        recording_catalog = RecordingCatalog(entries)
+        a_catalog = catalog.FilteredCatalog(recording_catalog, 0.0, missing_cache_size=10)
+        refs = ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///missing"]
+
+        assert a_catalog.locations(refs) == {"my_asset_manager:///a": "file:///a"}
+        assert a_catalog.locations(refs) == {"my_asset_manager:///a": "file:///a"}
+        assert set(a_catalog.traits(refs)) == {"my_asset_manager:///a", "my_asset_manager:///c"}
+
+        assert [refs for refs, _ in recording_catalog.calls] == [
+            refs,
+            ["my_asset_manager:///a"],
+            refs,
+        ]
+        assert a_catalog.stats()["filtered"] == 2
+
+    def test_when_refreshed_then_added_references_found(self, sqlite_path):
+        new_ref = "my_asset_manager:///new"
+        a_catalog = catalog.FilteredCatalog(
+            catalog.SqliteCatalog(sqlite_path), 0.0001, missing_cache_size=10
+        )
+        assert not a_catalog.locations([new_ref])
+
+        catalog.write_sqlite_catalog(
+            sqlite_path, [(new_ref, catalog.CatalogEntry("file:///new", frozenset()))]
+        )
+        assert not a_catalog.locations([new_ref])
+        a_catalog.refresh()
+
+        assert a_catalog.locations([new_ref]) == {new_ref: "file:///new"}
+        a_catalog.close()
+
+
+class Test_SharedCacheCatalog:
+    def test_when_entries_cached_by_one_instance_then_served_to_another(self, entries, tmp_path):
+        path = str(tmp_path / "shared.db")
+        refs = ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///missing"]
+        writer = shared_cache.SharedCacheCatalog(RecordingCatalog(entries), path)
+        writer.locations(refs)
+        recording_catalog = RecordingCatalog(entries)
+        reader = shared_cache.SharedCacheCatalog(recording_catalog, path)
+
+        locations = reader.locations(refs[:2])
+        trait_sets = reader.traits(refs[:2])
+
+        assert locations == {"my_asset_manager:///a": "file:///a"}
+        assert trait_sets == {
+            "my_asset_manager:///a": frozenset({"t1", "t2"}),
+            "my_asset_manager:///c": frozenset({"t2"}),
+        }
+        assert not recording_catalog.calls
+        assert reader.stats()["hits"] == 4
+        writer.close()
+        reader.close()
+
+    def test_when_populated_by_another_process_then_entries_served(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from my_asset_manager import catalog, shared_cache;"
+                "shared_cache.SharedCacheCatalog("
+                "  catalog.MemoryCatalog("
+                "    {'ref': catalog.CatalogEntry('file:///ref', frozenset({'t'}))}"
+                f"  ), {path!r}"
+                ").locations(['ref'])",
+            ],
+            check=True,
+        )
+        a_catalog = shared_cache.SharedCacheCatalog(catalog.MemoryCatalog({}), path)
+
+        assert a_catalog.locations(["ref"]) == {"ref": "file:///ref"}
+        a_catalog.close()
+
+    def test_when_invalidated_then_entries_hidden_from_all_instances(self, entries, tmp_path):
+        path = str(tmp_path / "shared.db")
+        refs = ["my_asset_manager:///a"]
+        first = shared_cache.SharedCacheCatalog(catalog.MemoryCatalog(entries), path)
+        recording_catalog = RecordingCatalog(entries)
+        second = shared_cache.SharedCacheCatalog(recording_catalog, path)
+        first.traits(refs)
+
+        first.invalidate()
+        second.traits(refs)
+        second.traits(refs)
+
+        assert len(recording_catalog.calls) == 2
+        first.close()
+        second.close()
+
+    def test_when_invalidated_concurrently_then_every_invalidation_counted(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        catalogs = [
+            shared_cache.SharedCacheCatalog(catalog.MemoryCatalog({}), path) for _ in range(4)
+        ]
+
+        def invalidate(a_catalog):
+            for _ in range(25):
+                a_catalog.invalidate()
+
+        threads = [
+            threading.Thread(target=invalidate, args=(a_catalog,)) for a_catalog in catalogs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        connection = sqlite3.connect(path)
+        assert connection.execute("SELECT value FROM meta").fetchone() == (100,)
+        connection.close()
+        for a_catalog in catalogs:
+            a_catalog.close()
+
+
+class Test_MyAssetManager_catalog_path:
+    def test_when_catalog_path_set_then_entities_served_from_catalog(
+        self, create_manager, sqlite_path
+    ):
+        manager = create_manager({"catalog_path": sqlite_path})
+        context = manager.createContext()
+        refs = [
+            manager.createEntityReference("my_asset_manager:///a"),
+            manager.createEntityReference("my_asset_manager:///anAsset"),
+        ]
+
+        resolved = manager.resolve(
+            refs,
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            context,
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+        trait_sets = manager.entityTraits(
+            refs,
+            EntityTraitsAccess.kRead,
+            context,
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+
+        assert resolved[0].getTraitProperty(LocatableContentTrait.kId, "location") == "file:///a"
+        assert resolved[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+        assert trait_sets[0] == {"t1", "t2"}
+        assert trait_sets[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+
+    @pytest.mark.parametrize("settings", [{}, {"resolve_page_size": 1}, {"resolve_cache_size": 8}])
+    def test_when_entity_has_no_location_then_resolved_to_no_traits(
+        self, create_manager, sqlite_path, settings
+    ):
+        manager = create_manager({"catalog_path": sqlite_path, **settings})
+        context = manager.createContext()
+        refs = [
+            manager.createEntityReference("my_asset_manager:///c"),
+            manager.createEntityReference("my_asset_manager:///missing"),
+        ]
+
+        for _ in range(2):
+            resolved = manager.resolve(
+                refs,
+                {LocatableContentTrait.kId},
+                ResolveAccess.kRead,
+                context,
+                Manager.BatchElementErrorPolicyTag.kVariant,
+            )
+
+            assert isinstance(resolved[0], TraitsData)
+            assert not resolved[0].traitSet()
+            assert resolved[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+
+    def test_when_catalog_in_memory_then_entities_served_until_flushed(
+        self, create_manager, sqlite_path
+    ):
+        manager = create_manager({"catalog_path": sqlite_path, "catalog_in_memory": True})
+        context = manager.createContext()
+        ref = manager.createEntityReference("my_asset_manager:///a")
+
+        def resolve_location():
+            return manager.resolve(
+                ref, {LocatableContentTrait.kId}, ResolveAccess.kRead, context
+            ).getTraitProperty(LocatableContentTrait.kId, "location")
+
+        assert resolve_location() == "file:///a"
+        catalog.write_sqlite_catalog(
+            sqlite_path,
+            [("my_asset_manager:///a", catalog.CatalogEntry("file:///new", frozenset({"t1"})))],
+        )
+        assert resolve_location() == "file:///a"
+        manager.flushCaches()
+        assert resolve_location() == "file:///new"
+
+    def test_when_lookup_workers_set_then_batch_resolved_concurrently(
+        self, create_manager, tmp_path
+    ):
+        path = str(tmp_path / "catalog.db")
+        ref_strs = [f"my_asset_manager:///{i}" for i in range(100)]
+        catalog.write_sqlite_catalog(
+            path,
+            (
+                (
+                    ref_str,
+                    catalog.CatalogEntry(f"file:///{i}", frozenset({LocatableContentTrait.kId})),
+                )
+                for i, ref_str in enumerate(ref_strs)
+            ),
+        )
+        manager = create_manager(
+            {"catalog_path": path, "lookup_workers": 4, "lookup_chunk_size": 7}
+        )
+
+        resolved = manager.resolve(
+            [manager.createEntityReference(ref_str) for ref_str in ref_strs],
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            manager.createContext(),
+        )
+
+        assert [
+            result.getTraitProperty(LocatableContentTrait.kId, "location") for result in resolved
+        ] == [f"file:///{i}" for i in range(100)]
+
+    def test_when_resolve_page_size_set_then_results_delivered_as_each_page_arrives(
+        self, create_manager, sqlite_path, monkeypatch
+    ):
+        events = []
+        original_fields = catalog.SqliteCatalog.fields
+
+        def fields(self, references, fields):
+            events.append(("page", list(references)))
+            return original_fields(self, references, fields)
+
+        monkeypatch.setattr(catalog.SqliteCatalog, "fields", fields)
+        ref_strs = [
+            "my_asset_manager:///a",
+            "my_asset_manager:///missing",
+            "my_asset_manager:///a?unsupportedQueryParam",
+            "my_asset_manager:///b",
+            "my_asset_manager:///a",
+            "my_asset_manager:///c",
+        ]
+
+        def resolve(page_size, manager=None):
+            manager = manager or create_manager(
+                {"catalog_path": sqlite_path, "resolve_page_size": page_size}
+            )
+            results = {}
+
+            def deliver(idx, result):
+                events.append(("result", idx))
+                results[idx] = result
+
+            manager.resolve(
+                [manager.createEntityReference(ref_str) for ref_str in ref_strs],
+                {LocatableContentTrait.kId},
+                ResolveAccess.kRead,
+                manager.createContext(),
+                deliver,
+                deliver,
+            )
+            return [
+                (
+                    result.code
+                    if isinstance(result, BatchElementError)
+                    else result.getTraitProperty(LocatableContentTrait.kId, "location")
+                )
+                for _, result in sorted(results.items())
+            ]
+
+        unpaged = resolve(0)
+        events.clear()
+        paged = resolve(2)
+
+        assert paged == unpaged
+        assert events == [
+            ("page", ["my_asset_manager:///a", "my_asset_manager:///missing"]),
+            ("result", 0),
+            ("result", 4),
+            ("result", 1),
+            ("page", ["my_asset_manager:///b", "my_asset_manager:///c"]),
+            ("result", 3),
+            ("result", 5),
+            ("result", 2),
+        ]
+
+        cached_manager = create_manager(
+            {"catalog_path": sqlite_path, "resolve_page_size": 2, "resolve_cache_size": 10}
+        )
+        assert resolve(2, cached_manager) == unpaged
+        assert resolve(2, cached_manager) == unpaged
+
+    def test_when_missing_filter_enabled_then_missing_entities_reported_until_flushed(
+        self, create_manager, sqlite_path
+    ):
+        manager = create_manager(
+            {
+                "catalog_path": sqlite_path,
+                "missing_filter_false_positive_rate": 0.01,
+                "missing_cache_size": 10,
+            }
+        )
+        context = manager.createContext()
+        refs = [
+            manager.createEntityReference("my_asset_manager:///a"),
+            manager.createEntityReference("my_asset_manager:///new"),
+        ]
+
+        def resolve():
+            return manager.resolve(
+                refs,
+                {LocatableContentTrait.kId},
+                ResolveAccess.kRead,
+                context,
+                Manager.BatchElementErrorPolicyTag.kVariant,
+            )
+
+        resolved = resolve()
+        assert resolved[0].getTraitProperty(LocatableContentTrait.kId, "location") == "file:///a"
+        assert resolved[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+
+        catalog.write_sqlite_catalog(
+            sqlite_path,
+            [
+                (
+                    "my_asset_manager:///new",
+                    catalog.CatalogEntry("file:///new", frozenset({LocatableContentTrait.kId})),
+                )
+            ],
+        )
+        manager.flushCaches()
+
+        resolved = resolve()
+        assert resolved[1].getTraitProperty(LocatableContentTrait.kId, "location") == "file:///new"
+
+    def test_when_shared_cache_path_set_then_entries_shared_between_managers(
+        self, create_manager, sqlite_path, tmp_path
+    ):
+        shared_cache_path = str(tmp_path / "shared.db")
+        empty_catalog_path = str(tmp_path / "empty.db")
+        catalog.write_sqlite_catalog(empty_catalog_path, [])
+        managers = [
+            create_manager({"catalog_path": path, "shared_cache_path": shared_cache_path})
+            for path in (sqlite_path, empty_catalog_path)
+        ]
+
+        locations = [
+            manager.resolve(
+                manager.createEntityReference("my_asset_manager:///a"),
+                {LocatableContentTrait.kId},
+                ResolveAccess.kRead,
+                manager.createContext(),
+            ).getTraitProperty(LocatableContentTrait.kId, "location")
+            for manager in managers
+        ]
+
+        assert locations == ["file:///a", "file:///a"]
+
+    def test_when_shared_cache_directory_missing_then_ConfigurationException_raised(
+        self, create_manager, tmp_path
+    ):
+        with pytest.raises(ConfigurationException):
+            create_manager({"shared_cache_path": str(tmp_path / "missing" / "shared.db")})
+
+    def test_when_catalog_path_missing_then_ConfigurationException_raised_on_initialize(
+        self, create_manager, tmp_path
+    ):
+        with pytest.raises(ConfigurationException):
+            create_manager({"catalog_path": str(tmp_path / "missing.db")})
+
+    def test_when_unknown_setting_supplied_then_KeyError_raised(self, create_manager):
+        with pytest.raises(KeyError):
+            create_manager({"not_a_setting": 1})
+
+
+class RecordingCatalog(catalog.MemoryCatalog):
+    def __init__(self, entries):
+        super().__init__(entries)
+        self.calls = []
+
+    def locations(self, references):
+        self.calls.append((list(references), threading.current_thread()))
+        return super().locations(references)
+
+    def traits(self, references):
+        self.calls.append((list(references), threading.current_thread()))
+        return super().traits(references)
+
+
+class FieldsRecordingCatalog(catalog.MemoryCatalog):
+    def __init__(self, entries):
+        super().__init__(entries)
+        self.calls = []
+
+    def fields(self, references, fields):
+        self.calls.append((list(references), tuple(fields)))
+        return super().fields(references, fields)
+
+
+class GatedCatalog(RecordingCatalog):
+    """
+    Blocks the first lookup until `gate` is set, optionally failing it.
+    """
+
+    def __init__(self, entries, fail_first=False):
+        super().__init__(entries)
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.__fail_first = fail_first
+
+    def locations(self, references):
+        self.__wait()
+        return super().locations(references)
+
+    def traits(self, references):
+        self.__wait()
+        return super().traits(references)
+
+    def __wait(self):
+        if not self.entered.is_set():
+            self.entered.set()
+            self.gate.wait()
+            if self.__fail_first:
+                raise RuntimeError("Lookup failed")
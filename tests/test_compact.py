@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the compact in-memory catalog of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+from my_asset_manager import catalog, compact
+
+
+class Test_CompactCatalog:
+    def test_when_references_looked_up_then_only_known_references_returned(self, entries):
+        a_catalog = compact.CompactCatalog(entries.items())
+        references = ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///"]
+
+        assert len(a_catalog) == 3
+        assert sorted(a_catalog.references()) == sorted(entries)
+        assert a_catalog.locations(references) == {"my_asset_manager:///a": "file:///a"}
+        assert a_catalog.traits(references) == {
+            "my_asset_manager:///a": frozenset({"t1", "t2"}),
+            "my_asset_manager:///c": frozenset({"t2"}),
+        }
+
+    def test_when_trait_sets_equal_then_same_object_returned(self):
+        a_catalog = compact.CompactCatalog(
+            (f"my_asset_manager:///{i}", catalog.CatalogEntry(None, frozenset({"t"})))
+            for i in range(3)
+        )
+
+        trait_sets = list(a_catalog.traits(a_catalog.references()).values())
+
+        assert trait_sets[0] is trait_sets[1] is trait_sets[2]
+        assert a_catalog.stats()["trait_sets"] == 1
+
+    def test_when_many_entities_then_all_found_and_others_missing(self):
+        references = [f"my_asset_manager:///{i}" for i in range(5000)]
+        a_catalog = compact.CompactCatalog(
+            (ref, catalog.CatalogEntry(ref + ".exr", frozenset({"t"}))) for ref in references
+        )
+
+        locations = a_catalog.locations(references + [f"{ref}0" for ref in references[-500:]])
+
+        assert locations == {ref: ref + ".exr" for ref in references}
+
+    def test_when_reference_repeated_then_last_entry_used(self):
+        a_catalog = compact.CompactCatalog(
+            [
+                ("my_asset_manager:///a", catalog.CatalogEntry("file:///first", frozenset())),
+                ("my_asset_manager:///a", catalog.CatalogEntry("", frozenset())),
+            ]
+        )
+
+        assert len(a_catalog) == 1
+        assert a_catalog.locations(["my_asset_manager:///a"]) == {"my_asset_manager:///a": ""}
+        assert list(a_catalog.references()) == ["my_asset_manager:///a"]
+
+    def test_when_references_iterated_then_yielded_in_order_added(self):
+        references = [f"my_asset_manager:///{i}" for i in range(100)]
+        a_catalog = compact.CompactCatalog(
+            (ref, catalog.CatalogEntry(None, frozenset())) for ref in references[::-1]
+        )
+
+        assert list(a_catalog.references()) == references[::-1]
+
+    def test_when_loaded_from_sqlite_then_refresh_reloads_file(self, sqlite_path):
+        a_catalog = compact.CompactCatalog.from_sqlite(sqlite_path)
+        catalog.write_sqlite_catalog(
+            sqlite_path,
+            [("my_asset_manager:///a", catalog.CatalogEntry("file:///new", frozenset({"t1"})))],
+        )
+        assert a_catalog.locations(["my_asset_manager:///a"]) == {
+            "my_asset_manager:///a": "file:///a"
+        }
+
+        a_catalog.refresh()
+
+        assert a_catalog.locations(["my_asset_manager:///a"]) == {
+            "my_asset_manager:///a": "file:///new"
+        }
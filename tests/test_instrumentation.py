@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the opt-in instrumentation of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name,protected-access,too-few-public-methods
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import json
+
+from openassetio.access import PolicyAccess, ResolveAccess
+from openassetio.hostApi import Manager
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager.instrumentation import Instrumentation, LatencyHistogram, instrumented
+
+
+class Test_LatencyHistogram:
+    def test_when_empty_then_percentiles_are_zero(self):
+        assert LatencyHistogram().percentile(0.99) == 0.0
+
+    def test_when_latencies_added_then_percentiles_bound_latencies(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.add(0.000_010)
+        histogram.add(0.5)
+
+        assert 0.000_010 <= histogram.percentile(0.5) < 0.000_020
+        assert 0.000_010 <= histogram.percentile(0.99) < 0.000_020
+        assert histogram.percentile(1.0) == 0.5
+
+
+class Test_Instrumentation:
+    def test_when_calls_recorded_then_snapshot_aggregates_per_method(self):
+        instrumentation = Instrumentation()
+        instrumentation.add_source("a_cache", lambda: {"hits": 3, "misses": 1})
+
+        instrumentation.record("resolve", 10, 0.001, 8, {"kEntityResolutionError": 2})
+        instrumentation.record("resolve", 5, 0.002, 4, {"kEntityResolutionError": 1})
+        snapshot = instrumentation.snapshot()
+
+        resolve_stats = snapshot["methods"]["resolve"]
+        assert resolve_stats["calls"] == 2
+        assert resolve_stats["elements"] == 15
+        assert resolve_stats["successes"] == 12
+        assert resolve_stats["errors"] == {"kEntityResolutionError": 3}
+        assert snapshot["a_cache"]["hit_rate"] == 0.75
+
+    def test_when_interval_elapsed_then_snapshot_appended_to_path(self, tmp_path):
+        path = tmp_path / "stats.jsonl"
+        now = [0.0]
+        instrumentation = Instrumentation(10, str(path), clock=lambda: now[0])
+
+        instrumentation.record("resolve", 1, 0.001, 1, {})
+        assert not path.exists()
+        now[0] = 10
+        instrumentation.record("resolve", 1, 0.001, 1, {})
+        instrumentation.record("resolve", 1, 0.001, 1, {})
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["methods"]["resolve"]["calls"] == 2
+
+
+class Test_instrumented:
+    def test_when_instrumentation_disabled_then_call_passes_through(self):
+        an_object = AnInstrumentedClass(None)
+
+        assert an_object.batch([1, 2], 3, lambda *_: None, lambda *_: None) == "batch"
+
+    def test_when_instrumentation_enabled_then_callbacks_counted(self):
+        an_object = AnInstrumentedClass(Instrumentation())
+        successes = []
+
+        an_object.batch([1, 2, 3], 2, lambda idx, _: successes.append(idx), lambda *_: None)
+        an_object.single("a")
+
+        methods = an_object._instrumentation.snapshot()["methods"]
+        assert successes == [0, 1]
+        assert methods["batch"]["elements"] == 3
+        assert methods["batch"]["successes"] == 2
+        assert methods["batch"]["errors"] == {"kUnknown": 1}
+        assert methods["single"] == {**methods["single"], "elements": 1, "successes": 1}
+
+
+class Test_MyAssetManager_instrumentation:
+    def test_when_enabled_then_calls_exported_to_path(self, create_manager, tmp_path):
+        path = tmp_path / "stats.jsonl"
+        manager = create_manager(
+            {
+                "instrumentation_enabled": True,
+                "instrumentation_interval": 1e-9,
+                "instrumentation_path": str(path),
+                "resolve_cache_size": 10,
+            }
+        )
+        refs = [
+            manager.createEntityReference(ref_str)
+            for ref_str in ("my_asset_manager:///anAsset", "my_asset_manager:///missing")
+        ]
+
+        manager.managementPolicy(
+            [{LocatableContentTrait.kId}], PolicyAccess.kRead, manager.createContext()
+        )
+        manager.resolve(
+            refs,
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            manager.createContext(),
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+
+        snapshot = json.loads(path.read_text(encoding="utf-8").splitlines()[-1])
+        assert snapshot["methods"]["resolve"]["elements"] == 2
+        assert snapshot["methods"]["resolve"]["successes"] == 1
+        assert snapshot["methods"]["resolve"]["errors"] == {"kEntityResolutionError": 1}
+        assert snapshot["methods"]["managementPolicy"]["elements"] == 1
+        assert snapshot["resolve_cache"]["misses"] == 2
+        assert "reference_parse_cache" in snapshot
+
+
+class AnInstrumentedClass:
+    def __init__(self, an_instrumentation):
+        self._instrumentation = an_instrumentation
+
+    @instrumented
+    def batch(self, items, successes, successCallback, errorCallback):
+        # pylint: disable=import-outside-toplevel
+        from openassetio.errors import BatchElementError
+
+        for idx, item in enumerate(items):
+            if idx < successes:
+                successCallback(idx, item)
+            else:
+                errorCallback(idx, BatchElementError(BatchElementError.ErrorCode.kUnknown, ""))
+        return "batch"
+
+    @instrumented
+    def single(self, value):
+        return value
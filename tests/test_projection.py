@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the projection of trait sets onto catalog fields.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+from openassetio.access import ResolveAccess
+from openassetio.trait import TraitsData
+from openassetio_mediacreation.traits.application import ConfigTrait
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog, projection
+
+
+class Test_project:
+    def test_when_trait_set_resolvable_then_fields_of_its_traits_projected(self):
+        a_projection = projection.project(frozenset({LocatableContentTrait.kId, ConfigTrait.kId}))
+
+        assert a_projection.fields == ("location",)
+        assert a_projection.lookup_fields == ("location", "traits")
+        assert [trait_field.trait_id for trait_field in a_projection.trait_fields] == [
+            LocatableContentTrait.kId
+        ]
+
+    def test_when_trait_set_not_resolvable_then_no_fields_projected(self):
+        assert projection.project(frozenset({ConfigTrait.kId})).fields == ()
+        assert projection.project(frozenset({ConfigTrait.kId})).lookup_fields == ()
+        assert not projection.resolvable_traits({ConfigTrait.kId})
+
+    def test_when_imbued_then_trait_data_set(self):
+        (trait_field,) = projection.project(frozenset({LocatableContentTrait.kId})).trait_fields
+        traits_data = TraitsData()
+
+        trait_field.imbue(traits_data, "file:///a")
+
+        assert LocatableContentTrait(traits_data).getLocation() == "file:///a"
+
+
+class Test_MyAssetManager_projection:  # pylint: disable=too-few-public-methods
+    def test_when_location_resolved_then_only_location_and_traits_fetched_at_once(
+        self, create_manager, monkeypatch, tmp_path
+    ):
+        path = str(tmp_path / "catalog.db")
+        catalog.write_sqlite_catalog(
+            path, [("my_asset_manager:///a", catalog.CatalogEntry("file:///a", frozenset({"t"})))]
+        )
+        requested_fields = []
+        original_fields = catalog.SqliteCatalog.fields
+
+        def fields(self, references, fields):
+            requested_fields.append(fields)
+            return original_fields(self, references, fields)
+
+        monkeypatch.setattr(catalog.SqliteCatalog, "fields", fields)
+        manager = create_manager({"catalog_path": path})
+
+        data = manager.resolve(
+            manager.createEntityReference("my_asset_manager:///a"),
+            {LocatableContentTrait.kId, ConfigTrait.kId},
+            ResolveAccess.kRead,
+            manager.createContext(),
+        )
+
+        assert requested_fields == [("location", "traits")]
+        assert data.traitSet() == {LocatableContentTrait.kId}
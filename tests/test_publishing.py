@@ -0,0 +1,325 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for publishing to MyAssetManager, through its write-ahead
+journal.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+
+import pytest
+
+from openassetio.access import (
+    EntityTraitsAccess,
+    PolicyAccess,
+    PublishingAccess,
+    ResolveAccess,
+)
+from openassetio.errors import BatchElementError, ConfigurationException
+from openassetio.hostApi import Manager
+from openassetio.trait import TraitsData
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.managementPolicy import ManagedTrait
+
+from my_asset_manager import catalog, publishing
+
+
+class Test_Journal:
+    def test_when_entries_appended_then_read_back_by_new_journal(self, journal_path):
+        journal = publishing.Journal(journal_path)
+        journal.append([("my_asset_manager:///a", catalog.CatalogEntry("file:///a", {"t1"}))])
+        journal.append(
+            [
+                ("my_asset_manager:///b", catalog.CatalogEntry(None, {"t1", "t2"})),
+                ("my_asset_manager:///a", catalog.CatalogEntry("file:///a2", {"t1"})),
+            ]
+        )
+        journal.close()
+
+        assert publishing.Journal(journal_path).read() == [
+            ("my_asset_manager:///a", catalog.CatalogEntry("file:///a", frozenset({"t1"}))),
+            ("my_asset_manager:///b", catalog.CatalogEntry(None, frozenset({"t1", "t2"}))),
+            ("my_asset_manager:///a", catalog.CatalogEntry("file:///a2", frozenset({"t1"}))),
+        ]
+
+    def test_when_read_again_then_only_new_entries_returned(self, journal_path):
+        journal = publishing.Journal(journal_path)
+        journal.append([("my_asset_manager:///a", catalog.CatalogEntry("file:///a", {"t1"}))])
+        journal.read()
+        journal.append([("my_asset_manager:///b", catalog.CatalogEntry("file:///b", {"t1"}))])
+
+        assert [reference for reference, _ in journal.read()] == ["my_asset_manager:///b"]
+        assert not journal.read()
+
+    def test_when_record_partial_then_skipped(self, journal_path):
+        with open(journal_path, "wb") as journal_file:
+            journal_file.write(b'{"reference":"my_asset_manager:///torn","loc\n')
+        journal = publishing.Journal(journal_path)
+        journal.append([("my_asset_manager:///a", catalog.CatalogEntry("file:///a", {"t1"}))])
+
+        assert [reference for reference, _ in journal.read()] == ["my_asset_manager:///a"]
+
+    def test_when_appended_concurrently_then_appends_share_commits(self, journal_path):
+        journal = publishing.Journal(journal_path, commit_delay=0.05)
+        barrier = threading.Barrier(8)
+
+        def append(i):
+            barrier.wait()
+            journal.append(
+                [(f"my_asset_manager:///{i}", catalog.CatalogEntry(f"file:///{i}", {"t1"}))]
+            )
+
+        threads = [threading.Thread(target=append, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = journal.stats()
+        assert stats["records"] == 8
+        assert stats["commits"] < 8
+        assert len(journal.read()) == 8
+
+    def test_when_write_fails_then_OSError_raised(self, journal_path):
+        journal = publishing.Journal(journal_path)
+        journal.close()
+
+        with pytest.raises(OSError, match="publishing journal"):
+            journal.append([("my_asset_manager:///a", catalog.CatalogEntry("file:///a", {"t1"}))])
+
+
+class Test_PublishedCatalog:
+    def test_when_entries_registered_then_served_immediately(self, entries, journal_path):
+        a_catalog = publishing.PublishedCatalog(
+            catalog.MemoryCatalog(entries), publishing.Journal(journal_path)
+        )
+
+        a_catalog.register(
+            [("my_asset_manager:///new", catalog.CatalogEntry("file:///new", frozenset({"t3"})))]
+        )
+
+        references = ["my_asset_manager:///a", "my_asset_manager:///new"]
+        assert a_catalog.locations(references) == {
+            "my_asset_manager:///a": "file:///a",
+            "my_asset_manager:///new": "file:///new",
+        }
+        assert a_catalog.traits(references) == {
+            "my_asset_manager:///a": frozenset({"t1", "t2"}),
+            "my_asset_manager:///new": frozenset({"t3"}),
+        }
+        assert a_catalog.read_only(references) == {"my_asset_manager:///a"}
+        assert len(a_catalog) == len(entries) + 1
+        assert a_catalog.stats()["journal"] == {"records": 1, "commits": 1}
+
+    def test_when_refreshed_then_entries_published_elsewhere_served(self, entries, journal_path):
+        a_catalog = publishing.PublishedCatalog(
+            catalog.MemoryCatalog(entries), publishing.Journal(journal_path)
+        )
+        other_catalog = publishing.PublishedCatalog(
+            catalog.MemoryCatalog(entries), publishing.Journal(journal_path)
+        )
+        other_catalog.register(
+            [("my_asset_manager:///new", catalog.CatalogEntry("file:///new", frozenset()))]
+        )
+
+        assert not a_catalog.locations(["my_asset_manager:///new"])
+        a_catalog.refresh()
+        assert a_catalog.locations(["my_asset_manager:///new"]) == {
+            "my_asset_manager:///new": "file:///new"
+        }
+
+    def test_when_paged_then_unpublished_pages_drawn_from_wrapped_catalog(
+        self, entries, journal_path
+    ):
+        wrapped_catalog = catalog.ConcurrentCatalog(
+            catalog.MemoryCatalog(entries), max_workers=2, chunk_size=10
+        )
+        a_catalog = publishing.PublishedCatalog(wrapped_catalog, publishing.Journal(journal_path))
+        a_catalog.register(
+            [("my_asset_manager:///new", catalog.CatalogEntry(None, frozenset({"t3"})))]
+        )
+        references = ["my_asset_manager:///a", "my_asset_manager:///new", "my_asset_manager:///b"]
+
+        pages = list(a_catalog.field_pages(references, ("location", "traits"), 2))
+
+        assert pages == [
+            (
+                ["my_asset_manager:///new"],
+                {"location": {}, "traits": {"my_asset_manager:///new": frozenset({"t3"})}},
+            ),
+            (
+                ["my_asset_manager:///a", "my_asset_manager:///b"],
+                {
+                    "location": {
+                        "my_asset_manager:///a": "file:///a",
+                        "my_asset_manager:///b": "file:///b",
+                    },
+                    "traits": {
+                        "my_asset_manager:///a": frozenset({"t1", "t2"}),
+                        "my_asset_manager:///b": frozenset({"t1"}),
+                    },
+                },
+            ),
+        ]
+        assert a_catalog.fields(references, ("location",)) == {
+            "location": {
+                "my_asset_manager:///a": "file:///a",
+                "my_asset_manager:///b": "file:///b",
+            }
+        }
+        a_catalog.close()
+
+
+class Test_MyAssetManager_publishing:
+    def test_when_journal_not_set_then_publishing_not_supported(self, create_manager):
+        manager = create_manager()
+
+        assert not manager.hasCapability(Manager.Capability.kPublishing)
+        assert manager.hasCapability(Manager.Capability.kResolution)
+
+    def test_when_journal_set_then_publishing_supported(self, create_manager, journal_path):
+        manager = create_manager({"publish_journal_path": journal_path})
+
+        assert manager.hasCapability(Manager.Capability.kPublishing)
+        [policy] = manager.managementPolicy(
+            [{LocatableContentTrait.kId}], PolicyAccess.kWrite, manager.createContext()
+        )
+        assert policy.hasTrait(ManagedTrait.kId)
+        assert policy.hasTrait(LocatableContentTrait.kId)
+
+    def test_when_preflighted_then_only_new_entities_can_be_published(
+        self, create_manager, journal_path
+    ):
+        manager = create_manager({"publish_journal_path": journal_path})
+        refs = [
+            manager.createEntityReference("my_asset_manager:///new"),
+            manager.createEntityReference("my_asset_manager:///anAsset"),
+            manager.createEntityReference("my_asset_manager:///new?unsupportedQueryParam"),
+        ]
+
+        results = call_publishing_method(
+            manager.preflight, refs, [TraitsData()] * 3, PublishingAccess.kWrite, manager
+        )
+        trait_sets = call_publishing_method(
+            manager.entityTraits, refs, None, EntityTraitsAccess.kWrite, manager
+        )
+
+        assert results[0] == refs[0]
+        assert results[1].code == BatchElementError.ErrorCode.kEntityAccessError
+        assert results[1].message == "Entities are read-only"
+        assert results[2].code == BatchElementError.ErrorCode.kMalformedEntityReference
+        assert trait_sets[0] == {LocatableContentTrait.kId}
+        assert trait_sets[1].code == BatchElementError.ErrorCode.kEntityAccessError
+
+    def test_when_registered_then_entities_resolvable_and_persisted(
+        self, create_manager, journal_path
+    ):
+        manager = create_manager({"publish_journal_path": journal_path})
+        refs = [manager.createEntityReference(f"my_asset_manager:///frame{i}") for i in range(100)]
+        traits_datas = [located(f"file:///frame{i}.exr") for i in range(100)]
+
+        results = call_publishing_method(
+            manager.register, refs, traits_datas, PublishingAccess.kWrite, manager
+        )
+
+        assert results == refs
+        for a_manager in (manager, create_manager({"publish_journal_path": journal_path})):
+            resolved = a_manager.resolve(
+                refs, {LocatableContentTrait.kId}, ResolveAccess.kRead, a_manager.createContext()
+            )
+            assert [
+                result.getTraitProperty(LocatableContentTrait.kId, "location")
+                for result in resolved
+            ] == [f"file:///frame{i}.exr" for i in range(100)]
+            assert a_manager.entityTraits(
+                refs[:1], EntityTraitsAccess.kRead, a_manager.createContext()
+            ) == [{LocatableContentTrait.kId}]
+        with open(journal_path, "rb") as journal_file:
+            assert len(journal_file.readlines()) == 100
+
+    def test_when_reregistered_then_cached_results_replaced(self, create_manager, journal_path):
+        manager = create_manager({"publish_journal_path": journal_path, "resolve_cache_size": 10})
+        ref = manager.createEntityReference("my_asset_manager:///new")
+
+        def register_and_resolve(location):
+            call_publishing_method(
+                manager.register, [ref], [located(location)], PublishingAccess.kWrite, manager
+            )
+            return manager.resolve(
+                ref, {LocatableContentTrait.kId}, ResolveAccess.kRead, manager.createContext()
+            ).getTraitProperty(LocatableContentTrait.kId, "location")
+
+        assert register_and_resolve("file:///v1") == "file:///v1"
+        assert register_and_resolve("file:///v2") == "file:///v2"
+
+    def test_when_registering_read_only_entity_then_access_error_returned(
+        self, create_manager, journal_path
+    ):
+        manager = create_manager({"publish_journal_path": journal_path})
+        refs = [manager.createEntityReference("my_asset_manager:///anAsset")]
+
+        results = call_publishing_method(
+            manager.register, refs, [TraitsData()], PublishingAccess.kWrite, manager
+        )
+
+        assert results[0].code == BatchElementError.ErrorCode.kEntityAccessError
+
+    def test_when_journal_write_fails_then_access_error_returned_for_each_entity(
+        self, create_manager, journal_path, monkeypatch
+    ):
+        manager = create_manager({"publish_journal_path": journal_path})
+        refs = [manager.createEntityReference(f"my_asset_manager:///frame{i}") for i in range(2)]
+
+        def append(_self, _entries):
+            raise OSError("Failed to write to publishing journal")
+
+        monkeypatch.setattr(publishing.Journal, "append", append)
+        results = call_publishing_method(
+            manager.register,
+            refs,
+            [located("file:///frame.exr")] * 2,
+            PublishingAccess.kWrite,
+            manager,
+        )
+
+        assert [result.code for result in results] == [
+            BatchElementError.ErrorCode.kEntityAccessError
+        ] * 2
+        assert "publishing journal" in results[0].message
+
+    def test_when_journal_directory_missing_then_ConfigurationException_raised(
+        self, create_manager, tmp_path
+    ):
+        with pytest.raises(ConfigurationException):
+            create_manager({"publish_journal_path": str(tmp_path / "missing" / "journal")})
+
+
+def located(location):
+    traits_data = TraitsData()
+    traits_data.setTraitProperty(LocatableContentTrait.kId, "location", location)
+    return traits_data
+
+
+def call_publishing_method(method, refs, traits_datas, access, manager):
+    """
+    Call a batch method of the manager, returning the result or error
+    for each reference, by index.
+    """
+    results = [None] * len(refs)
+    args = (refs, access) if traits_datas is None else (refs, traits_datas, access)
+    method(
+        *args,
+        manager.createContext(),
+        results.__setitem__,
+        results.__setitem__,
+    )
+    return results
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal.jsonl")
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the entity reference parsing of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from my_asset_manager.references import ParsedReference, parse_reference
+
+
+class Test_parse_reference:
+    @pytest.mark.parametrize(
+        "reference_string,expected",
+        [
+            ("my_asset_manager:///anAsset", ParsedReference("anAsset")),
+            ("my_asset_manager:///a/b/c", ParsedReference("a/b/c")),
+            ("my_asset_manager:///", ParsedReference("")),
+            ("my_asset_manager:///anAsset?", ParsedReference("anAsset")),
+            (
+                "my_asset_manager:///anAsset?v=2&flag&x=a=b",
+                ParsedReference("anAsset", (("v", "2"), ("flag", None), ("x", "a=b"))),
+            ),
+        ],
+    )
+    def test_when_reference_valid_then_components_returned(self, reference_string, expected):
+        assert parse_reference(reference_string) == expected
+
+    @pytest.mark.parametrize(
+        "reference_string",
+        ["not a reference", "my_asset_manager://anAsset", "x my_asset_manager:///"],
+    )
+    def test_when_not_a_reference_then_None_returned(self, reference_string):
+        assert parse_reference(reference_string) is None
+
+    def test_when_parsed_repeatedly_then_same_object_returned(self):
+        first = parse_reference("my_asset_manager:///repeated?v=1")
+
+        assert parse_reference("my_asset_manager:///repeated?v=1") is first
+
+    def test_when_paths_equal_then_path_strings_shared(self):
+        first = parse_reference("my_asset_manager:///shared?v=1")
+        second = parse_reference("my_asset_manager:///shared?v=2")
+
+        assert first.path is second.path
+
+
+class Test_ParsedReference_has_param:  # pylint: disable=too-few-public-methods
+    def test_when_key_present_then_True_returned(self):
+        parsed = ParsedReference("anAsset", (("v", "2"), ("flag", None)))
+
+        assert parsed.has_param("v")
+        assert parsed.has_param("flag")
+        assert not parsed.has_param("2")
@@ -0,0 +1,241 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for relationship queries of MyAssetManager, through the
+adjacency indices of its catalogs.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.access import RelationsAccess
+from openassetio.errors import BatchElementError
+from openassetio.hostApi import Manager
+from openassetio.trait import TraitsData
+
+from my_asset_manager import catalog, catalog_server, compact, relationships, remote
+
+
+VERSIONS = "lifecycle.Version"
+DEPENDENCIES = "relationship.Unbounded"
+
+
+class Test_relationship_key:  # pylint: disable=too-few-public-methods
+    def test_when_traits_have_properties_then_key_is_sorted_trait_ids(self):
+        traits_data = TraitsData({"b", "a"})
+        traits_data.setTraitProperty("a", "tag", "v1")
+
+        assert relationships.relationship_key(traits_data) == "a b"
+
+
+class Test_Catalog_related:
+    @pytest.mark.parametrize("catalog_type", ["memory", "compact", "sqlite", "remote"])
+    def test_when_paged_then_related_returned_in_order(self, catalog_type, related_catalogs):
+        a_catalog = related_catalogs[catalog_type]
+
+        assert a_catalog.related("my_asset_manager:///a", VERSIONS, 0, 2) == [
+            "my_asset_manager:///a",
+            "my_asset_manager:///b",
+        ]
+        assert a_catalog.related("my_asset_manager:///a", VERSIONS, 2, 2) == [
+            "my_asset_manager:///x",
+        ]
+        assert not a_catalog.related("my_asset_manager:///a", VERSIONS, 3, 2)
+        assert a_catalog.related("my_asset_manager:///a", DEPENDENCIES, 0, 10) == [
+            "my_asset_manager:///c"
+        ]
+        assert not a_catalog.related("my_asset_manager:///c", VERSIONS, 0, 10)
+        assert not a_catalog.related("my_asset_manager:///a", "unknown", 0, 10)
+
+    def test_when_sqlite_catalog_has_no_relationships_then_none_returned(self, sqlite_path):
+        a_catalog = catalog.SqliteCatalog(sqlite_path)
+
+        assert not a_catalog.related("my_asset_manager:///a", VERSIONS, 0, 10)
+        assert not list(a_catalog.relationships())
+
+    def test_when_sqlite_relationships_rewritten_then_replaced(self, sqlite_path):
+        relationships.write_sqlite_relationships(sqlite_path, EDGES)
+        relationships.write_sqlite_relationships(
+            sqlite_path, [("my_asset_manager:///a", VERSIONS, "my_asset_manager:///c")]
+        )
+        a_catalog = catalog.SqliteCatalog(sqlite_path)
+
+        assert a_catalog.related("my_asset_manager:///a", VERSIONS, 0, 10) == [
+            "my_asset_manager:///c"
+        ]
+        assert a_catalog.related("my_asset_manager:///a", DEPENDENCIES, 0, 10) == [
+            "my_asset_manager:///c"
+        ]
+
+
+class Test_RelatedPager:
+    def test_when_paged_then_pages_read_only_as_needed(self, entries):
+        recording_catalog = RelatedRecordingCatalog(entries, EDGES)
+        pager = relationships.RelatedPager(
+            recording_catalog, "my_asset_manager:///a", VERSIONS, 2, set()
+        )
+
+        assert recording_catalog.reads == [(0, 2)]
+        assert [ref.toString() for ref in pager.get(None)] == [
+            "my_asset_manager:///a",
+            "my_asset_manager:///b",
+        ]
+        assert pager.hasNext(None)
+        assert recording_catalog.reads == [(0, 2), (2, 2)]
+        pager.next(None)
+        assert [ref.toString() for ref in pager.get(None)] == ["my_asset_manager:///x"]
+        assert not pager.hasNext(None)
+        pager.next(None)
+        assert not pager.get(None)
+        assert recording_catalog.reads == [(0, 2), (2, 2)]
+
+    def test_when_result_trait_set_supplied_then_pages_filled_with_matching_entities(
+        self, entries
+    ):
+        edges = [
+            ("my_asset_manager:///a", VERSIONS, f"my_asset_manager:///{ref}") for ref in "abxcab"
+        ]
+        pager = relationships.RelatedPager(
+            RelatedRecordingCatalog(entries, edges), "my_asset_manager:///a", VERSIONS, 2, {"t1"}
+        )
+
+        pages = [[ref.toString() for ref in pager.get(None)]]
+        while pager.hasNext(None):
+            pager.next(None)
+            pages.append([ref.toString() for ref in pager.get(None)])
+
+        assert pages == [
+            ["my_asset_manager:///a", "my_asset_manager:///b"],
+            ["my_asset_manager:///a", "my_asset_manager:///b"],
+        ]
+
+    def test_when_page_filled_mid_final_run_then_rest_of_run_returned(self):
+        trait_sets = {"r0": {"t"}, "r1": {"t"}, "r2": {"u"}, "r3": {"t"}, "r4": {"t"}}
+        entries = {
+            f"my_asset_manager:///{ref}": catalog.CatalogEntry(None, frozenset(traits))
+            for ref, traits in trait_sets.items()
+        }
+        edges = [("my_asset_manager:///a", VERSIONS, ref) for ref in entries]
+        pager = relationships.RelatedPager(
+            RelatedRecordingCatalog(entries, edges), "my_asset_manager:///a", VERSIONS, 3, {"t"}
+        )
+
+        pages = [[ref.toString() for ref in pager.get(None)]]
+        while pager.hasNext(None):
+            pager.next(None)
+            pages.append([ref.toString() for ref in pager.get(None)])
+
+        assert pages == [
+            ["my_asset_manager:///r0", "my_asset_manager:///r1", "my_asset_manager:///r3"],
+            ["my_asset_manager:///r4"],
+        ]
+
+    def test_when_closed_then_no_pages(self, entries):
+        pager = relationships.RelatedPager(
+            RelatedRecordingCatalog(entries, EDGES), "my_asset_manager:///a", VERSIONS, 1, set()
+        )
+
+        pager.close(None)
+
+        assert not pager.get(None)
+        assert not pager.hasNext(None)
+
+
+class Test_MyAssetManager_relationships:
+    def test_when_queried_then_related_entities_paged_from_catalog(
+        self, create_manager, sqlite_path
+    ):
+        relationships.write_sqlite_relationships(sqlite_path, EDGES)
+        for settings in ({}, {"catalog_in_memory": True}, {"lookup_workers": 2}):
+            manager = create_manager({"catalog_path": sqlite_path, **settings})
+            refs = [
+                manager.createEntityReference("my_asset_manager:///a"),
+                manager.createEntityReference("my_asset_manager:///missing"),
+                manager.createEntityReference("my_asset_manager:///a?unsupportedQueryParam"),
+            ]
+
+            results = get_with_relationship(manager, refs, TraitsData({VERSIONS}), {"t1"})
+
+            assert manager.hasCapability(Manager.Capability.kRelationshipQueries)
+            assert results[0] == [["my_asset_manager:///a"], ["my_asset_manager:///b"]]
+            assert results[1].code == BatchElementError.ErrorCode.kEntityResolutionError
+            assert results[2].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+    def test_when_queried_for_write_then_access_error_returned(self, create_manager):
+        manager = create_manager()
+        refs = [manager.createEntityReference("my_asset_manager:///anAsset")]
+
+        results = get_with_relationship(
+            manager, refs, TraitsData({VERSIONS}), set(), RelationsAccess.kWrite
+        )
+
+        assert results[0].code == BatchElementError.ErrorCode.kEntityAccessError
+
+
+EDGES = [
+    ("my_asset_manager:///a", VERSIONS, "my_asset_manager:///a"),
+    ("my_asset_manager:///a", VERSIONS, "my_asset_manager:///b"),
+    ("my_asset_manager:///a", VERSIONS, "my_asset_manager:///x"),
+    ("my_asset_manager:///a", DEPENDENCIES, "my_asset_manager:///c"),
+]
+
+
+class RelatedRecordingCatalog(catalog.MemoryCatalog):
+    """
+    A `MemoryCatalog` that records the position and count of each
+    read of related entities.
+    """
+
+    def __init__(self, entries, edges):
+        super().__init__(entries, edges)
+        self.reads = []
+
+    def related(self, reference, relationship, start, count):
+        self.reads.append((start, count))
+        return super().related(reference, relationship, start, count)
+
+
+def get_with_relationship(
+    manager, refs, relationship, result_trait_set, access=RelationsAccess.kRead
+):
+    """
+    Query the relationship of each reference with a page size of one,
+    returning the pages of related reference strings, or the error, for
+    each, by index.
+    """
+    results = [None] * len(refs)
+
+    def success(idx, pager):
+        pages = []
+        while page := pager.get():
+            pages.append([ref.toString() for ref in page])
+            pager.next()
+        results[idx] = pages
+
+    manager.getWithRelationship(
+        refs,
+        relationship,
+        1,
+        access,
+        manager.createContext(),
+        success,
+        results.__setitem__,
+        result_trait_set,
+    )
+    return results
+
+
+@pytest.fixture
+def related_catalogs(entries, sqlite_path):
+    relationships.write_sqlite_relationships(sqlite_path, EDGES)
+    server = catalog_server.CatalogServer(catalog.SqliteCatalog(sqlite_path)).start()
+    yield {
+        "memory": catalog.MemoryCatalog(entries, EDGES),
+        "compact": compact.CompactCatalog.from_sqlite(sqlite_path),
+        "sqlite": catalog.SqliteCatalog(sqlite_path),
+        "remote": remote.RemoteCatalog(server.url),
+    }
+    server.stop()
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the remote catalog client of MyAssetManager, against the
+bundled stand-in catalog server.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.access import ResolveAccess
+from openassetio.errors import ConfigurationException
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog, catalog_server, remote
+
+
+class Test_RemoteCatalog:
+    def test_when_references_looked_up_then_only_known_references_returned(self, server):
+        a_catalog = remote.RemoteCatalog(server.url)
+
+        assert a_catalog.locations(["my_asset_manager:///a", "my_asset_manager:///missing"]) == {
+            "my_asset_manager:///a": "file:///a"
+        }
+        assert a_catalog.traits(["my_asset_manager:///c", "my_asset_manager:///missing"]) == {
+            "my_asset_manager:///c": frozenset({"t2"})
+        }
+        assert sorted(a_catalog.references()) == sorted(ENTRIES)
+        assert len(a_catalog) == len(ENTRIES)
+
+    def test_when_fields_looked_up_then_fetched_in_one_request(self, server):
+        a_catalog = remote.RemoteCatalog(server.url)
+        references = ["my_asset_manager:///a", "my_asset_manager:///c", "my_asset_manager:///x"]
+
+        found = a_catalog.fields(references, ("location", "traits"))
+
+        assert found == {
+            "location": {"my_asset_manager:///a": "file:///a"},
+            "traits": {
+                "my_asset_manager:///a": frozenset({"t1", "t2"}),
+                "my_asset_manager:///c": frozenset({"t2"}),
+            },
+        }
+        assert server.requests == 1
+        with pytest.raises(KeyError):
+            a_catalog.fields(references, ("unknown",))
+
+    def test_when_batch_exceeds_max_request_bytes_then_split_into_bulk_requests(self, server):
+        # Each reference is 21 bytes, 24 once quoted and separated.
+        a_catalog = remote.RemoteCatalog(server.url, max_request_bytes=60)
+
+        locations = a_catalog.locations(sorted(ENTRIES) * 2)
+
+        assert locations == {
+            ref: entry.location for ref, entry in ENTRIES.items() if entry.location
+        }
+        assert server.requests == 3
+
+    def test_when_references_listed_then_fetched_a_page_at_a_time(self, server):
+        a_catalog = remote.RemoteCatalog(server.url, references_page_size=2)
+
+        references = a_catalog.references()
+        first = next(references)
+
+        assert server.requests == 1
+        assert sorted([first, *references]) == sorted(ENTRIES)
+        assert server.requests == 2
+
+    def test_when_many_requests_made_then_connection_reused(self, server):
+        a_catalog = remote.RemoteCatalog(server.url)
+
+        for _ in range(5):
+            a_catalog.locations(["my_asset_manager:///a"])
+
+        assert a_catalog.stats()["connections"] == {"opened": 1, "idle": 1}
+
+    def test_when_requests_fail_transiently_then_retried(self, server):
+        a_catalog = remote.RemoteCatalog(server.url, retries=2, retry_backoff=0.001)
+        server.fail_requests(2)
+
+        locations = a_catalog.locations(["my_asset_manager:///a"])
+
+        assert locations == {"my_asset_manager:///a": "file:///a"}
+        assert a_catalog.stats()["retries"] == 2
+
+    def test_when_retries_exhausted_then_ConnectionError_raised(self, server):
+        a_catalog = remote.RemoteCatalog(server.url, retries=1, retry_backoff=0.001)
+        server.fail_requests(2)
+
+        with pytest.raises(ConnectionError, match="after 2 attempts"):
+            a_catalog.locations(["my_asset_manager:///a"])
+
+    def test_when_request_fails_permanently_then_not_retried(self, server):
+        a_catalog = remote.RemoteCatalog(server.url, retries=3, retry_backoff=0.001)
+        server.fail_requests(1, status=404)
+
+        with pytest.raises(ConnectionError, match="404"):
+            a_catalog.locations(["my_asset_manager:///a"])
+        assert server.requests == 1
+
+    def test_when_server_unreachable_then_ConnectionError_raised(self, server):
+        url = server.url
+        server.stop()
+        a_catalog = remote.RemoteCatalog(url, retries=1, retry_backoff=0.001)
+
+        with pytest.raises(ConnectionError):
+            a_catalog.locations(["my_asset_manager:///a"])
+
+    def test_when_url_not_http_then_ValueError_raised(self):
+        with pytest.raises(ValueError):
+            remote.RemoteCatalog("file:///catalog.db")
+
+
+class Test_MyAssetManager_catalog_url:
+    def test_when_catalog_url_set_then_entities_resolved_from_service(
+        self, create_manager, server
+    ):
+        manager = create_manager({"catalog_url": server.url, "lookup_workers": 2})
+
+        location = manager.resolve(
+            manager.createEntityReference("my_asset_manager:///b"),
+            {LocatableContentTrait.kId},
+            ResolveAccess.kRead,
+            manager.createContext(),
+        ).getTraitProperty(LocatableContentTrait.kId, "location")
+
+        assert location == "file:///b"
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"catalog_url": "ftp://localhost/catalog"},
+            {"catalog_url": "http://localhost", "catalog_path": __file__},
+        ],
+    )
+    def test_when_catalog_url_invalid_then_ConfigurationException_raised(
+        self, create_manager, settings
+    ):
+        with pytest.raises(ConfigurationException):
+            create_manager(settings)
+
+
+ENTRIES = {
+    "my_asset_manager:///a": catalog.CatalogEntry("file:///a", frozenset({"t1", "t2"})),
+    "my_asset_manager:///b": catalog.CatalogEntry("file:///b", frozenset({"t1"})),
+    "my_asset_manager:///c": catalog.CatalogEntry(None, frozenset({"t2"})),
+}
+
+
+@pytest.fixture
+def server():
+    a_server = catalog_server.CatalogServer(catalog.MemoryCatalog(ENTRIES)).start()
+    yield a_server
+    a_server.stop()
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the settings of MyAssetManager, and their validation.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.errors import ConfigurationException
+
+from my_asset_manager import settings
+
+
+class Test_validated_settings:
+    def test_when_valid_then_settings_updated(self):
+        current = settings.default_settings()
+
+        updated = settings.validated_settings(
+            current, {"resolve_cache_size": 10, "resolve_cache_ttl": 5, "coalesce_lookups": True}
+        )
+
+        assert updated["resolve_cache_size"] == 10
+        assert updated["resolve_cache_ttl"] == 5.0
+        assert isinstance(updated["resolve_cache_ttl"], float)
+        assert updated["coalesce_lookups"] is True
+        assert current == settings.default_settings()
+
+    @pytest.mark.parametrize(
+        "manager_settings",
+        [
+            {"resolve_cache_size": "10"},
+            {"resolve_cache_size": 1.5},
+            {"resolve_cache_size": True},
+            {"coalesce_lookups": 1},
+            {"catalog_path": 3},
+            {"resolve_cache_size": -1},
+            {"lookup_workers": 0},
+            {"remote_timeout": 0},
+            {"missing_filter_false_positive_rate": 1},
+            {"missing_filter_false_positive_rate": 1.5},
+            {"resolve_cache_policy": "random"},
+        ],
+    )
+    def test_when_invalid_then_ConfigurationException_raised(self, manager_settings):
+        with pytest.raises(ConfigurationException, match=next(iter(manager_settings))):
+            settings.validated_settings(settings.default_settings(), manager_settings)
+
+    def test_when_unknown_then_KeyError_raised(self):
+        with pytest.raises(KeyError, match="unknown"):
+            settings.validated_settings(settings.default_settings(), {"unknown": 1})
+
+
+class Test_MyAssetManager_settings:
+    def test_when_initialized_then_settings_returns_all_settings(self, create_manager):
+        manager = create_manager({"resolve_cache_size": 100, "lookup_workers": 2})
+
+        assert manager.settings() == {
+            **settings.default_settings(),
+            "resolve_cache_size": 100,
+            "lookup_workers": 2,
+        }
+
+    def test_when_reinitialized_then_unsupplied_settings_kept(self, create_manager):
+        manager = create_manager({"resolve_cache_size": 100})
+
+        manager.initialize({"lookup_workers": 2})
+
+        assert manager.settings()["resolve_cache_size"] == 100
+        assert manager.settings()["lookup_workers"] == 2
+
+    def test_when_initialized_then_nothing_printed(self, create_manager, capfd):
+        create_manager({"resolve_cache_size": 100})
+
+        assert not capfd.readouterr().out
+
+    def test_when_loaded_from_config_file_then_settings_applied(
+        self, create_manager_from_config, tmp_path, sqlite_path
+    ):
+        config_path = tmp_path / "openassetio_config.toml"
+        config_path.write_text(
+            "[manager]\n"
+            'identifier = "myorg.manager.my_asset_manager"\n'
+            "[manager.settings]\n"
+            'catalog_path = "${config_dir}/catalog.db"\n'
+            "resolve_cache_size = 1000\n"
+            "resolve_cache_ttl = 30\n"
+            "lookup_workers = 4\n",
+            encoding="utf-8",
+        )
+
+        manager = create_manager_from_config(str(config_path))
+
+        assert manager.settings()["catalog_path"] == sqlite_path
+        assert manager.settings()["resolve_cache_ttl"] == 30.0
+        assert manager.settings()["lookup_workers"] == 4
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for sharding the catalog of MyAssetManager across several
+backends by consistent hash.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import itertools
+
+import pytest
+
+from openassetio.access import EntityTraitsAccess, ResolveAccess
+from openassetio.errors import BatchElementError, ConfigurationException
+from openassetio.hostApi import Manager
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog, catalog_server, sharding
+
+
+class Test_parse_shards:
+    def test_when_pairs_given_then_locations_returned_by_name(self):
+        assert sharding.parse_shards(" a=/a.db, b = http://b:80 ") == {
+            "a": "/a.db",
+            "b": "http://b:80",
+        }
+
+    @pytest.mark.parametrize("value", ["/a.db", "a=", "=/a.db", "a=/a.db,a=/b.db"])
+    def test_when_invalid_then_ConfigurationException_raised(self, value):
+        with pytest.raises(ConfigurationException):
+            sharding.parse_shards(value)
+
+
+class Test_HashRing:
+    def test_when_references_differ_only_by_query_then_same_shard(self):
+        ring = sharding.HashRing(["a", "b", "c"])
+
+        assert all(
+            ring.owner(f"my_asset_manager:///e{i}")
+            == ring.owner(f"my_asset_manager:///e{i}?v=1&latest")
+            for i in range(100)
+        )
+
+    def test_when_partitioned_then_references_spread_evenly(self):
+        partitions = sharding.HashRing(["a", "b", "c", "d"]).partition(REFERENCES)
+
+        assert set(partitions) == {"a", "b", "c", "d"}
+        assert all(len(refs) > len(REFERENCES) / 4 * 0.8 for refs in partitions.values())
+
+    def test_when_shard_added_then_only_its_entities_move(self):
+        before = sharding.HashRing(["a", "b", "c"])
+        after = sharding.HashRing(["a", "b", "c", "d"])
+
+        moved = [ref for ref in REFERENCES if before.owner(ref) != after.owner(ref)]
+
+        assert all(after.owner(ref) == "d" for ref in moved)
+        assert 0.15 < len(moved) / len(REFERENCES) < 0.35
+
+    def test_when_shard_removed_then_only_its_entities_move(self):
+        before = sharding.HashRing(["a", "b", "c", "d"])
+        after = sharding.HashRing(["a", "b", "c"])
+
+        assert all(
+            before.owner(ref) == after.owner(ref) for ref in REFERENCES if before.owner(ref) != "d"
+        )
+
+
+class Test_ShardedCatalog:
+    def test_when_looked_up_then_each_shard_queried_for_its_entities(self, entries):
+        shards = {name: RecordingCatalog(entries) for name in ("a", "b", "c")}
+        sharded = sharding.ShardedCatalog(shards)
+        ring = sharding.HashRing(shards)
+        # One missing reference owned by each shard, whatever the
+        # placement of the others, so that every shard is queried.
+        missing = (f"my_asset_manager:///missing{i}" for i in itertools.count())
+        refs = list(entries) + [
+            next(ref for ref in missing if ring.owner(ref) == name) for name in shards
+        ]
+
+        assert sharded.locations(refs) == {
+            ref: entry.location for ref, entry in entries.items() if entry.location
+        }
+        assert sharded.fields(refs, ["traits"]) == {
+            "traits": {ref: entry.traits for ref, entry in entries.items()}
+        }
+        for name, shard in shards.items():
+            assert all(ring.owner(ref) == name for lookup in shard.lookups for ref in lookup)
+        assert all(len(shard.lookups) == 1 for shard in shards.values())
+        assert sorted(
+            ref for shard in shards.values() for lookup in shard.lookups for ref in lookup
+        ) == sorted(refs)
+
+    def test_when_shards_added_and_removed_then_routing_updated(self, entries):
+        sharded = sharding.ShardedCatalog({"a": catalog.MemoryCatalog(entries)})
+
+        sharded.add_shard("b", catalog.MemoryCatalog({}))
+        found_after_add = sharded.traits(entries)
+        removed = sharded.remove_shard("b")
+
+        assert set(sharded.shards()) == {"a"}
+        assert len(found_after_add) < len(entries)
+        assert sharded.traits(entries).keys() == entries.keys()
+        assert isinstance(removed, catalog.MemoryCatalog)
+        with pytest.raises(ValueError):
+            sharded.add_shard("a", removed)
+        with pytest.raises(ValueError):
+            sharded.remove_shard("a")
+
+
+class Test_sqlite_shards:
+    def test_when_written_then_each_entity_in_its_shard(self, tmp_path):
+        shards = shard_paths(tmp_path, "abc")
+
+        sharding.write_sqlite_shards(shards, ENTRIES.items(), EDGES)
+
+        ring = sharding.HashRing(shards)
+        for name, path in shards.items():
+            shard = catalog.SqliteCatalog(path)
+            assert {ref for ref, _ in shard.entries()} == {
+                ref for ref in ENTRIES if ring.owner(ref) == name
+            }
+            assert all(ring.owner(ref) == name for ref, _, _ in shard.relationships())
+        sharded = sqlite_sharded_catalog(shards)
+        assert len(sharded) == len(ENTRIES)
+        assert sharded.related(EDGES[0][0], "v", 0, 10) == [EDGES[0][2], EDGES[1][2]]
+
+    def test_when_shard_added_then_entities_found_throughout_rebalance(self, tmp_path):
+        shards = shard_paths(tmp_path, "abc")
+        sharding.write_sqlite_shards(shards, ENTRIES.items(), EDGES)
+        new_shards = shard_paths(tmp_path, "abcd")
+
+        moved = sharding.rebalance_sqlite_shards(new_shards, prune=False)
+
+        assert 0 < moved < len(ENTRIES) / 2
+        for shard_set in (shards, new_shards):
+            sharded = sqlite_sharded_catalog(shard_set)
+            assert sharded.locations(ENTRIES).keys() == ENTRIES.keys()
+            assert sharded.related(EDGES[0][0], "v", 0, 10) == [EDGES[0][2], EDGES[1][2]]
+
+        assert sharding.rebalance_sqlite_shards(new_shards) == moved
+
+        sharded = sqlite_sharded_catalog(new_shards)
+        assert len(sharded) == len(ENTRIES)
+        assert sharded.locations(ENTRIES).keys() == ENTRIES.keys()
+        assert sharded.related(EDGES[0][0], "v", 0, 10) == [EDGES[0][2], EDGES[1][2]]
+
+    def test_when_shard_removed_then_its_entities_moved_to_others(self, tmp_path):
+        shards = shard_paths(tmp_path, "abc")
+        sharding.write_sqlite_shards(shards, ENTRIES.items(), EDGES)
+        remaining = shard_paths(tmp_path, "ab")
+
+        sharding.rebalance_sqlite_shards(remaining, {"c": shards["c"]})
+
+        sharded = sqlite_sharded_catalog(remaining)
+        assert len(sharded) == len(ENTRIES)
+        assert sharded.locations(ENTRIES).keys() == ENTRIES.keys()
+        assert sharded.related(EDGES[0][0], "v", 0, 10) == [EDGES[0][2], EDGES[1][2]]
+        assert len(catalog.SqliteCatalog(shards["c"])) == 0
+
+
+class Test_MyAssetManager_catalog_shards:
+    @pytest.mark.parametrize(
+        "settings",
+        [{}, {"catalog_in_memory": True}, {"lookup_workers": 2, "lookup_chunk_size": 7}],
+    )
+    def test_when_sharded_then_results_delivered_in_index_order(
+        self, create_manager, tmp_path, settings
+    ):
+        shards = shard_paths(tmp_path, "abc")
+        sharding.write_sqlite_shards(shards, ENTRIES.items())
+        server = catalog_server.CatalogServer(catalog.SqliteCatalog(shards.pop("c"))).start()
+        catalog_shards = ",".join(
+            [f"{name}={path}" for name, path in shards.items()] + [f"c={server.url}"]
+        )
+        manager = create_manager({"catalog_shards": catalog_shards, **settings})
+        ref_strings = list(reversed(ENTRIES)) + [
+            "my_asset_manager:///missing",
+            "my_asset_manager:///e1?unsupportedQueryParam",
+        ]
+        refs = [manager.createEntityReference(ref_string) for ref_string in ref_strings]
+        context = manager.createContext()
+        variant = Manager.BatchElementErrorPolicyTag.kVariant
+
+        try:
+            resolved = manager.resolve(
+                refs, {LocatableContentTrait.kId}, ResolveAccess.kRead, context, variant
+            )
+            trait_sets = manager.entityTraits(refs, EntityTraitsAccess.kRead, context, variant)
+        finally:
+            server.stop()
+
+        assert [
+            traits_data.getTraitProperty(LocatableContentTrait.kId, "location")
+            for traits_data in resolved[: len(ENTRIES)]
+        ] == [ENTRIES[ref].location for ref in ref_strings[:-2]]
+        assert trait_sets[: len(ENTRIES)] == [ENTRIES[ref].traits for ref in ref_strings[:-2]]
+        for results in (resolved, trait_sets):
+            assert results[-2].code == BatchElementError.ErrorCode.kEntityResolutionError
+            assert results[-1].code == BatchElementError.ErrorCode.kMalformedEntityReference
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"catalog_shards": "a"},
+            {"catalog_shards": "a=/missing.db"},
+            {"catalog_shards": f"a={__file__}", "catalog_path": __file__},
+        ],
+    )
+    def test_when_catalog_shards_invalid_then_ConfigurationException_raised(
+        self, create_manager, settings
+    ):
+        with pytest.raises(ConfigurationException):
+            create_manager(settings)
+
+
+REFERENCES = [f"my_asset_manager:///shots/sh{i // 100:03d}/frame{i % 100}" for i in range(20000)]
+
+ENTRIES = {
+    f"my_asset_manager:///e{i}": catalog.CatalogEntry(f"file:///e{i}.exr", frozenset({"t1"}))
+    for i in range(200)
+}
+
+EDGES = [
+    ("my_asset_manager:///e0", "v", "my_asset_manager:///e1"),
+    ("my_asset_manager:///e0", "v", "my_asset_manager:///e2"),
+    ("my_asset_manager:///e3", "v", "my_asset_manager:///e0"),
+]
+
+
+class RecordingCatalog(catalog.MemoryCatalog):
+    """
+    A `MemoryCatalog` that records the references of each lookup.
+    """
+
+    def __init__(self, entries):
+        super().__init__(entries)
+        self.lookups = []
+
+    def locations(self, references):
+        self.lookups.append(list(references))
+        return super().locations(references)
+
+
+def shard_paths(tmp_path, names):
+    """
+    Return a dict of shard name to the path of its SQLite catalog.
+    """
+    return {name: str(tmp_path / f"{name}.db") for name in names}
+
+
+def sqlite_sharded_catalog(shards):
+    """
+    Return a `ShardedCatalog` of the SQLite shards at the supplied
+    paths, by name.
+    """
+    return sharding.ShardedCatalog(
+        {name: catalog.SqliteCatalog(path) for name, path in shards.items()}
+    )
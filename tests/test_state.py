@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright 2023 The Foundry Visionmongers Ltd
+
+"""
+Tests for the manager state and snapshots of MyAssetManager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+
+import pytest
+
+from openassetio.access import ResolveAccess
+from openassetio.errors import InputValidationException
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+
+from my_asset_manager import catalog, state
+
+
+class Test_Recording:
+    def test_when_entries_requested_then_unseen_values_looked_up(self, live_catalog):
+        recording = state.Recording()
+        recording.locations["my_asset_manager:///a"] = "file:///seen"
+        recording.locations["my_asset_manager:///b"] = None
+        recording.traits["my_asset_manager:///c"] = frozenset({"seen"})
+        recording.traits["my_asset_manager:///missing"] = None
+
+        entries = recording.entries(live_catalog)
+
+        assert entries == {
+            "my_asset_manager:///a": catalog.CatalogEntry("file:///seen", frozenset({"t"})),
+            "my_asset_manager:///b": catalog.CatalogEntry("file:///b", frozenset({"t"})),
+            "my_asset_manager:///c": catalog.CatalogEntry("file:///c", frozenset({"seen"})),
+        }
+
+    def test_when_persisted_without_changes_then_same_snapshot_returned(
+        self, live_catalog, tmp_path
+    ):
+        recording = state.Recording()
+        assert recording.persist(str(tmp_path), live_catalog) is None
+
+        recording.locations["my_asset_manager:///a"] = "file:///a"
+        first_path = recording.persist(str(tmp_path), live_catalog)
+        second_path = recording.persist(str(tmp_path), live_catalog)
+        recording.locations["my_asset_manager:///b"] = "file:///b"
+        third_path = recording.persist(str(tmp_path), live_catalog)
+
+        assert first_path == second_path
+        assert third_path != first_path
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            os.path.basename(path) for path in (first_path, third_path)
+        )
+
+    def test_when_recorded_value_changed_then_new_snapshot_persisted(self, live_catalog, tmp_path):
+        recording = state.Recording()
+        recording.locations["my_asset_manager:///a"] = "file:///old"
+        first_path = recording.persist(str(tmp_path), live_catalog)
+
+        recording.locations.update({"my_asset_manager:///a": "file:///old"})
+        unchanged_path = recording.persist(str(tmp_path), live_catalog)
+        recording.locations.update({"my_asset_manager:///a": "file:///new"})
+        changed_path = recording.persist(str(tmp_path), live_catalog)
+
+        assert unchanged_path == first_path
+        assert changed_path != first_path
+        snapshot = catalog.SqliteCatalog(changed_path)
+        assert snapshot.locations(["my_asset_manager:///a"]) == {
+            "my_asset_manager:///a": "file:///new"
+        }
+        snapshot.close()
+
+
+class Test_persistence_token:
+    def test_when_recorded_state_restored_then_snapshot_holds_recorded_entries(
+        self, live_catalog, tmp_path
+    ):
+        recording = state.Recording()
+        recording.locations["my_asset_manager:///a"] = "file:///seen"
+        token = state.persistence_token(state.ManagerState(recording), str(tmp_path), live_catalog)
+
+        restored = state.state_from_persistence_token(token)
+
+        assert restored.recording is None
+        assert restored.snapshot.locations(["my_asset_manager:///a", "my_asset_manager:///b"]) == {
+            "my_asset_manager:///a": "file:///seen"
+        }
+        assert state.persistence_token(restored, "", live_catalog) == token
+
+    def test_when_state_not_recorded_then_restored_without_snapshot(self, live_catalog):
+        token = state.persistence_token(state.ManagerState(), "", live_catalog)
+
+        assert state.state_from_persistence_token(token).snapshot is None
+
+    @pytest.mark.parametrize("token", ["", "not json", "{}", '{"snapshot": "/missing"}'])
+    def test_when_token_invalid_then_InputValidationException_raised(self, token):
+        with pytest.raises(InputValidationException):
+            state.state_from_persistence_token(token)
+
+
+class Test_MyAssetManager_persistence:
+    def test_when_context_restored_then_entities_resolved_as_originally_seen(
+        self, create_manager, catalog_path, tmp_path
+    ):
+        settings = {"catalog_path": catalog_path, "snapshot_dir": str(tmp_path)}
+        artist_manager = create_manager(settings)
+        artist_context = artist_manager.createContext()
+        child_context = artist_manager.createChildContext(artist_context)
+        assert resolve_location(artist_manager, child_context) == "file:///a"
+        token = artist_manager.persistenceTokenForContext(artist_context)
+
+        write_entity(catalog_path, "my_asset_manager:///a", "file:///updated")
+        farm_manager = create_manager(settings)
+        farm_context = farm_manager.contextFromPersistenceToken(token)
+
+        assert resolve_location(farm_manager, farm_context) == "file:///a"
+        assert resolve_location(farm_manager, farm_manager.createContext()) == "file:///updated"
+
+    def test_when_snapshot_path_set_then_entities_served_from_snapshot(
+        self, create_manager, catalog_path, live_catalog, tmp_path
+    ):
+        recording = state.Recording()
+        recording.locations["my_asset_manager:///a"] = "file:///snapshot"
+        snapshot_path = recording.persist(str(tmp_path), live_catalog)
+
+        manager = create_manager({"catalog_path": catalog_path, "snapshot_path": snapshot_path})
+
+        context = manager.createContext()
+        assert resolve_location(manager, context) == "file:///snapshot"
+        assert resolve_location(manager, context, "my_asset_manager:///b") == "file:///b"
+
+
+def resolve_location(manager, context, ref_str="my_asset_manager:///a"):
+    return manager.resolve(
+        manager.createEntityReference(ref_str),
+        {LocatableContentTrait.kId},
+        ResolveAccess.kRead,
+        context,
+    ).getTraitProperty(LocatableContentTrait.kId, "location")
+
+
+def write_entity(path, ref_str, location):
+    catalog.write_sqlite_catalog(
+        path, [(ref_str, catalog.CatalogEntry(location, frozenset({"t"})))]
+    )
+
+
+@pytest.fixture
+def live_catalog():
+    return catalog.MemoryCatalog(
+        {
+            f"my_asset_manager:///{name}": catalog.CatalogEntry(
+                f"file:///{name}", frozenset({"t"})
+            )
+            for name in ("a", "b", "c")
+        }
+    )
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    for name in ("a", "b"):
+        write_entity(path, f"my_asset_manager:///{name}", f"file:///{name}")
+    return path